@@ -0,0 +1,45 @@
+"""
+Compare loading the maccabipedia games from the lossless json (MaccabiGamesStats.from_json_file) against pickle.
+Usage: python benchmarks/json_vs_pickle_loading.py [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import pickle
+import tempfile
+import timeit
+
+from maccabistats import load_from_maccabipedia_source
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logging.basicConfig(format='%(message)s', level=logging.INFO)
+
+
+def _load_pickle(file_path: str) -> MaccabiGamesStats:
+    with open(file_path, 'rb') as pickle_file:
+        return pickle.load(pickle_file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    maccabi_games_stats = load_from_maccabipedia_source()
+    logging.disable(logging.INFO)  # The loaders log every load
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        pickle_path = os.path.join(temp_folder, 'games.pickle')
+        with open(pickle_path, 'wb') as pickle_file:
+            pickle.dump(maccabi_games_stats, pickle_file)
+        json_path = maccabi_games_stats.serialize_to_json(os.path.join(temp_folder, 'games.json'))
+
+        for name, file_path, loader in [('pickle', pickle_path, _load_pickle),
+                                        ('json', json_path, MaccabiGamesStats.from_json_file)]:
+            best_time = min(timeit.repeat(lambda: loader(file_path), number=1, repeat=args.repeat))
+            print(f"{name:<8} {len(maccabi_games_stats)} games, {os.path.getsize(file_path) / 2 ** 20:.1f}MB, "
+                  f"best of {args.repeat}: {best_time:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput of the maccabi-tlv site html backends (lxml.html with compiled selectors vs BeautifulSoup),
+over a folder of saved pages (such as the disk cache of the site crawler).
+Each page is parsed and queried with the selectors the site parsers use for this kind of page.
+
+Usage:
+    python benchmarks/maccabi_site_html_benchmark.py --pages-folder c:/maccabi/games [--repeat 3]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from bs4 import BeautifulSoup
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabi_tlv_site.html_backend import HtmlTag, parse_html
+
+_SEASON_PAGE_SELECTORS = ["article", "main div.dropdown a", "div.league-title", "div.round", "div.location div",
+                          "div.location span", "span.ss.maccabi.h", "span.ss.h", "div.holder.notmaccabi.nn",
+                          "div.matchresult.Home", "a"]
+_SQUADS_PAGE_SELECTORS = ["article div.teams div.p50.yellow", "article div.teams div.p50", "div.info div.referee",
+                          "div.info div.viewers", "li", "div.goals", "div", "img", "b"]
+_EVENTS_PAGE_SELECTORS = ["article div.play-by-play-homepage ul.play-by-play li", "div.min", "p"]
+
+
+def _page_selectors(page_path: Path) -> List[str]:
+    # The crawler saves the pages as: season-{number}, game+{date}+events, game+{date}+squads
+    if page_path.name.endswith('+events'):
+        return _EVENTS_PAGE_SELECTORS
+    elif page_path.name.endswith('+squads'):
+        return _SQUADS_PAGE_SELECTORS
+    elif page_path.name.startswith('season-'):
+        return _SEASON_PAGE_SELECTORS
+    return _SEASON_PAGE_SELECTORS + _SQUADS_PAGE_SELECTORS + _EVENTS_PAGE_SELECTORS
+
+
+def _lxml_backend(page_content: bytes):
+    return parse_html(page_content)
+
+
+def _beautifulsoup_backend(page_content: bytes):
+    return BeautifulSoup(page_content, 'lxml')
+
+
+def _parse_and_query_pages(backend: Callable, pages: List[bytes], pages_selectors: List[List[str]]) -> float:
+    start_time = time.perf_counter()
+    for page_content, page_selectors in zip(pages, pages_selectors):
+        page = backend(page_content)
+        for css_selector in page_selectors:
+            [tag.get_text() for tag in page.select(css_selector)]
+
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages-folder', type=Path, required=True)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages_paths = sorted(path for path in args.pages_folder.iterdir() if path.is_file())
+    if not pages_paths:
+        print(f"No saved pages at {args.pages_folder}")
+        sys.exit(1)
+
+    pages = [page_path.read_bytes() for page_path in pages_paths]
+    pages_selectors = [_page_selectors(page_path) for page_path in pages_paths]
+    pages_megabytes = sum(len(page_content) for page_content in pages) / 2 ** 20
+
+    MaccabiStatsConfigSingleton.maccabi_site.use_lxml_html_backend = True
+    lxml_fallbacks_count = sum(not isinstance(parse_html(page_content), HtmlTag) for page_content in pages)
+    print(f"{len(pages)} pages ({pages_megabytes:.1f}MB), {lxml_fallbacks_count} of them fall back to BeautifulSoup")
+
+    backends_times = dict()
+    for backend_name, backend in [('lxml', _lxml_backend), ('beautifulsoup', _beautifulsoup_backend)]:
+        backends_times[backend_name] = min(_parse_and_query_pages(backend, pages, pages_selectors)
+                                           for _ in range(args.repeat))
+        print(f"{backend_name:<14} {backends_times[backend_name]:>8.3f}s  "
+              f"{len(pages) / backends_times[backend_name]:>8.1f} pages/s  "
+              f"{pages_megabytes / backends_times[backend_name]:>6.1f}MB/s")
+
+    print(f"lxml is x{backends_times['beautifulsoup'] / backends_times['lxml']:.1f} faster")
+
+
+if __name__ == '__main__':
+    main()
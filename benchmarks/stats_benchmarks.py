@@ -0,0 +1,217 @@
+"""
+Offline benchmarks of loading, filtering and the main stats, on a synthetic history (see maccabistats.synthetic_history).
+Each run is compared to the stored baseline of the same scale (benchmarks/baselines/scale_{scale}.json),
+cases that got slower than the baseline by more than --threshold are reported as regressions (exit code 1).
+
+Usage:
+    python benchmarks/stats_benchmarks.py [--scale 1] [--repeat 3] [--cases players streaks] [--save-baseline]
+"""
+import argparse
+import json
+import logging
+import os
+import pickle
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from maccabistats.date_parsing import parse_date
+from maccabistats.error_finder.error_finder import ErrorsFinder
+from maccabistats.maccabipedia.players import MaccabiPediaPlayers
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.synthetic_history import generate_synthetic_games, generate_synthetic_players_data
+
+logging.basicConfig(format='%(message)s', level=logging.INFO)
+
+_BASELINES_FOLDER = Path(__file__).parent / 'baselines'
+_SEED = 0
+
+
+def _temp_file_path(suffix: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f'maccabistats_benchmark{suffix}')
+
+
+def _pickle_roundtrip(maccabi_games_stats: MaccabiGamesStats) -> None:
+    with open(_temp_file_path('.pickle'), 'wb') as pickle_file:
+        pickle.dump(maccabi_games_stats, pickle_file)
+    with open(_temp_file_path('.pickle'), 'rb') as pickle_file:
+        pickle.load(pickle_file)
+
+
+def _json_roundtrip(maccabi_games_stats: MaccabiGamesStats) -> None:
+    MaccabiGamesStats.from_json_file(maccabi_games_stats.serialize_to_json(_temp_file_path('.json')))
+
+
+def _filters(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.home_games.league_games.maccabi_wins
+    maccabi_games_stats.played_after('01.01.1990').played_before('01.01.2010')
+    maccabi_games_stats.get_games_against_team(maccabi_games_stats.available_opponents[0])
+    maccabi_games_stats.get_games_by_player_name(maccabi_games_stats[-1].maccabi_team.players[0].name)
+
+
+def _date_parsing(maccabi_games_stats: MaccabiGamesStats) -> None:
+    # The dates of a full maccabipedia parse (date & hour per game), without the cached results of the last repeat
+    parse_date.cache_clear()
+    for game in maccabi_games_stats:
+        parse_date(f"{game.date:%Y-%m-%d} 20:00")
+
+
+def _players(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.players.best_scorers
+    maccabi_games_stats.players.best_assisters
+    maccabi_games_stats.players.most_played
+    maccabi_games_stats.players.most_winners
+
+
+def _streaks(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.streaks.get_longest_wins_streak_games()
+    maccabi_games_stats.streaks.get_longest_unbeaten_streak_games()
+
+
+def _players_streaks(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.players_streaks.get_players_with_best_win_streak()
+    maccabi_games_stats.players_streaks.get_players_with_best_goal_scoring_streak()
+
+
+def _players_and_teams_streaks(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.players_and_teams_streaks.get_players_with_best_win_streak()
+
+
+def _seasons(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.seasons.sort_by_wins_percentage()
+    maccabi_games_stats.seasons.sort_by_games_count()
+
+
+def _teams_coaches_referees(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.teams.teams_ordered_by_maccabi_wins_percentage(minimum_games_against_team=10)
+    maccabi_games_stats.teams.teams_ordered_by_goals_diff()
+    maccabi_games_stats.coaches.most_winner_coach_by_percentage(minimum_games=20)
+    maccabi_games_stats.coaches.most_goals_for_maccabi_per_game_coach()
+    maccabi_games_stats.referees.best_referee_by_percentage
+
+
+def _comebacks(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.comebacks.won_from_any_goal_diff()
+
+
+def _goals_timing(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.goals_timing.fastest_two_goals()
+    maccabi_games_stats.goals_timing.fastest_three_goals()
+    maccabi_games_stats.goals_timing.fastest_four_goals()
+
+
+def _important_goals(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.important_goals.get_top_scorers(0, 1)
+    maccabi_games_stats.important_goals.get_top_scorers_for_advantage()
+    maccabi_games_stats.important_goals.get_top_scorers_in_last_minutes(0, 1)
+    maccabi_games_stats.important_goals.get_top_scorers_by_percentage_from_all_their_goals(0, 1)
+    maccabi_games_stats.important_goals.get_top_players_for_goals_per_game(0, 1, minimum_games=20)
+
+
+def _players_categories(maccabi_games_stats: MaccabiGamesStats) -> None:
+    maccabi_games_stats.players_categories.home_players_goals_ratio()
+    maccabi_games_stats.players_categories.home_players_assists_ratio()
+    maccabi_games_stats.players_categories.home_players_goals_involved_ratio()
+    maccabi_games_stats.seasons.sort_by_home_players_goals_ratio()
+
+
+def _exports(maccabi_games_stats: MaccabiGamesStats) -> None:
+    with tempfile.TemporaryDirectory() as export_folder:
+        maccabi_games_stats.export.export_everything_json(Path(export_folder))
+
+
+def _errors_finder(maccabi_games_stats: MaccabiGamesStats) -> None:
+    ErrorsFinder(maccabi_games_stats).get_all_errors_numbers()
+
+
+BENCHMARK_CASES: Dict[str, Callable[[MaccabiGamesStats], None]] = {
+    'create_maccabi_games_stats': lambda maccabi_games_stats: MaccabiGamesStats(maccabi_games_stats.games),
+    'pickle_roundtrip': _pickle_roundtrip,
+    'json_roundtrip': _json_roundtrip,
+    'filters': _filters,
+    'date_parsing': _date_parsing,
+    'players': _players,
+    'streaks': _streaks,
+    'players_streaks': _players_streaks,
+    'players_and_teams_streaks': _players_and_teams_streaks,
+    'seasons': _seasons,
+    'teams_coaches_referees': _teams_coaches_referees,
+    'comebacks': _comebacks,
+    'goals_timing': _goals_timing,
+    'important_goals': _important_goals,
+    'players_categories': _players_categories,
+    'exports': _exports,
+    'errors_finder': _errors_finder,
+}
+
+
+def _run_case(case: Callable[[MaccabiGamesStats], None], games: list, repeat: int) -> float:
+    """
+    :return: The best time of the repeats, each repeat gets a new MaccabiGamesStats (nothing is cached from before).
+    """
+    times = []
+    for _ in range(repeat):
+        maccabi_games_stats = MaccabiGamesStats(games)
+        start_time = time.perf_counter()
+        case(maccabi_games_stats)
+        times.append(time.perf_counter() - start_time)
+
+    return min(times)
+
+
+def _baseline_path(scale: float) -> Path:
+    return _BASELINES_FOLDER / f'scale_{scale:g}.json'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=1, help='1 is about the real history size (also try 10, 100)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='*', choices=list(BENCHMARK_CASES), default=list(BENCHMARK_CASES))
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Report a regression when a case is slower than the baseline by this ratio')
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the baseline of this scale')
+    args = parser.parse_args()
+
+    generation_start_time = time.perf_counter()
+    games = generate_synthetic_games(args.scale, _SEED)
+    MaccabiPediaPlayers.set_players_data(generate_synthetic_players_data(args.scale, _SEED))
+    print(f"Generated {len(games)} synthetic games (scale={args.scale:g}) "
+          f"in {time.perf_counter() - generation_start_time:.1f}s")
+    logging.disable(logging.WARNING)  # The stats log a lot (exports, errors finder)
+
+    baseline_path = _baseline_path(args.scale)
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))['cases'] if baseline_path.exists() else {}
+
+    results: Dict[str, float] = dict()
+    regressions: List[str] = []
+    for case_name in args.cases:
+        results[case_name] = _run_case(BENCHMARK_CASES[case_name], games, args.repeat)
+
+        comparison = ''
+        if case_name in baseline:
+            ratio = results[case_name] / baseline[case_name]
+            comparison = f'{ratio:.2f}x baseline'
+            if ratio > args.threshold:
+                comparison += ' REGRESSION'
+                regressions.append(case_name)
+        print(f"{case_name:<28} {results[case_name]:>9.3f}s  {comparison}")
+
+    if args.save_baseline:
+        baseline.update({case_name: round(case_time, 4) for case_name, case_time in results.items()})
+        _BASELINES_FOLDER.mkdir(exist_ok=True)
+        baseline_path.write_text(json.dumps(dict(games_count=len(games), python=platform.python_version(),
+                                                 machine=platform.machine(), cases=baseline), indent=2),
+                                 encoding='utf-8')
+        print(f"Saved baseline to {baseline_path}")
+
+    if regressions and not args.save_baseline:
+        print(f"Regressions (slower than x{args.threshold} of the baseline): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -30,5 +30,6 @@ setup(
                       "lxml>=4.9.1, <5",
                       "python-dateutil>=2.7, <3",
                       "matplotlib>=3.6.0, <4",
+                      "numpy>=1.23, <3",
                       "progressbar2>=4.0.0, <5"]
 )
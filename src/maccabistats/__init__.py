@@ -1,12 +1,60 @@
-from .maccabilogging import initialize_logging
-
-# This should be first to enable logging across all package
-initialize_logging()
-
-from .stats.serialized_games import get_maccabi_stats, get_maccabi_stats_as_newest_wrapper, serialize_maccabi_games
-from .parse.parse_from_all_sites import merge_maccabi_games_from_all_input_serialized_sources, \
-    load_from_maccabipedia_source, load_from_maccabipedia_file_source, load_from_maccabisite_source, \
-    load_from_table_source, run_maccabipedia_source, run_maccabitlv_site_source, run_table_source
-from .parse.general_fixes import run_general_fixes
-from .maccabilogging import faster_logging
-from .error_finder import ErrorsFinder
+"""
+The package api is imported lazily (on the first access), so "import maccabistats" stays cheap.
+Logging is not initialized on import, call maccabistats.initialize_logging() to log into ~/maccabistats/logs.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+from .maccabilogging import initialize_logging, faster_logging
+
+# Attribute name -> the module that defines it
+_LAZY_ATTRIBUTES = {
+    'get_maccabi_stats': 'maccabistats.stats.serialized_games',
+    'get_maccabi_stats_as_newest_wrapper': 'maccabistats.stats.serialized_games',
+    'serialize_maccabi_games': 'maccabistats.stats.serialized_games',
+    'merge_maccabi_games_from_all_input_serialized_sources': 'maccabistats.parse.parse_from_all_sites',
+    'load_from_maccabipedia_source': 'maccabistats.parse.parse_from_all_sites',
+    'load_from_maccabipedia_file_source': 'maccabistats.parse.parse_from_all_sites',
+    'load_from_maccabisite_source': 'maccabistats.parse.parse_from_all_sites',
+    'load_from_table_source': 'maccabistats.parse.parse_from_all_sites',
+    'run_maccabipedia_source': 'maccabistats.parse.parse_from_all_sites',
+    'run_maccabitlv_site_source': 'maccabistats.parse.parse_from_all_sites',
+    'run_table_source': 'maccabistats.parse.parse_from_all_sites',
+    'run_general_fixes': 'maccabistats.parse.general_fixes',
+    'ErrorsFinder': 'maccabistats.error_finder',
+}
+
+# Heavy sub modules (parsing stack, matplotlib and so on), Submodule name -> full module name
+_LAZY_SUBMODULES = {
+    'graphs': 'maccabistats.stats.graphs',
+    'parse': 'maccabistats.parse',
+    'partial_sources': 'maccabistats.partial_sources',
+    'error_finder': 'maccabistats.error_finder',
+}
+
+__all__ = ['initialize_logging', 'faster_logging', *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from .stats.serialized_games import get_maccabi_stats, get_maccabi_stats_as_newest_wrapper, \
+        serialize_maccabi_games
+    from .parse.parse_from_all_sites import merge_maccabi_games_from_all_input_serialized_sources, \
+        load_from_maccabipedia_source, load_from_maccabipedia_file_source, load_from_maccabisite_source, \
+        load_from_table_source, run_maccabipedia_source, run_maccabitlv_site_source, run_table_source
+    from .parse.general_fixes import run_general_fixes
+    from .error_finder import ErrorsFinder
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(_LAZY_SUBMODULES[name])
+
+    if name in _LAZY_ATTRIBUTES:
+        attribute = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = attribute  # The next access wont get here
+        return attribute
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES])
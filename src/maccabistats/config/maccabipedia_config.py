@@ -1,4 +1,7 @@
+import os
 from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
 
 
 @dataclass
@@ -20,3 +23,14 @@ class MaccabiPediaConfig:
 
     games_data_query = _MaccabiPediaQueryGamesDataConfig()
     games_events_query = _MaccabiPediaQueryGamesEventsConfig()
+
+    # The players profiles (birth dates & home players) are cached on the disk, next to the maccabipedia games
+    players_data_cache_path = os.path.join(Path.home().as_posix(), 'maccabistats', 'sources', 'MaccabiPedia',
+                                           'players.json')
+    players_data_cache_max_age = timedelta(days=7)
+
+    # The games are built over a pool of processes (None uses all the CPUs, 1 parses in the main process)
+    parse_processes_count = None
+    parse_games_chunk_size = 250
+    # Build each game while its events are crawled (much less memory, but in a single process)
+    streaming_parse = False
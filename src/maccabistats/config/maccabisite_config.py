@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 
 
@@ -9,5 +10,13 @@ class MaccabiSiteConfig:
     folder_to_save_games_html_files = 'c:\maccabi\games'
     use_disk_as_cache_when_crawling = True
     use_lxml_parser = True
+    # Parse the pages with lxml.html directly (BeautifulSoup is used only for pages lxml can not parse)
+    use_lxml_html_backend = True
     use_multiprocess_crawling = True
     crawling_process_number = 15
+    # Fetch the pages with asyncio (one pooled session) and parse them over a pool of processes,
+    # used instead of use_multiprocess_crawling
+    use_async_crawling = True
+    max_concurrent_requests = 16
+    requests_retries = 3
+    parsing_process_number = os.cpu_count() or 1
@@ -0,0 +1,43 @@
+"""
+Parses the dates strings of all the sources (and the dates given to the games filters).
+
+The known formats are parsed directly, anything else is parsed by dateutil:
+* YYYY-MM-DD, YYYY_MM_DD (optionally followed by HH:MM or HH:MM:SS) - maccabipedia, the table source & birth dates
+* DD MMM YYYY with a hebrew month (such as: 12 ינו 1990 20:00, the hour is ignored) - maccabi-tlv site
+
+The results are cached, the same strings (birth dates, filters) are parsed over and over.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+
+from dateutil.parser import parse as datetime_parser
+
+_YEAR_FIRST_DATE_PATTERN = re.compile(r'(\d{4})[-_](\d{1,2})[-_](\d{1,2})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?')
+# The maccabi-tlv site adds the hour after the date, it was never parsed
+_HEBREW_DATE_PATTERN = re.compile(r'(\d{1,2}) (\S+) (\d{4})(?: .*)?')
+
+HEBREW_MONTHS = {"ינו": 1, "פבר": 2, "מרץ": 3, "אפר": 4, "מאי": 5, "יונ": 6,
+                 "יול": 7, "אוג": 8, "ספט": 9, "אוק": 10, "נוב": 11, "דצמ": 12}
+
+
+@lru_cache(maxsize=2 ** 16)
+def parse_date(date_string: str, dayfirst: bool = False) -> datetime.datetime:
+    """
+    :param date_string: The date to parse, such as: 2000-01-30, 2000-01-30 20:00, 30 ינו 2000, 30.01.2000
+    :param dayfirst: Passed to dateutil, whether to read an ambiguous date as DD-MM (such as 01.02.2000),
+                     when given, only the hebrew dates skip dateutil (it reads YYYY-MM-DD as YYYY-DD-MM as well)
+    """
+    stripped_date_string = date_string.strip()
+
+    year_first_match = None if dayfirst else _YEAR_FIRST_DATE_PATTERN.fullmatch(stripped_date_string)
+    if year_first_match is not None:
+        return datetime.datetime(*(int(date_part) for date_part in year_first_match.groups() if date_part is not None))
+
+    hebrew_match = _HEBREW_DATE_PATTERN.fullmatch(stripped_date_string)
+    if hebrew_match is not None and hebrew_match.group(2) in HEBREW_MONTHS:
+        return datetime.datetime(year=int(hebrew_match.group(3)), month=HEBREW_MONTHS[hebrew_match.group(2)],
+                                 day=int(hebrew_match.group(1)))
+
+    return datetime_parser(date_string, dayfirst=dayfirst)
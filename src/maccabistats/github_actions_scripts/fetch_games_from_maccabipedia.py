@@ -1,11 +1,12 @@
 import logging
 
-from maccabistats import run_maccabipedia_source
+from maccabistats import run_maccabipedia_source, initialize_logging
 
 logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.INFO)
 
 
 if __name__ == '__main__':
+    initialize_logging()
     logging.info('Starting to fetch Maccabi games from MaccabiPedia')
     _ = run_maccabipedia_source()
     logging.info('Finished to fetch Maccabi games from MaccabiPedia')
@@ -4,7 +4,7 @@ from logging import FileHandler
 from pathlib import Path
 
 from maccabistats import load_from_maccabipedia_source, ErrorsFinder
-from maccabistats.maccabilogging import remove_live_logging
+from maccabistats.maccabilogging import remove_live_logging, initialize_logging
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 ROOT_FOLDER = Path(__file__).absolute().parent.parent.parent.parent
@@ -118,4 +118,5 @@ def show_all_errors() -> None:
 
 
 if __name__ == '__main__':
+    initialize_logging()
     show_all_errors()
@@ -2,6 +2,7 @@ import ftplib
 import logging
 import os
 
+from maccabistats import initialize_logging
 from maccabistats.parse.maccabipedia.maccabipedia_source import MaccabiPediaSource
 
 logging.basicConfig(format='%(message)s', level=logging.INFO)
@@ -12,7 +13,10 @@ MACCABIPEDIA_FTP_FOLDERS_PREFIX = 'domains/maccabipedia.co.il/public_html/'
 
 def upload_maccabipedia_games_to_maccabipedia_ftp() -> None:
     logging.info('Loading MaccabiPedia games')
-    latest_maccabipedia_games_file = MaccabiPediaSource().find_last_created_source_maccabi_games_file()
+    maccabipedia_source = MaccabiPediaSource()
+    # The uploaded file should have the games of all the saved deltas
+    maccabipedia_source.compact_games_store()
+    latest_maccabipedia_games_file = maccabipedia_source.find_last_created_source_maccabi_games_file()
     logging.info(f'Last maccabipedia games file: {latest_maccabipedia_games_file}')
 
     ftp_address = os.environ['MACCABIPEDIA_FTP']
@@ -37,4 +41,5 @@ def upload_maccabipedia_games_to_maccabipedia_ftp() -> None:
 
 
 if __name__ == '__main__':
+    initialize_logging()
     upload_maccabipedia_games_to_maccabipedia_ftp()
@@ -1,8 +1,12 @@
 import logging
 import os
+import atexit
+import multiprocessing
+import time
 from logging import Filter
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, List, Optional
 
 maccabistats_root_folder_path = Path.home().as_posix()
 log_file_path_pattern = os.path.join(maccabistats_root_folder_path, "maccabistats", "logs", "maccabistats-{suffix}.log")
@@ -10,11 +14,19 @@ log_file_folder_path = os.path.dirname(log_file_path_pattern)
 
 MB = 1024 * 1024
 
-if not os.path.isdir(log_file_folder_path):
-    os.makedirs(log_file_folder_path)
-
 logger = logging.getLogger("maccabistats")
 
+DEBUG_HANDLER_NAME = 'debug'
+INFO_HANDLER_NAME = 'info'
+WARNING_HANDLER_NAME = 'warning'
+STDOUT_HANDLER_NAME = 'stdout'
+EXCEPTION_HANDLER_NAME = 'exception'
+
+# Set when logging runs in queue mode, the listener owns the real handlers and writes from its own thread
+_queue_listener = None
+# The rate limiting filter of the live handlers, its last suppressed counts are flushed by stop_logging_listener
+_hot_loops_filter = None
+
 
 class SpecificLevelFilter(Filter):
     def __init__(self, level):
@@ -26,21 +38,179 @@ class SpecificLevelFilter(Filter):
         return log_record.levelno == self.__level
 
 
+class RateLimitedFilter(Filter):
+    """
+    Let only max_records_per_interval records from the same log call (file & line) pass in each interval,
+    Per item messages from hot loops wont flood the handler, the next passed record tells how many were suppressed
+    (or the record from pop_suppressed_records, for the last burst of each call site).
+    The same filter may be attached to several handlers, each record is counted once.
+    """
+
+    def __init__(self, max_records_per_interval: int = 20, interval_seconds: float = 1.0):
+        super().__init__()
+
+        self.max_records_per_interval = max_records_per_interval
+        self.interval_seconds = interval_seconds
+        # (pathname, lineno) -> [interval start, passed records, suppressed records, last suppressed record]
+        self._calls_sites = dict()
+        self._last_record = None
+        self._last_decision = True
+
+    def filter(self, log_record):
+        if log_record.levelno >= logging.WARNING or getattr(log_record, 'suppressed_summary', False):
+            return True
+        if log_record is self._last_record:
+            return self._last_decision
+
+        self._last_record = log_record
+        self._last_decision = self._should_pass(log_record)
+        return self._last_decision
+
+    def _should_pass(self, log_record) -> bool:
+        now = time.monotonic()
+        call_site = self._calls_sites.setdefault((log_record.pathname, log_record.lineno), [now, 0, 0, None])
+
+        if now - call_site[0] >= self.interval_seconds:
+            suppressed = call_site[2]
+            call_site[:] = [now, 0, 0, None]
+            if suppressed:
+                log_record.msg = f"{log_record.getMessage()} (suppressed {suppressed} similar messages)"
+                log_record.args = None
+
+        if call_site[1] < self.max_records_per_interval:
+            call_site[1] += 1
+            return True
+
+        call_site[2] += 1
+        call_site[3] = log_record
+        return False
+
+    def pop_suppressed_records(self) -> List[logging.LogRecord]:
+        """
+        Records that tell how many messages were suppressed from each call site since its last passed record,
+        These counts are reported only by the next record of the same call site, which may never come.
+        """
+        suppressed_records = []
+        for call_site in self._calls_sites.values():
+            if call_site[2]:
+                last_suppressed_record = call_site[3]
+                suppressed_records.append(logging.makeLogRecord(dict(
+                    last_suppressed_record.__dict__,
+                    msg=f"{last_suppressed_record.getMessage()} (suppressed {call_site[2]} similar messages)",
+                    args=None,
+                    suppressed_summary=True)))
+                call_site[2] = 0
+                call_site[3] = None
+
+        return suppressed_records
+
+
+def _remove_handlers(handlers_names) -> None:
+    """
+    Remove the handlers by their names, works both when the handlers are attached to the logger and to the queue
+    listener.
+    """
+    if _queue_listener is not None:
+        _queue_listener.handlers = tuple(handler for handler in _queue_listener.handlers
+                                         if handler.get_name() not in handlers_names)
+    else:
+        for handler in [handler for handler in logger.handlers if handler.get_name() in handlers_names]:
+            logger.removeHandler(handler)
+
+
 def faster_logging():
-    # Patch
     logger.info("Use faster logging, removing debug & stdout handlers")
-    logger.removeHandler(logger.handlers[3])  # Without stdout
-    logger.removeHandler(logger.handlers[0])  # Without Debug
+    _remove_handlers({STDOUT_HANDLER_NAME, DEBUG_HANDLER_NAME})
+    logger.setLevel(logging.INFO)  # No handler wants debug records anymore, do not even create them
 
 
 def remove_live_logging():
-    # Patch
     logger.info("Removing stdout handlers")
-    logger.removeHandler(logger.handlers[3])  # Without stdout
+    _remove_handlers({STDOUT_HANDLER_NAME})
+
 
+def _flush_suppressed_records(handlers) -> None:
+    if _hot_loops_filter is None:
+        return
+
+    for suppressed_record in _hot_loops_filter.pop_suppressed_records():
+        for handler in handlers:
+            if _hot_loops_filter in handler.filters and suppressed_record.levelno >= handler.level:
+                handler.handle(suppressed_record)
+
+
+def stop_logging_listener() -> None:
+    """
+    Flush all the queued records to the real handlers and stop the queue listener (if logging runs in queue mode),
+    The suppressed counts of the hot loops that were not reported yet are logged too.
+    """
+    global _queue_listener
+
+    if _queue_listener is None:
+        _flush_suppressed_records(logger.handlers)
+        return
+
+    _queue_listener.stop()
+    _flush_suppressed_records(_queue_listener.handlers)
+    for handler in _queue_listener.handlers:
+        logger.addHandler(handler)
+    for handler in [handler for handler in logger.handlers if isinstance(handler, QueueHandler)]:
+        logger.removeHandler(handler)
+
+    _queue_listener = None
+
+
+def worker_logging_initializer() -> Dict:
+    """
+    The initializer arguments for process pools, so the workers log like this process under any start method:
+        ProcessPoolExecutor(max_workers, **worker_logging_initializer())
+    """
+    logging_queue = None if _queue_listener is None else _queue_listener.queue
+    return dict(initializer=initialize_worker_logging,
+                initargs=(logging_queue, logger.level, bool(logger.handlers)))
+
+
+def initialize_worker_logging(logging_queue: Optional[multiprocessing.Queue], level: int,
+                              logging_initialized: bool) -> None:
+    """
+    Process pool initializer (see worker_logging_initializer), in queue mode the worker records are sent to the queue
+    listener of the main process, otherwise the worker writes to the log files itself (the inherited handlers on fork).
+    """
+    global _queue_listener
+
+    if not logging_initialized:
+        return
+
+    if logging_queue is not None:
+        # The listener runs only in the main process, a forked worker should not flush or stop its copy
+        _queue_listener = None
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(logging_queue))
+    elif not logger.handlers:
+        initialize_logging()
+
+    logger.setLevel(level)
+
+
+def initialize_logging(use_queue: bool = False):
+    """
+    Log maccabistats to ~/maccabistats/logs & stdout, this is not done on import, the application should call it.
+    Debug & info messages that repeat from the same line (hot loops) are rate limited on the info & stdout handlers,
+    the debug log keeps all of them.
+
+    :param use_queue: Format & write the records on a listener thread, the logging thread only puts them in a queue.
+                      The queue is a multiprocessing queue, process pools send their workers records to it as well
+                      (see worker_logging_initializer).
+    """
+    global _queue_listener, _hot_loops_filter
 
-def initialize_logging():
     # Root logger, so all other logger will inherit those handlers.
+    if logger.handlers:
+        return  # Already initialized
+
+    if not os.path.isdir(log_file_folder_path):
+        os.makedirs(log_file_folder_path)
 
     logger.setLevel(logging.DEBUG)
 
@@ -76,10 +246,27 @@ def initialize_logging():
     stdout_handler.setFormatter(normal_formatter)
     stdout_handler.setLevel(logging.INFO)
 
-    logger.addHandler(debug_handler)
-    logger.addHandler(info_handler)
-    logger.addHandler(warning_handler)
-    logger.addHandler(stdout_handler)
-    logger.addHandler(exception_handler)
+    debug_handler.set_name(DEBUG_HANDLER_NAME)
+    info_handler.set_name(INFO_HANDLER_NAME)
+    warning_handler.set_name(WARNING_HANDLER_NAME)
+    stdout_handler.set_name(STDOUT_HANDLER_NAME)
+    exception_handler.set_name(EXCEPTION_HANDLER_NAME)
+    handlers = [debug_handler, info_handler, warning_handler, stdout_handler, exception_handler]
+
+    # On the handlers and not on the logger, the logger filters skip the records of the child loggers (maccabistats.*)
+    _hot_loops_filter = RateLimitedFilter()
+    info_handler.addFilter(_hot_loops_filter)
+    stdout_handler.addFilter(_hot_loops_filter)
+
+    if use_queue:
+        # A spawn context queue can be shared with the workers of every start method (a fork one only with forked ones)
+        logging_queue = multiprocessing.get_context('spawn').Queue()
+        _queue_listener = QueueListener(logging_queue, *handlers, respect_handler_level=True)
+        logger.addHandler(QueueHandler(_queue_listener.queue))
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    atexit.register(stop_logging_listener)
 
     logger.debug("Initialize logger")
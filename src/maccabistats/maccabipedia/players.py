@@ -1,11 +1,18 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-from dateutil.parser import parse as datetime_parser
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.date_parsing import parse_date
 
-from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import MaccabiPediaCargoChunksCrawler
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -16,17 +23,20 @@ class MaccabiPediaPlayerData(object):
 
 
 class MaccabiPediaPlayers(object):
-    missing_birth_date_value = datetime_parser("1000")
+    missing_birth_date_value = parse_date("1000")
     _instance = None
 
     @classmethod
     def default_birth_day_value(cls, *args, **kwargs):
         return cls.missing_birth_date_value
 
-    def __init__(self):
+    def __init__(self, players_data: Optional[Dict[str, MaccabiPediaPlayerData]] = None):
+        """
+        :param players_data: When not given, the players data is loaded from the disk cache (or crawled from maccabipedia)
+        """
+        self._players_data = self._load_players_data() if players_data is None else players_data
         # Using defaultdict in order for each player that does not have a date of birth in maccabipedia
         # will set to year 1000 (to notice visually in stats)
-        self._players_data = self._crawl_players_data()
         self.players_dates = defaultdict(MaccabiPediaPlayers.default_birth_day_value,
                                          {player_name: player_data.birth_date for player_name, player_data in
                                           self._players_data.items()})
@@ -35,6 +45,9 @@ class MaccabiPediaPlayers(object):
 
     @staticmethod
     def _crawl_players_data() -> Dict[str, MaccabiPediaPlayerData]:
+        # The crawler (requests) is imported only when we need to crawl, so loading games stays cheap
+        from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import MaccabiPediaCargoChunksCrawler
+
         players_data_iterator = MaccabiPediaCargoChunksCrawler(
             tables_name="Profiles",
             tables_fields="Profiles._pageName, Profiles.DoB, Profiles.HomePlayer")
@@ -43,7 +56,7 @@ class MaccabiPediaPlayers(object):
         for player_raw_data in players_data_iterator:
             # Player Date of birth is missing for some players, we just take the default value for those
             # Birth date format is YYYY_MM_DD:
-            birth_date = datetime_parser(
+            birth_date = parse_date(
                 player_raw_data['DoB']) if 'DoB' in player_raw_data else MaccabiPediaPlayers.missing_birth_date_value
             player_name = player_raw_data['_pageName']
             # We have players and coaches in the same table today, for coaches we don't set HomePlayer:
@@ -55,8 +68,97 @@ class MaccabiPediaPlayers(object):
         return players_data
 
     @classmethod
-    def get_players_data(cls):
+    def _load_players_data(cls) -> Dict[str, MaccabiPediaPlayerData]:
+        """
+        Use the disk cache when it is fresh enough, otherwise crawl maccabipedia (and update the cache).
+        When maccabipedia is not available we prefer an old cache over failing.
+        """
+        cache_path = Path(MaccabiStatsConfigSingleton.maccabipedia.players_data_cache_path)
+        cached_players_data = None
+        if cache_path.is_file():
+            try:
+                crawled_at, cached_players_data = cls._read_players_data_cache(cache_path)
+            except (OSError, ValueError, KeyError, TypeError):
+                # A broken cache is crawled again (and overwritten), instead of failing on every load
+                logger.warning(f"Could not read maccabipedia players data cache: {cache_path}, crawling again",
+                               exc_info=True)
+                crawled_at = None
+
+            if crawled_at is not None and \
+                    datetime.now() - crawled_at <= MaccabiStatsConfigSingleton.maccabipedia.players_data_cache_max_age:
+                logger.info(f"Loaded maccabipedia players data from cache: {cache_path} (crawled at {crawled_at})")
+                return cached_players_data
+
+        import requests
+
+        try:
+            players_data = cls._crawl_players_data()
+        except (requests.RequestException, ValueError):
+            if cached_players_data is None:
+                raise
+
+            logger.warning(f"Could not crawl maccabipedia players data, using the old cache from: {cache_path}",
+                           exc_info=True)
+            return cached_players_data
+
+        cls._write_players_data_cache(cache_path, players_data)
+        return players_data
+
+    @classmethod
+    def _read_players_data_cache(cls, cache_path: Path) -> Tuple[datetime, Dict[str, MaccabiPediaPlayerData]]:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            cache = json.load(cache_file)
+
+        players_data = {player['name']: MaccabiPediaPlayerData(
+            name=player['name'],
+            birth_date=cls.missing_birth_date_value if player['birth_date'] is None else datetime.fromisoformat(
+                player['birth_date']),
+            is_home_player=player['is_home_player'])
+            for player in cache['players']}
+
+        return datetime.fromisoformat(cache['crawled_at']), players_data
+
+    @classmethod
+    def _write_players_data_cache(cls, cache_path: Path, players_data: Dict[str, MaccabiPediaPlayerData]) -> None:
+        cache = dict(crawled_at=datetime.now().isoformat(),
+                     players=[dict(name=player.name,
+                                   birth_date=None if player.birth_date == cls.missing_birth_date_value else
+                                   player.birth_date.isoformat(),
+                                   is_home_player=player.is_home_player)
+                              for player in players_data.values()])
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Replace the cache atomically, so an interrupted write never leaves a truncated cache
+        temp_cache_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        with open(temp_cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(cache, cache_file, ensure_ascii=False)
+
+        os.replace(temp_cache_path, cache_path)
+
+        logger.info(f"Saved maccabipedia players data to cache: {cache_path}")
+
+    @classmethod
+    def get_players_data(cls) -> MaccabiPediaPlayers:
         if cls._instance is None:
             cls._instance = cls()
 
         return cls._instance
+
+    @classmethod
+    def refresh_players_data(cls) -> MaccabiPediaPlayers:
+        """
+        Crawl the players data from maccabipedia even if the disk cache is fresh, and update the cache.
+        """
+        players_data = cls._crawl_players_data()
+        cls._write_players_data_cache(Path(MaccabiStatsConfigSingleton.maccabipedia.players_data_cache_path),
+                                      players_data)
+
+        cls._instance = cls(players_data)
+        return cls._instance
+
+    @classmethod
+    def set_players_data(cls, players_data: Dict[str, MaccabiPediaPlayerData]) -> None:
+        """
+        Use the given players data instead of maccabipedia (for tests or when working offline).
+        """
+        cls._instance = cls(players_data)
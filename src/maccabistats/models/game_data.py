@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 import datetime
+import hashlib
 import json
+from enum import Enum
 from typing import List, Optional, Union, Dict
 
-from dateutil.parser import parse as datetime_parser
-from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.date_parsing import parse_date
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes, GameEvent
 from maccabistats.models.team_in_game import TeamInGame
 
 
@@ -39,31 +43,24 @@ class GameData(object):
         self._half_parsed_events = half_parsed_events
         self.technical_result = technical_result
 
+        # Calculated on the first use and saved with the game, every change of the game should call refresh_fingerprint
+        self._game_id: Optional[str] = None
+        self._fingerprint: Optional[str] = None
+
     def played_before(self, date: Union[datetime.datetime, datetime.date, str]) -> bool:
         if isinstance(date, str):
-            date = datetime_parser(date)
+            date = parse_date(date)
 
         return date >= self.date
 
     def played_after(self, date: Union[datetime.datetime, datetime.date, str]) -> bool:
         if isinstance(date, str):
-            date = datetime_parser(date)
+            date = parse_date(date)
 
         return date <= self.date
 
     def __get_date_as_datetime(self) -> datetime.datetime:
-        date_args = self.date_as_hebrew_string.strip().split(" ")
-
-        return datetime.datetime(year=int(date_args[2]),
-                                 month=GameData.__get_month_num_from_hebrew(date_args[1]),
-                                 day=int(date_args[0]))
-
-    @staticmethod
-    def __get_month_num_from_hebrew(month_name: str) -> int:
-        months_in_hebrew_to_num = {"ינו": 1, "פבר": 2, "מרץ": 3, "אפר": 4, "מאי": 5, "יונ": 6,
-                                   "יול": 7, "אוג": 8, "ספט": 9, "אוק": 10, "נוב": 11, "דצמ": 12}
-
-        return months_in_hebrew_to_num[month_name]
+        return parse_date(self.date_as_hebrew_string)
 
     @property
     def league_fixture(self) -> Optional[int]:
@@ -152,34 +149,113 @@ class GameData(object):
 
     def maccabi_goals(self) -> List[Dict]:
         """
-        Wrapper for self.goals, returns just maccabi goals (including own goals scored by the opponent)
+        Wrapper for self.goals, returns just maccabi goals (including own goals scored by the opponent,
+        without own goals scored by maccabi players)
         """
         return [goal for goal in self.goals() if
-                (goal['team'] != 'מכבי תל אביב' and goal['goal_type'] == 'Own goal') or
-                goal['team'] == 'מכבי תל אביב']
+                (goal['team'] == 'מכבי תל אביב') != (goal['goal_type'] == GoalTypes.OWN_GOAL.value)]
 
     def json_dict(self) -> Dict:
         return dict(stadium=self.stadium,
                     date=self.date.isoformat(),
+                    full_date=self._full_date.isoformat(),
+                    date_as_hebrew_string=self.date_as_hebrew_string,
                     crowd=self.crowd,
                     referee=self.referee,
                     competition=self.competition,
                     fixture=self.fixture,
+                    season=self.season,
+                    technical_result=self.technical_result,
                     home_team=self.home_team.json_dict(),
-                    away_team=self.away_team.json_dict())
+                    away_team=self.away_team.json_dict(),
+                    half_parsed_events=[GameData._half_parsed_event_json_dict(event)
+                                        for event in self._half_parsed_events])
+
+    @classmethod
+    def from_json_dict(cls, json_dict: Dict) -> GameData:
+        """
+        Create GameData from GameData.json_dict output, the dates are iso formatted so we avoid dateutil here.
+        """
+        return cls(competition=json_dict['competition'],
+                   fixture=json_dict['fixture'],
+                   date_as_hebrew_string=json_dict['date_as_hebrew_string'],
+                   stadium=json_dict['stadium'],
+                   crowd=json_dict['crowd'],
+                   referee=json_dict['referee'],
+                   home_team=TeamInGame.from_json_dict(json_dict['home_team']),
+                   away_team=TeamInGame.from_json_dict(json_dict['away_team']),
+                   season_string=json_dict['season'],
+                   half_parsed_events=[GameData._half_parsed_event_from_json_dict(event)
+                                       for event in json_dict['half_parsed_events']],
+                   date=datetime.datetime.fromisoformat(json_dict['full_date']),
+                   technical_result=json_dict['technical_result'])
+
+    @staticmethod
+    def _half_parsed_event_json_dict(half_parsed_event: Dict) -> Dict:
+        # Half parsed events are the attributes of a GameEvent with the player name (see maccabi site events parser)
+        return {key: value.value if isinstance(value, Enum) else
+                     str(value) if isinstance(value, datetime.timedelta) else value
+                for key, value in half_parsed_event.items()}
+
+    @staticmethod
+    def _half_parsed_event_from_json_dict(json_dict: Dict) -> Dict:
+        event_json_dict = dict(json_dict)
+        name = event_json_dict.pop('name')
+
+        return dict(name=name, **GameEvent.from_json_dict(event_json_dict).__dict__)
 
     def to_json(self) -> str:
         return json.dumps(self.json_dict())
 
+    @property
+    def game_id(self) -> str:
+        """
+        Stable identifier of this game, built like the game page name in maccabipedia (without the "משחק:" prefix).
+        """
+        # Older pickled games does not have this attribute
+        if getattr(self, '_game_id', None) is None:
+            self._game_id = f"{self.date.strftime('%d-%m-%Y')} {self.home_team.name} נגד {self.away_team.name} - " \
+                            f"{self.competition}"
+
+        return self._game_id
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the game content (metadata, teams, players and events), the players & events order does not matter.
+        Use it to find which games were changed between two MaccabiGamesStats or as a key for per game caches.
+        It is calculated once and saved with the game (pickles, deep copies), whoever changes the game in place should
+        call refresh_fingerprint (the general & specific fixes and the sources merge do).
+        """
+        if getattr(self, '_fingerprint', None) is None:
+            canonical_json = json.dumps(self._canonical_json_dict(), sort_keys=True, ensure_ascii=False)
+            self._fingerprint = hashlib.sha1(canonical_json.encode('utf-8')).hexdigest()
+
+        return self._fingerprint
+
+    def refresh_fingerprint(self) -> None:
+        """
+        The game id & fingerprint are calculated once, call this after changing the game (such as in fixes).
+        """
+        self._game_id = None
+        self._fingerprint = None
+
+    def _canonical_json_dict(self) -> Dict:
+        game_json_dict = self.json_dict()
+        for team_json_dict in [game_json_dict['home_team'], game_json_dict['away_team']]:
+            team_json_dict['players'] = sorted(
+                json.dumps(dict(player, events=sorted(json.dumps(event, sort_keys=True) for event in player['events'])),
+                           sort_keys=True, ensure_ascii=False)
+                for player in team_json_dict['players'])
+
+        return game_json_dict
+
     @property
     def _maccabipedia_page_name(self):
-        return "{maccabipedia}/{prefix}:{date} {home_team} נגד {away_team} - {competition}".format(
+        return "{maccabipedia}/{prefix}:{game_id}".format(
             maccabipedia="https://www.maccabipedia.co.il",
             prefix="משחק",
-            date=self.date.strftime('%d-%m-%Y'),
-            home_team=self.home_team.name,
-            away_team=self.away_team.name,
-            competition=self.competition)
+            game_id=self.game_id)
 
     def __repr__(self) -> str:
         return f"{self.date.date()} {self.competition}: {self.home_team.name}({self.home_team.score}) - ({self.away_team.score}){self.away_team.name}"
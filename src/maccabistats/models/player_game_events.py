@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Dict
 
 
@@ -105,6 +106,20 @@ class GameEvent(object):
         return dict(event_type=self.event_type.value,
                     time_occur=str(self.time_occur))
 
+    @staticmethod
+    def from_json_dict(json_dict: Dict) -> GameEvent:
+        """
+        Create the matching game event (goal, assist or a general event) from GameEvent.json_dict output.
+        """
+        time_occur = _parse_time_occur(json_dict['time_occur'])
+
+        if 'goal_type' in json_dict:
+            return GoalGameEvent(time_occur, GoalTypes(json_dict['goal_type']))
+        elif 'assist_type' in json_dict:
+            return AssistGameEvent(time_occur, AssistTypes(json_dict['assist_type']))
+        else:
+            return GameEvent(GameEventTypes(json_dict['event_type']), time_occur)
+
 
 class GoalGameEvent(GameEvent):
     def __init__(self, time_occur: timedelta, goal_type: GoalTypes = GoalTypes.UNKNOWN):
@@ -136,3 +151,18 @@ class AssistGameEvent(GameEvent):
 
         base_class_json_dict['assist_type'] = self.assist_type.value
         return base_class_json_dict
+
+
+@lru_cache(maxsize=None)
+def _parse_time_occur(time_occur: str) -> timedelta:
+    """
+    Parse str(timedelta) back to timedelta, such as: "0:45:00" or "1 day, 0:01:00".
+    There are only few distinct values (minutes of the game), so the parsed values are cached (timedelta is immutable).
+    """
+    days = 0
+    if 'day' in time_occur:
+        days_description, time_occur = time_occur.split(', ')
+        days = int(days_description.split(' ')[0])
+
+    hours, minutes, seconds = time_occur.split(':')
+    return timedelta(days=days, hours=int(hours), minutes=int(minutes), seconds=float(seconds))
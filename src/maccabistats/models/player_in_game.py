@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from pprint import pformat
-from typing import List, Optional, cast
+from typing import List, Optional, Dict, cast
 
 from maccabistats.models.player import Player
 from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalTypes, GoalGameEvent, AssistTypes
@@ -36,6 +36,16 @@ class PlayerInGame(Player):
         return [cast(AssistTypes, event).assist_type for event in
                 self.get_events_by_type(GameEventTypes.GOAL_ASSIST)].count(assist_type)
 
+    def json_dict(self) -> Dict:
+        return dict(name=self.name,
+                    number=self.number,
+                    events=[event.json_dict() for event in self.events])
+
+    @classmethod
+    def from_json_dict(cls, json_dict: Dict) -> PlayerInGame:
+        return cls(json_dict['name'], json_dict['number'],
+                   [GameEvent.from_json_dict(event) for event in json_dict['events']])
+
     def get_as_normal_player(self) -> Player:
         return Player(self.name, self.number)
 
@@ -169,8 +169,18 @@ class TeamInGame(Team):
 
     def json_dict(self) -> Dict:
         return dict(name=self.name,
+                    current_name=self.current_name,
                     score=self.score,
-                    coach=self.coach)
+                    coach=self.coach,
+                    players=[player.json_dict() for player in self.players])
+
+    @classmethod
+    def from_json_dict(cls, json_dict: Dict) -> TeamInGame:
+        return cls(name=json_dict['name'],
+                   coach=json_dict['coach'],
+                   score=json_dict['score'],
+                   players=[PlayerInGame.from_json_dict(player) for player in json_dict['players']],
+                   current_name=json_dict['current_name'])
 
     def to_json(self) -> str:
         return json.dumps(self.json_dict())
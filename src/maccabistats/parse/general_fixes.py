@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 
 from maccabistats.parse.add_manual_games import add_manual_games
 from maccabistats.parse.teams_names_changer import teams_names_changer
@@ -128,7 +129,7 @@ _stadiums_name_fixes = [("אצטדיון לוד", ["לוד"]),
                         ]
 
 
-def __fix_teams_names(game):
+def __fix_teams_names(game, fixes_counter: Counter):
     if game.not_maccabi_team.name in teams_names_changer:
         old_team_name = game.not_maccabi_team.name
         game.not_maccabi_team.current_name = teams_names_changer[old_team_name].current_name
@@ -136,68 +137,76 @@ def __fix_teams_names(game):
         game.not_maccabi_team.name = teams_names_changer[old_team_name].change_name(game)
         # Some teams names wont be changed (because the mapping is between team original name and the team name along the years)
         if old_team_name != game.not_maccabi_team.name:
-            logger.info(f"Changing {'Home' if game.is_maccabi_home_team else 'Away'} team name from: "
-                        f"{old_team_name}-->{game.not_maccabi_team.name}")
+            logger.debug(f"Changing {'Home' if game.is_maccabi_home_team else 'Away'} team name from: "
+                         f"{old_team_name}-->{game.not_maccabi_team.name}")
+            fixes_counter['teams names'] += 1
 
 
-def __fix_referees_names(game):
+def __fix_referees_names(game, fixes_counter: Counter):
     for referee_best_name, referee_similar_names in _referees_name_fixes:
         if game.referee in referee_similar_names:
-            logger.info("Changing referee name from :{old}-->{new}".format(old=game.referee, new=referee_best_name))
+            logger.debug("Changing referee name from :{old}-->{new}".format(old=game.referee, new=referee_best_name))
+            fixes_counter['referees names'] += 1
             game.referee = referee_best_name
 
 
-def __fix_competitions_names(game):
+def __fix_competitions_names(game, fixes_counter: Counter):
     for competition_best_name, competition_similar_name in _competitions_name_fixes:
         if game.competition in competition_similar_name:
-            logger.info(
+            logger.debug(
                 "Changing competition name from :{old}-->{new}".format(old=game.competition, new=competition_best_name))
+            fixes_counter['competitions names'] += 1
             game.competition = competition_best_name
 
 
-def __fix_maccabi_players_names(game):
+def __fix_maccabi_players_names(game, fixes_counter: Counter):
     for player in game.maccabi_team.players:
         for player_best_name, player_similar_names in _players_name_fixes:
             # TODO: this is a huge patch, Maccabi tlv site doing balagan with Tal ben haim names, we can assume that the defender won't come back to maccabi anymore as a player:
             if player.name == 'טל בן חיים' and game.season >= '2020/21':
-                logger.info("Changing Tel ben haim (Striker) player name (Special case)")
+                logger.debug("Changing Tel ben haim (Striker) player name (Special case)")
+                fixes_counter['players names'] += 1
                 player.name = 'טל בן חיים (החלוץ)'
                 break
             elif player.name in player_similar_names:
                 if 'טל' in player.name:  # TODO: delete me
-                    logger.info(f'Just for debugging remotely: {player.name} game: {game}')
+                    logger.debug(f'Just for debugging remotely: {player.name} game: {game}')
 
-                logger.info("Changing player name from :{old}->{new}".format(old=player.name, new=player_best_name))
+                logger.debug("Changing player name from :{old}->{new}".format(old=player.name, new=player_best_name))
+                fixes_counter['players names'] += 1
                 player.name = player_best_name
                 break
 
 
-def __fix_stadiums_names(game):
+def __fix_stadiums_names(game, fixes_counter: Counter):
     for stadium_best_name, stadium_similar_names in _stadiums_name_fixes:
         if game.stadium in stadium_similar_names:
-            logger.info("Changing stadium name from :{old}-->{new}".format(old=game.stadium, new=stadium_best_name))
+            logger.debug("Changing stadium name from :{old}-->{new}".format(old=game.stadium, new=stadium_best_name))
+            fixes_counter['stadiums names'] += 1
             game.stadium = stadium_best_name
 
 
-def __fix_fixtures(game):
+def __fix_fixtures(game, fixes_counter: Counter):
     # If game played in the first league
     if game.competition in ["ליגת העל", "ליגה לאומית", "ליגת הבורסה לניירות ערך", "ליגת Winner", "ליגה א'"]:
         if isinstance(game.fixture, int):
-            logger.info(f"Adding 'מחזור' prefix to the ame at {game.date})")
+            logger.debug(f"Adding 'מחזור' prefix to the ame at {game.date})")
+            fixes_counter['fixtures'] += 1
             game.fixture = f"מחזור {game.fixture}"
 
 
-def __fix_seasons(game):
+def __fix_seasons(game, fixes_counter: Counter):
     """
     Remove ' - ' from season and replace it with ' / '.
     """
 
     if "-" in game.season:
-        logger.info("Replacing '-' with '/' in game season")
+        logger.debug("Replacing '-' with '/' in game season")
+        fixes_counter['seasons'] += 1
         game.season = game.season.replace('-', '/')
 
 
-def __remove_empty_players(game):
+def __remove_empty_players(game, fixes_counter: Counter):
     """
     Remove all empty players (if exists), saw some on maccabi site.
     """
@@ -206,8 +215,9 @@ def __remove_empty_players(game):
     game.maccabi_team.players = [player for player in game.maccabi_team.players if player.name]
 
     if before_removing_empty_players != len(game.maccabi_team.players):
-        logger.info(
+        logger.debug(
             f"Removed {before_removing_empty_players - len(game.maccabi_team.players)} empty players from game played at :{game.date}")
+        fixes_counter['empty players'] += before_removing_empty_players - len(game.maccabi_team.players)
 
 
 def __remove_youth_games(maccabi_games_stats):
@@ -225,15 +235,20 @@ def run_general_fixes(maccabi_games_stats):
     :rtype: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
     """
 
+    # Each fix is logged in debug, the info log gets one summary line instead of a line per changed item
+    fixes_counter = Counter()
     for game in maccabi_games_stats.games:
-        __fix_teams_names(game)
-        __fix_referees_names(game)
-        __fix_stadiums_names(game)
-        __fix_competitions_names(game)
-        __fix_maccabi_players_names(game)
-        __fix_seasons(game)
-        __fix_fixtures(game)
-        __remove_empty_players(game)
+        __fix_teams_names(game, fixes_counter)
+        __fix_referees_names(game, fixes_counter)
+        __fix_stadiums_names(game, fixes_counter)
+        __fix_competitions_names(game, fixes_counter)
+        __fix_maccabi_players_names(game, fixes_counter)
+        __fix_seasons(game, fixes_counter)
+        __fix_fixtures(game, fixes_counter)
+        __remove_empty_players(game, fixes_counter)
+        game.refresh_fingerprint()
+
+    logger.info(f"General fixes changed: {', '.join(f'{fix}: {count}' for fix, count in fixes_counter.most_common())}")
 
     maccabi_games_stats = __remove_youth_games(maccabi_games_stats)
 
@@ -3,8 +3,8 @@ import logging
 import os
 
 import requests
-from bs4 import BeautifulSoup
 from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabi_tlv_site.html_backend import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -15,15 +15,6 @@ folder_to_save_games_squads_html_files_pattern = os.path.join(
     MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_games_html_files, "game+{game_date}+squads")
 
 
-def __get_beautifulsoup_parser_name():
-    if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_parser:
-        logger.info("Using lxml parser for beautifulsoup")
-        return "lxml"
-    else:
-        logger.info("Using html.parser for beautifulsoup")
-        return "html.parser"
-
-
 def save_game_web_page_to_disk(web_page):
     """
     :type web_page: str
@@ -47,13 +38,29 @@ def __extract_games_date(link):
     return game_date
 
 
+def get_game_events_page_cache_path(link):
+    return folder_to_save_games_events_html_files_pattern.format(game_date=__extract_games_date(link))
+
+
+def get_game_squads_page_cache_path(link):
+    return folder_to_save_games_squads_html_files_pattern.format(game_date=__extract_games_date(link))
+
+
+def game_page_content_to_bs(game_page_content):
+    """
+    :type game_page_content: bytes
+    :rtype: maccabistats.parse.maccabi_tlv_site.html_backend.HtmlTag or bs4.BeautifulSoup
+    """
+    return parse_html(game_page_content)
+
+
 # GameEvents #
 
 def __get_game_events_bs_from_disk(link):
     game_date = __extract_games_date(link)
 
     with open(folder_to_save_games_events_html_files_pattern.format(game_date=game_date), 'rb') as game_events_file:
-        return BeautifulSoup(game_events_file.read(), __get_beautifulsoup_parser_name())
+        return parse_html(game_events_file.read())
 
 
 def __does_game_events_bs_exists_on_disk(link):
@@ -96,7 +103,7 @@ def __get_game_squads_bs_from_disk(link):
     game_date = __extract_games_date(link)
 
     with open(folder_to_save_games_squads_html_files_pattern.format(game_date=game_date), 'rb') as game_squads_file:
-        return BeautifulSoup(game_squads_file.read(), __get_beautifulsoup_parser_name())
+        return parse_html(game_squads_file.read())
 
 
 def __does_game_squads_bs_exists_on_disk(link):
@@ -4,7 +4,7 @@
 from maccabistats.models.game_data import GameData
 from maccabistats.parse.maccabi_tlv_site.team_parser import MaccabiSiteTeamParser
 from maccabistats.parse.maccabi_tlv_site.game_pages_provider import get_game_squads_bs_by_link, \
-    get_game_events_bs_by_link
+    get_game_events_bs_by_link, game_page_content_to_bs
 from maccabistats.parse.maccabi_tlv_site.game_events_parser import MaccabiSiteGameEventsParser
 import logging
 from urllib.parse import unquote
@@ -16,14 +16,28 @@ logger = logging.getLogger(__name__)
 class MaccabiSiteGameSquadsParser(object):
 
     @staticmethod
-    def parse_game(bs_content, season_string):
+    def get_game_link(bs_content):
         """
-        Gets an html content which relevant to maccabi game and return GameData object, uses bs4.BeautifulSoup.
+        :param bs_content: the part of the html, like soup.find("article"), where soup is BeautifulSoup object.
+        :type bs_content: bs4.element.Tag
+        :return: The game page link (the events page, the squads page is at link + "teams")
+        :rtype: str
+        """
+        return unquote(bs_content.find("a", href=True).get("href"))
+
+    @staticmethod
+    def parse_game(bs_content, season_string, squads_page_content=None, events_page_content=None):
+        """
+        Gets an html content which relevant to maccabi game and return GameData object, uses the html_backend pages.
 
         :param bs_content: the part of the html, like soup.find("article"), where soup is BeautifulSoup object.
         :type bs_content: bs4.element.Tag
         :param season_string: season description, such as : 2000-2001 or 2000-01
         :type season_string: str
+        :param squads_page_content: the game squads page, when it was already fetched (otherwise it is fetched here)
+        :type squads_page_content: bytes
+        :param events_page_content: the game events page, when it was already fetched (otherwise it is fetched here)
+        :type events_page_content: bytes
         :return: GameData
         """
 
@@ -45,8 +59,11 @@ class MaccabiSiteGameSquadsParser(object):
 
         is_maccabi_home_team = bs_content.select_one("div.matchresult.Home") is not None
 
-        game_content_web_page = unquote(bs_content.find("a", href=True).get("href"))
-        squads_bs_page_content = get_game_squads_bs_by_link(game_content_web_page)
+        game_content_web_page = MaccabiSiteGameSquadsParser.get_game_link(bs_content)
+        if squads_page_content is None:
+            squads_bs_page_content = get_game_squads_bs_by_link(game_content_web_page)
+        else:
+            squads_bs_page_content = game_page_content_to_bs(squads_page_content)
 
         maccabi_team, not_maccabi_team = MaccabiSiteGameSquadsParser.__get_teams(squads_bs_page_content,
                                                                                  maccabi_team_name,
@@ -55,7 +72,10 @@ class MaccabiSiteGameSquadsParser(object):
                                                                                  not_maccabi_final_score)
 
         # Parse game events
-        events_bs_page_content = get_game_events_bs_by_link(game_content_web_page)
+        if events_page_content is None:
+            events_bs_page_content = get_game_events_bs_by_link(game_content_web_page)
+        else:
+            events_bs_page_content = game_page_content_to_bs(events_page_content)
         game_events_parser = MaccabiSiteGameEventsParser(maccabi_team, not_maccabi_team, events_bs_page_content, game_content_web_page)
         maccabi_team, not_maccabi_team = game_events_parser.enrich_teams_with_events()
         halfed_parsed_events = game_events_parser.halfed_parsed_events
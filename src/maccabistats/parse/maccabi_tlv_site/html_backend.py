@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Parses the maccabi-tlv site pages with lxml.html, each page is parsed once.
+
+The site parsers were written for BeautifulSoup, so HtmlTag exposes the part of the bs4.element.Tag api they use
+(select, select_one, find, find_all, get_text, get, encode, tag["attribute"], len(tag)).
+The css selectors are translated to xpath once and the compiled xpath is reused for every page,
+only simple selectors are supported: "tag.class1.class2 tag2.class3" (descendant combinator only).
+
+BeautifulSoup is used as a fallback, for pages lxml can not parse (or when use_lxml_html_backend is False).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, List, Optional, Union
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+
+logger = logging.getLogger(__name__)
+
+_SIMPLE_CSS_SELECTOR_PART = re.compile(r'(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?(?P<classes>(?:\.[\w-]+)*)')
+_compiled_selectors: Dict[str, etree.XPath] = dict()
+
+
+def _css_part_to_xpath(selector_part: str) -> str:
+    selector_part_match = _SIMPLE_CSS_SELECTOR_PART.fullmatch(selector_part)
+    if selector_part_match is None or not selector_part:
+        raise ValueError(f"Unsupported css selector part: {selector_part}")
+
+    classes_conditions = "".join(f"[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+                                 for class_name in selector_part_match.group('classes').split('.') if class_name)
+    return f"descendant::{selector_part_match.group('tag') or '*'}{classes_conditions}"
+
+
+def compile_css_selector(css_selector: str) -> etree.XPath:
+    """
+    :param css_selector: Such as: "article div.teams div.p50.yellow"
+    :return: The compiled xpath of this selector (cached), it returns the matching descendants at the document order
+    """
+    if css_selector not in _compiled_selectors:
+        _compiled_selectors[css_selector] = etree.XPath(
+            "/".join(_css_part_to_xpath(selector_part) for selector_part in css_selector.split()))
+
+    return _compiled_selectors[css_selector]
+
+
+_FIRST_DIRECT_TEXT = etree.XPath("text()[1]")
+
+
+def _as_beautifulsoup_string(text: str) -> str:
+    # bs4 replaces the whitespace-only strings (such as the indentation between the tags) with a single whitespace
+    if text.isspace():
+        return '\n' if '\n' in text else ' '
+    return text
+
+
+class HtmlTag(object):
+    def __init__(self, element: lxml.html.HtmlElement):
+        self.element = element
+
+    def __repr__(self) -> str:
+        return etree.tostring(self.element, encoding='unicode', with_tail=False)
+
+    def __getitem__(self, attribute_name: str) -> Union[str, List[str]]:
+        if attribute_name not in self.element.attrib:
+            raise KeyError(attribute_name)
+
+        return self.get(attribute_name)
+
+    def __len__(self) -> int:
+        # Same as bs4 - the number of direct children, including the text between them
+        return (1 if self.element.text else 0) + sum(1 + (1 if child.tail else 0) for child in self.element)
+
+    @property
+    def attrs(self) -> Dict[str, Union[str, List[str]]]:
+        return {attribute_name: self.get(attribute_name) for attribute_name in self.element.attrib}
+
+    def get(self, attribute_name: str, default=None) -> Union[str, List[str], None]:
+        attribute_value = self.element.get(attribute_name)
+        if attribute_value is None:
+            return default
+        # bs4 returns the class attribute as a list of classes
+        return attribute_value.split() if attribute_name == 'class' else attribute_value
+
+    def get_text(self) -> str:
+        return "".join(_as_beautifulsoup_string(text) for text in self.element.itertext())
+
+    def encode(self) -> bytes:
+        # The html of this element only (utf-8), such as bs4 Tag.encode
+        return etree.tostring(self.element, encoding='utf-8', method='html', with_tail=False)
+
+    def select(self, css_selector: str) -> List[HtmlTag]:
+        return [HtmlTag(element) for element in compile_css_selector(css_selector)(self.element)]
+
+    def select_one(self, css_selector: str) -> Optional[HtmlTag]:
+        elements = compile_css_selector(css_selector)(self.element)
+        return HtmlTag(elements[0]) if elements else None
+
+    def find_all(self, name: str) -> List[HtmlTag]:
+        return self.select(name)
+
+    def find(self, name: Optional[str] = None, class_: Optional[str] = None, href: bool = False,
+             text: bool = False, recursive: bool = True) -> Union[HtmlTag, str, None]:
+        """
+        Supports the bs4 find calls of the site parsers: find("div", "round"), find("a", href=True), find("b")
+        and find(text=True, recursive=False) - the first direct text of this element.
+        """
+        if text:
+            if recursive:
+                raise ValueError("Only the direct text of an element can be found")
+            direct_texts = _FIRST_DIRECT_TEXT(self.element)
+            return _as_beautifulsoup_string(str(direct_texts[0])) if direct_texts else None
+
+        elements = self.select(f"{name}.{class_}" if class_ else name)
+        if href:
+            elements = [element for element in elements if element.get('href') is not None]
+        return elements[0] if elements else None
+
+
+def _get_beautifulsoup_parser_name() -> str:
+    return "lxml" if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_parser else "html.parser"
+
+
+def parse_html(page_content: bytes) -> Union[HtmlTag, BeautifulSoup]:
+    """
+    :param page_content: The page as it was fetched from maccabi-tlv site (utf-8)
+    :return: The root of the page, both have the same api (for the site parsers)
+    """
+    if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_html_backend:
+        try:
+            return HtmlTag(lxml.html.document_fromstring(page_content.decode('utf-8')))
+        except (ValueError, etree.ParserError):
+            logger.warning("Could not parse a page with lxml, parsing it with BeautifulSoup")
+
+    return BeautifulSoup(page_content, _get_beautifulsoup_parser_name())
@@ -34,6 +34,7 @@ class MaccabiTlvSiteSource(MaccabiStatsSource):
 
         logger.info("Running fix specific games for maccabi-tlv site source")
         self.maccabi_games_stats = fix_specific_games(self.maccabi_games_stats)
+        self.maccabi_games_stats.refresh_fingerprints()
 
 
 
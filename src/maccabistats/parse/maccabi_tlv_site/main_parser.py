@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import itertools
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Pool
 
 import requests
-from bs4 import BeautifulSoup
 from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.maccabilogging import worker_logging_initializer
+from maccabistats.parse.maccabi_tlv_site.game_pages_provider import get_game_events_page_cache_path, \
+    get_game_squads_page_cache_path
 from maccabistats.parse.maccabi_tlv_site.game_squads_parser import MaccabiSiteGameSquadsParser
+from maccabistats.parse.maccabi_tlv_site.html_backend import parse_html
+from maccabistats.parse.maccabi_tlv_site.pages_fetcher import MaccabiSitePagesFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -16,23 +22,17 @@ folder_to_save_seasons_html_files_pattern = os.path.join(
     MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_seasons_html_files, "season-{season_number}")
 
 
-def __get_beautifulsoup_parser_name():
-    if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_parser:
-        logger.info("Using lxml parser for beautifulsoup")
-        return "lxml"
-    else:
-        logger.info("Using html.parser for beautifulsoup")
-        return "html.parser"
-
-
-def __extract_games_bs_elements(season_web_page_content):
+def __parse_season_page(season_web_page_content):
     """
-    :param season_web_page_content: str
-    :rtype: list of bs4.element.Tag
+    Parse the season page once, for both the season string and the games elements.
+
+    :param season_web_page_content: bytes
+    :return: The season string and the games elements
+    :rtype: str, list of maccabistats.parse.maccabi_tlv_site.html_backend.HtmlTag
     """
 
-    soup = BeautifulSoup(season_web_page_content, __get_beautifulsoup_parser_name())
-    return soup.find_all("article")
+    season_page = parse_html(season_web_page_content)
+    return __get_season_string_from_season_page(season_page), season_page.find_all("article")
 
 
 def __get_season_web_page_content_by_season_number(season_number):
@@ -65,10 +65,9 @@ def __get_parsed_maccabi_games_from_web():
     return maccabi_games
 
 
-def __get_season_string_from_season_page_content(season_web_page_content):
-    soup = BeautifulSoup(season_web_page_content, __get_beautifulsoup_parser_name())
+def __get_season_string_from_season_page(season_page):
     # TODO try except that better
-    wrapped_season_string = soup.select("main div.dropdown a")[0].get_text()
+    wrapped_season_string = season_page.select("main div.dropdown a")[0].get_text()
     season_string = wrapped_season_string.strip("כל העונות()")
 
     return season_string
@@ -87,7 +86,7 @@ def __get_parsed_maccabi_games_from_web_multi_process():
     seasons_to_crawl = MaccabiStatsConfigSingleton.maccabi_site.max_seasons_to_crawl
     maccabi_seasons_numbers = range(start_to_parse_from_season_number, seasons_to_crawl)
 
-    with Pool(crawling_processes) as pool:
+    with Pool(crawling_processes, **worker_logging_initializer()) as pool:
         maccabi_games = list(
             itertools.chain.from_iterable(pool.map(__parse_games_from_season_number, maccabi_seasons_numbers)))
 
@@ -97,8 +96,7 @@ def __get_parsed_maccabi_games_from_web_multi_process():
 def __parse_games_from_season_number(season_number):
     maccabi_season_web_page_content = __get_season_web_page_content_by_season_number(season_number)
 
-    bs_games_elements = __extract_games_bs_elements(maccabi_season_web_page_content)
-    season_string = __get_season_string_from_season_page_content(maccabi_season_web_page_content)
+    season_string, bs_games_elements = __parse_season_page(maccabi_season_web_page_content)
     logger.info(
         "Found {number} games on this season! {season}".format(number=len(bs_games_elements), season=season_string))
 
@@ -106,10 +104,98 @@ def __parse_games_from_season_number(season_number):
             bs_games_elements]
 
 
+def __extract_season_games(season_web_page_content):
+    """
+    Parse the season page once (runs on the parsing processes), the games elements are returned as their html,
+    the parsed elements can not be sent back from the processes.
+
+    :type season_web_page_content: bytes
+    :return: The season string, the games links and the games elements html
+    :rtype: str, list of str, list of bytes
+    """
+
+    season_string, bs_games_elements = __parse_season_page(season_web_page_content)
+    logger.info(f"Found {len(bs_games_elements)} games on this season! {season_string}")
+
+    return (season_string,
+            [MaccabiSiteGameSquadsParser.get_game_link(bs_game_element) for bs_game_element in bs_games_elements],
+            [bs_game_element.encode() for bs_game_element in bs_games_elements])
+
+
+def __parse_games_from_season_games_elements(season_string, games_elements_html, games_pages):
+    """
+    Same as __parse_games_from_season_number, with pages that were already fetched (runs on the parsing processes).
+
+    :param games_elements_html: The games elements of the season page (see __extract_season_games)
+    :type games_elements_html: list of bytes
+    :param games_pages: (squads page content, events page content) of each game, at the games elements order
+    :type games_pages: list of tuple
+    :rtype: list of maccabistats.models.game_data.GameData
+    """
+
+    return [MaccabiSiteGameSquadsParser.parse_game(parse_html(game_element_html).find_all("article")[0], season_string,
+                                                   *game_pages)
+            for game_element_html, game_pages in zip(games_elements_html, games_pages)]
+
+
+async def __fetch_game_pages(fetcher, game_link):
+    return await asyncio.gather(fetcher.fetch(game_link + "teams", get_game_squads_page_cache_path(game_link)),
+                                fetcher.fetch(game_link, get_game_events_page_cache_path(game_link)))
+
+
+async def __crawl_season_async(season_number, fetcher, parsing_pool, seasons_semaphore):
+    """
+    Fetch the season page and its games pages, the html parsing runs on the parsing pool (so the fetching continues).
+    """
+
+    loop = asyncio.get_running_loop()
+    # Bound the seasons in progress, so the fetched pages of all the seasons are not kept in memory at once
+    async with seasons_semaphore:
+        logger.info(f"Crawling season number {season_number}")
+        season_web_page_content = await fetcher.fetch(
+            MaccabiStatsConfigSingleton.maccabi_site.season_page_pattern.format(season_number=season_number))
+
+        season_string, games_links, games_elements_html = await loop.run_in_executor(
+            parsing_pool, __extract_season_games, season_web_page_content)
+        games_pages = await asyncio.gather(*(__fetch_game_pages(fetcher, game_link) for game_link in games_links))
+
+        return await loop.run_in_executor(parsing_pool, __parse_games_from_season_games_elements, season_string,
+                                          games_elements_html, games_pages)
+
+
+def __get_parsed_maccabi_games_from_web_async():
+    """
+    Parse maccabi games same as __get_parsed_maccabi_games_from_web, the pages are fetched concurrently
+    (asyncio with a single pooled session) and parsed over a pool of processes.
+    :return: list of maccabistats.models.game_data.GameData
+    """
+
+    maccabi_site_config = MaccabiStatsConfigSingleton.maccabi_site
+    start_to_parse_from_season_number = int(os.environ.get('START_SEASON_TO_CRAWL', 0))
+    maccabi_seasons_numbers = range(start_to_parse_from_season_number, maccabi_site_config.max_seasons_to_crawl)
+    logger.info(f"Crawling with {maccabi_site_config.max_concurrent_requests} concurrent requests, "
+                f"parsing with {maccabi_site_config.parsing_process_number} processes")
+
+    async def crawl_seasons():
+        seasons_semaphore = asyncio.Semaphore(2 * maccabi_site_config.parsing_process_number)
+        return await asyncio.gather(*(__crawl_season_async(season_number, fetcher, parsing_pool, seasons_semaphore)
+                                      for season_number in maccabi_seasons_numbers))
+
+    with MaccabiSitePagesFetcher(max_concurrent_requests=maccabi_site_config.max_concurrent_requests,
+                                 retries=maccabi_site_config.requests_retries,
+                                 use_disk_cache=maccabi_site_config.use_disk_as_cache_when_crawling) as fetcher, \
+            ProcessPoolExecutor(max_workers=maccabi_site_config.parsing_process_number,
+                                **worker_logging_initializer()) as parsing_pool:
+        return list(itertools.chain.from_iterable(asyncio.run(crawl_seasons())))
+
+
 def get_parsed_maccabi_games_from_maccabi_site():
     try:
         logger.info("Trying to iterate seasons pages from web")
-        if MaccabiStatsConfigSingleton.maccabi_site.use_multiprocess_crawling:
+        if MaccabiStatsConfigSingleton.maccabi_site.use_async_crawling:
+            logger.info("Crawling maccabi games with asyncio!")
+            return __get_parsed_maccabi_games_from_web_async()
+        elif MaccabiStatsConfigSingleton.maccabi_site.use_multiprocess_crawling:
             logger.info("Crawling maccabi games with multi process!")
             return __get_parsed_maccabi_games_from_web_multi_process()
         else:
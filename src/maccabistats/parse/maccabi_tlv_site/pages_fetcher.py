@@ -0,0 +1,114 @@
+"""
+Fetches the maccabi-tlv site pages concurrently with asyncio, over a single pooled requests session.
+requests is blocking, so each request waits on a thread, a semaphore bounds how many requests run at the same time.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# The site is overloaded sometimes, any other status is returned as is (same as a plain requests.get)
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class _RetryableStatusCodeError(Exception):
+    pass
+
+
+class MaccabiSitePagesFetcher(object):
+    def __init__(self, max_concurrent_requests: int = 16, retries: int = 3, retry_delay_seconds: float = 1.0,
+                 timeout_seconds: float = 30, use_disk_cache: bool = True):
+        """
+        :param retries: How many times to retry a failed request (connection errors & overloaded server statuses)
+        :param retry_delay_seconds: The delay before the first retry, doubled on each retry
+        :param use_disk_cache: Read the pages from their cache path when it exists (the fetched pages are always saved)
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.retries = retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.timeout_seconds = timeout_seconds
+        self.use_disk_cache = use_disk_cache
+
+        self._session = requests.Session()
+        pooled_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrent_requests)
+        self._session.mount('http://', pooled_adapter)
+        self._session.mount('https://', pooled_adapter)
+
+        self._requests_semaphores = dict()
+        self._requests_executor = ThreadPoolExecutor(max_workers=max_concurrent_requests,
+                                                     thread_name_prefix='maccabi-site-fetcher')
+
+    def __enter__(self) -> 'MaccabiSitePagesFetcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._requests_executor.shutdown()
+        self._session.close()
+
+    @property
+    def _requests_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to a single event loop, each fetch_all runs its own loop
+        return self._requests_semaphores.setdefault(asyncio.get_running_loop(),
+                                                    asyncio.Semaphore(self.max_concurrent_requests))
+
+    def _get(self, url: str) -> bytes:
+        response = self._session.get(url, timeout=self.timeout_seconds)
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise _RetryableStatusCodeError(f"status code {response.status_code}")
+
+        return response.content
+
+    async def _get_with_retries(self, url: str) -> bytes:
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.retries + 1):
+            try:
+                # Waiting for the retry should not hold the semaphore
+                async with self._requests_semaphore:
+                    return await loop.run_in_executor(self._requests_executor, self._get, url)
+            except (requests.RequestException, _RetryableStatusCodeError) as e:
+                if attempt == self.retries:
+                    raise RuntimeError(f"Could not fetch {url} after {self.retries + 1} attempts") from e
+
+                logger.warning(f"Failed to fetch {url} ({e}), retrying")
+                await asyncio.sleep(self.retry_delay_seconds * 2 ** attempt)
+
+    async def fetch(self, url: str, cache_path: Optional[str] = None) -> bytes:
+        """
+        :param cache_path: Where the page is saved on the disk (read from there when use_disk_cache is set)
+        """
+        if cache_path is not None and self.use_disk_cache and os.path.isfile(cache_path):
+            with open(cache_path, 'rb') as cached_page:
+                return cached_page.read()
+
+        page_content = await self._get_with_retries(url)
+
+        if cache_path is not None:
+            # Replace the cached page atomically, an interrupted write should not leave a truncated page to read
+            temp_cache_path = f"{cache_path}.tmp"
+            with open(temp_cache_path, 'wb') as cached_page:
+                cached_page.write(page_content)
+
+            os.replace(temp_cache_path, cache_path)
+
+        return page_content
+
+    def fetch_all(self, urls: List[str]) -> List[bytes]:
+        """
+        Fetch the given pages concurrently (blocks until all of them are fetched), at the urls order.
+        """
+
+        async def fetch_all_async():
+            return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+        return asyncio.run(fetch_all_async())
@@ -15,7 +15,7 @@ _MUST_HAVE_FIELDS = "_pageName"
 
 
 class MaccabiPediaCargoChunksCrawler(Iterator):
-    def __init__(self, tables_name, tables_fields, join_tables_on="", where_condition="1=1"):
+    def __init__(self, tables_name, tables_fields, join_tables_on="", where_condition="1=1", order_by=""):
         """
 
         :param tables_name: The table name to crawl
@@ -26,6 +26,8 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
         :type join_tables_on: str
         :param where_condition: The condition of the query
         :type where_condition: str
+        :param order_by: The fields to order the rows by (the rows are returned at this order)
+        :type order_by: str
         """
 
         self.base_crawling_address = MaccabiStatsConfigSingleton.maccabipedia.base_crawling_address
@@ -35,6 +37,7 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
         self.tables_fields = tables_fields
         self.join_tables_on = join_tables_on
         self.where_condition = where_condition
+        self.order_by = order_by
 
         self._current_offset = 0
         self._finished_to_crawl = False
@@ -51,7 +54,7 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
                f"&offset={self._current_offset}" \
                f"&where={self.where_condition}" \
                f"&group_by=" \
-               f"&order_by=" \
+               f"&order_by={self.order_by}" \
                f"&having="
 
     def _request_more_data(self):
@@ -100,7 +103,7 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
             if not self._already_fetched_data_queue:
                 raise StopIteration()
 
-        return self._already_fetched_data_queue.pop()
+        return self._already_fetched_data_queue.popleft()
 
     @classmethod
     def create_games_crawler(cls):
@@ -109,6 +112,7 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
                    join_tables_on=MaccabiStatsConfigSingleton.maccabipedia.games_data_query.join_on)
 
     @classmethod
-    def create_games_events_crawler(cls):
+    def create_games_events_crawler(cls, order_by=""):
         return cls(tables_name=MaccabiStatsConfigSingleton.maccabipedia.games_events_query.tables_names,
-                   tables_fields=MaccabiStatsConfigSingleton.maccabipedia.games_events_query.fields_names)
+                   tables_fields=MaccabiStatsConfigSingleton.maccabipedia.games_events_query.fields_names,
+                   order_by=order_by)
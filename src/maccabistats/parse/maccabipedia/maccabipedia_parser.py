@@ -2,11 +2,18 @@
 
 
 import logging
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
 
-from dateutil.parser import parse as datetime_parser
-
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.date_parsing import parse_date
+from maccabistats.maccabilogging import worker_logging_initializer
 from maccabistats.models.game_data import GameData
 from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalTypes, GoalGameEvent, AssistTypes, \
     AssistGameEvent
@@ -17,6 +24,8 @@ from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import Ma
 logger = logging.getLogger(__name__)
 
 _PAGE_NAME_FIELD_NAME = "_pageName"
+# The events of each game are crawled one after the other, _ID keeps the paging stable between the rows of the same page
+_STREAMING_EVENTS_ORDER_BY = f"{_PAGE_NAME_FIELD_NAME}, _ID"
 _MACCABI_TEAM = 1
 _NOT_MACCABI_TEAM = 0
 
@@ -74,6 +83,136 @@ MACCABIPEDIA_ASSISTS_TYPE = {40: AssistTypes.UNCATEGORIZED,
                              }
 
 
+def _parse_player_event(player_event):
+    """
+    Parse event from json to maccabistats event format, Maccabipedia contains "double" events (two events for one maccabistats event),
+    We ignore those (return None).
+
+    :param player_event: dict
+
+    :rtype: maccabistats.models.player_game_events.GameEvent or None
+    """
+
+    event_time = timedelta(minutes=player_event["Minute"])
+    # While upgrading MaccabiPedia from 1.35 to 1.39, cargo returned Nulls (instead of "" as before):
+    sub_type = player_event.get("SubType", "")
+
+    if GameEventTypes.GOAL_SCORE == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
+        return GoalGameEvent(time_occur=event_time, goal_type=MACCABIPEDIA_GOALS_TYPE[sub_type])
+    if GameEventTypes.GOAL_ASSIST == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
+        return AssistGameEvent(time_occur=event_time,
+                               assist_type=MACCABIPEDIA_ASSISTS_TYPE[sub_type])
+    elif GameEventTypes.UNKNOWN == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
+        return GameEvent(game_event_type=GameEventTypes.UNKNOWN, time_occur=event_time)
+    else:
+        event_type = MACCABI_PEDIA_EVENTS[player_event["EventType"]][sub_type]
+        if event_type == GameEventTypes.UNKNOWN:
+            logger.warning(f"Encountered unknown event at this event: {player_event}")
+
+        if event_type == _DUPLICATE_MACCABIPEDIA_EVENT:
+            return None
+        else:
+            return GameEvent(game_event_type=event_type, time_occur=event_time)
+
+
+def _extract_players_events_for_team(game_events_as_json, log_errors: bool):
+    """
+    Extract all the players events from the game events.
+
+    :param game_events_as_json: list of game events as json
+    :type game_events_as_json: list of dict
+
+    :rtype: list of maccabistats.models.player_in_game.PlayerInGame
+    """
+
+    players = []
+    # Order all the events by player name:   "PlayerName" to list of his events
+    players_events_by_name = defaultdict(list)
+    [players_events_by_name[player_event["PlayerName"]].append(player_event) for player_event in
+     game_events_as_json]
+
+    for player_name, player_json_events in players_events_by_name.items():
+
+        player_number = set(event.get("PlayerNumber", "") for event in player_json_events)
+
+        if log_errors and len(player_number) > 1:
+            # Removing any 0 from this player number Set,
+            # 0 may indicates we are not sure about his number or it's a mistake
+
+            # We don't log a case when player has only empty numbers,
+            # because this is is an information we could not have for the entire games (1920-1950 are hardest)
+            non_empty_number = (player_number - {''}) - {0}
+
+            if len(non_empty_number) > 1:
+                logger.warning(f"Found more than 1 player_number for player: {player_name}, "
+                               f"numbers: {player_number}, "
+                               f"game: {player_json_events[0]['_pageName']}")
+
+            elif len(non_empty_number) == 1:
+                logger.warning(f"Player: {player_name} has a number in this game: {non_empty_number}, "
+                               f" but at least one event is missing this number, "
+                               f"game: {player_json_events[0]['_pageName']}")
+
+        player_number = player_number.pop()  # Take the first/only number
+        # Adds all events, remove the None ones (means they are duplicates
+        player_parsed_events = list(
+            filter(None.__ne__, [_parse_player_event(event) for event in player_json_events]))
+
+        # TODO: handle the case that the number is 0 (no number probably and 0 is because of the db default)
+        players.append(PlayerInGame(player_name, player_number, player_parsed_events))
+
+    return players
+
+
+def _build_maccabistats_game(game_metadata, game_events):
+    """
+    Build maccabistats game object, creates two teams with their players (and events).
+
+    :param game_metadata: json of the game metadata (coaches names, date and so on)
+    :type game_metadata: dict
+    :param game_events: players events as json
+    :type game_events: list of dict
+
+    :rtype: GameData
+    """
+
+    # TODO: atm opponent is number, should add join to the query with opponents table, SAME for competition
+    maccabi_players = _extract_players_events_for_team(
+        [event for event in game_events if event['Team'] == _MACCABI_TEAM], log_errors=True)
+    maccabi_team = TeamInGame("מכבי תל אביב", game_metadata.get("CoachMaccabi", ''), game_metadata["ResultMaccabi"],
+                              maccabi_players)
+
+    not_maccabi_players = _extract_players_events_for_team(
+        [event for event in game_events if event['Team'] == _NOT_MACCABI_TEAM], log_errors=False)
+
+    not_maccabi_team = TeamInGame(game_metadata.get("Opponent", ""), game_metadata.get("CoachOpponent", ''),
+                                  game_metadata["ResultOpponent"], not_maccabi_players)
+
+    home_team, away_team = (maccabi_team, not_maccabi_team) if game_metadata.get("HomeAway", '') == "בית" else (
+        not_maccabi_team, maccabi_team)
+
+    # 'Technical' is 1: for win, 2: for lose, -1: for non technical result game (regular game)
+    technical = True if game_metadata['Technical'] in [1, 2] else False
+
+    return GameData(competition=game_metadata["Competition"], fixture=game_metadata.get("Leg", ''),
+                    date_as_hebrew_string="",
+                    stadium=game_metadata.get("Stadium", ''), crowd=game_metadata.get("Crowd", ''),
+                    referee=game_metadata.get("Refs", ''),
+                    home_team=home_team,
+                    away_team=away_team, season_string=str(game_metadata["Season"]), half_parsed_events=[],
+                    date=parse_date(f"{game_metadata['Date']} {game_metadata.get('Hour', '')}"),
+                    technical_result=technical)
+
+
+def _build_maccabistats_games_chunk(games_json: List[Tuple[dict, List[dict]]]) -> List[GameData]:
+    """
+    Build the games of a single chunk, runs inside the parsing worker processes (so it should stay at the module level).
+
+    :param games_json: The (game metadata, game events) of each game in this chunk
+    """
+    return [_build_maccabistats_game(game_metadata, game_events) for game_metadata, game_events in games_json]
+
+
 class MaccabiPediaParser(object):
 
     def __init__(self):
@@ -103,139 +242,99 @@ class MaccabiPediaParser(object):
         return [game_events_as_json for game_events_as_json in
                 MaccabiPediaCargoChunksCrawler.create_games_events_crawler()]
 
-    def _parse_player_event(self, player_event):
-        """
-        Parse event from json to maccabistats event format, Maccabipedia contains "double" events (two events for one maccabistats event),
-        We ignore those (return None).
-
-        :param player_event: dict
+    def _games_json(self) -> List[Tuple[dict, List[dict]]]:
+        # Take the first game from each date, we should assume its ok or we will have a lot of problems
+        return [(self._game_metadata_by_game[game_name][0], self._games_events_by_game[game_name])
+                for game_name in self._game_metadata_by_game.keys()]
 
-        :rtype: maccabistats.models.player_game_events.GameEvent or None
-        """
-
-        event_time = timedelta(minutes=player_event["Minute"])
-        # While upgrading MaccabiPedia from 1.35 to 1.39, cargo returned Nulls (instead of "" as before):
-        sub_type = player_event.get("SubType", "")
-
-        if GameEventTypes.GOAL_SCORE == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
-            return GoalGameEvent(time_occur=event_time, goal_type=MACCABIPEDIA_GOALS_TYPE[sub_type])
-        if GameEventTypes.GOAL_ASSIST == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
-            return AssistGameEvent(time_occur=event_time,
-                                   assist_type=MACCABIPEDIA_ASSISTS_TYPE[sub_type])
-        elif GameEventTypes.UNKNOWN == MACCABI_PEDIA_EVENTS[player_event["EventType"]]:
-            return GameEvent(game_event_type=GameEventTypes.UNKNOWN, time_occur=event_time)
-        else:
-            event_type = MACCABI_PEDIA_EVENTS[player_event["EventType"]][sub_type]
-            if event_type == GameEventTypes.UNKNOWN:
-                logger.warning(f"Encountered unknown event at this event: {player_event}")
-
-            if event_type == _DUPLICATE_MACCABIPEDIA_EVENT:
-                return None
-            else:
-                return GameEvent(game_event_type=event_type, time_occur=event_time)
-
-    def _extract_players_events_for_team(self, game_events_as_json, log_errors: bool):
+    @staticmethod
+    def _parse_with_processes(games_json: List[Tuple[dict, List[dict]]], processes_count: int,
+                              chunk_size: int) -> List[GameData]:
+        chunks = [games_json[index: index + chunk_size] for index in range(0, len(games_json), chunk_size)]
+        logger.info(f"Parsing {len(games_json)} games in {len(chunks)} chunks with {processes_count} processes")
+
+        # The workers warnings (such as the players numbers mistakes) are logged like the warnings of this process
+        with ProcessPoolExecutor(max_workers=processes_count, **worker_logging_initializer()) as executor:
+            # map keeps the chunks order, so the games order does not depend on which worker finished first
+            return [game for games_chunk in executor.map(_build_maccabistats_games_chunk, chunks)
+                    for game in games_chunk]
+
+    def parse(self, processes_count: Optional[int] = None, chunk_size: Optional[int] = None):
         """
-        Extract all the players events from the game events.
-
-        :param game_events_as_json: list of game events as json
-        :type game_events_as_json: list of dict
+        Building game data from each page name (game metadata & game events).
+        The games are built in chunks over a pool of processes, the games order is the same as in a single process.
 
-        :rtype: list of maccabistats.models.player_in_game.PlayerInGame
+        :param processes_count: The number of parsing processes, 1 parses in this process,
+                                defaults to the config (or the CPUs count)
+        :param chunk_size: The number of games each process builds at a time, defaults to the config
+        :return: List of the merged games from maccabipedia (with the games events)
+        :rtype: list of GameData
         """
 
-        players = []
-        # Order all the events by player name:   "PlayerName" to list of his events
-        players_events_by_name = defaultdict(list)
-        [players_events_by_name[player_event["PlayerName"]].append(player_event) for player_event in
-         game_events_as_json]
-
-        for player_name, player_json_events in players_events_by_name.items():
-
-            player_number = set(event.get("PlayerNumber", "") for event in player_json_events)
+        processes_count = processes_count or MaccabiStatsConfigSingleton.maccabipedia.parse_processes_count \
+            or os.cpu_count() or 1
+        chunk_size = chunk_size or MaccabiStatsConfigSingleton.maccabipedia.parse_games_chunk_size
+        games_json = self._games_json()
 
-            if log_errors and len(player_number) > 1:
-                # Removing any 0 from this player number Set,
-                # 0 may indicates we are not sure about his number or it's a mistake
+        parsed_games = None
+        # Starting the processes is not worth it for a few chunks
+        if processes_count > 1 and len(games_json) > 2 * chunk_size:
+            try:
+                parsed_games = self._parse_with_processes(games_json, processes_count, chunk_size)
+            except (OSError, BrokenProcessPool):
+                logger.exception("Could not parse the games with processes, parsing them in this process")
 
-                # We don't log a case when player has only empty numbers,
-                # because this is is an information we could not have for the entire games (1920-1950 are hardest)
-                non_empty_number = (player_number - {''}) - {0}
+        if parsed_games is None:
+            parsed_games = _build_maccabistats_games_chunk(games_json)
 
-                if len(non_empty_number) > 1:
-                    logger.warning(f"Found more than 1 player_number for player: {player_name}, "
-                                   f"numbers: {player_number}, "
-                                   f"game: {player_json_events[0]['_pageName']}")
-
-                elif len(non_empty_number) == 1:
-                    logger.warning(f"Player: {player_name} has a number in this game: {non_empty_number}, "
-                                   f" but at least one event is missing this number, "
-                                   f"game: {player_json_events[0]['_pageName']}")
-
-            player_number = player_number.pop()  # Take the first/only number
-            # Adds all events, remove the None ones (means they are duplicates
-            player_parsed_events = list(
-                filter(None.__ne__, [self._parse_player_event(event) for event in player_json_events]))
+        logger.info(f"Parsed {len(parsed_games)} games")
+        return parsed_games
 
-            # TODO: handle the case that the number is 0 (no number probably and 0 is because of the db default)
-            players.append(PlayerInGame(player_name, player_number, player_parsed_events))
 
-        return players
+class MaccabiPediaStreamingParser(object):
 
-    def _build_maccabistats_game(self, game_metadata, game_events):
+    def __init__(self):
         """
-        Build maccabistats game object, creates two teams with their players (and events).
-
-        :param game_metadata: json of the game metadata (coaches names, date and so on)
-        :type game_metadata: dict
-        :param game_events: players events as json
-        :type game_events: list of dict
-
-        :rtype: GameData
+        Fetching only the games table from maccabipedia (a row per game), the games events are crawled while parsing.
         """
 
-        # TODO: atm opponent is number, should add join to the query with opponents table, SAME for competition
-        maccabi_players = self._extract_players_events_for_team(
-            [event for event in game_events if event['Team'] == _MACCABI_TEAM],
-            log_errors=True)
-        maccabi_team = TeamInGame("מכבי תל אביב", game_metadata.get("CoachMaccabi", ''), game_metadata["ResultMaccabi"],
-                                  maccabi_players)
+        # Dict from pageName to json, take the first game from each page (as MaccabiPediaParser does)
+        self._game_metadata_by_game = dict()
+        for game_metadata in MaccabiPediaCargoChunksCrawler.create_games_crawler():
+            self._game_metadata_by_game.setdefault(game_metadata[_PAGE_NAME_FIELD_NAME], game_metadata)
 
-        not_maccabi_players = self._extract_players_events_for_team(
-            [event for event in game_events if event['Team'] == _NOT_MACCABI_TEAM],
-            log_errors=False)
+    def iter_games(self) -> Iterator[GameData]:
+        """
+        Crawl the games events ordered by the page name and build each game once all of its events were crawled,
+        so only a single crawled chunk & a single game events are kept in memory (instead of all the raw data).
+        The games are built in a single process, in the order of their page name (games without events are last).
+        """
 
-        not_maccabi_team = TeamInGame(game_metadata.get("Opponent", ""), game_metadata.get("CoachOpponent", ''),
-                                      game_metadata["ResultOpponent"], not_maccabi_players)
+        built_games_names = set()
+        events_crawler = MaccabiPediaCargoChunksCrawler.create_games_events_crawler(order_by=_STREAMING_EVENTS_ORDER_BY)
+        for game_name, game_events in groupby(events_crawler, key=itemgetter(_PAGE_NAME_FIELD_NAME)):
+            if game_name in built_games_names:
+                raise RuntimeError(f"The events of game: {game_name} were not crawled one after the other, "
+                                   f"parse maccabipedia without streaming")
+            built_games_names.add(game_name)
 
-        home_team, away_team = (maccabi_team, not_maccabi_team) if game_metadata.get("HomeAway", '') == "בית" else (
-            not_maccabi_team, maccabi_team)
+            game_metadata = self._game_metadata_by_game.pop(game_name, None)
+            if game_metadata is None:
+                logger.debug(f"Skipping the events of page: {game_name}, it has no game")
+                continue
 
-        # 'Technical' is 1: for win, 2: for lose, -1: for non technical result game (regular game)
-        technical = True if game_metadata['Technical'] in [1, 2] else False
+            logger.debug(f"Parsing game at {game_name}")
+            yield _build_maccabistats_game(game_metadata, list(game_events))
 
-        return GameData(competition=game_metadata["Competition"], fixture=game_metadata.get("Leg", ''),
-                        date_as_hebrew_string="",
-                        stadium=game_metadata.get("Stadium", ''), crowd=game_metadata.get("Crowd", ''),
-                        referee=game_metadata.get("Refs", ''),
-                        home_team=home_team,
-                        away_team=away_team, season_string=str(game_metadata["Season"]), half_parsed_events=[],
-                        date=datetime_parser(f"{game_metadata['Date']} {game_metadata.get('Hour', '')}"),
-                        technical_result=technical)
+        for game_name in list(self._game_metadata_by_game.keys()):
+            yield _build_maccabistats_game(self._game_metadata_by_game.pop(game_name), [])
 
     def parse(self):
         """
-        Building game data from each page name (game metadata & game events).
-
         :return: List of the merged games from maccabipedia (with the games events)
         :rtype: list of GameData
         """
 
-        parsed_games = []
-        for game_name in self._game_metadata_by_game.keys():
-            logger.info(f"Parsing game at {game_name}")
-            # Take the first game from each date, we should assume its ok or we will have a lot of problems
-            parsed_games.append(self._build_maccabistats_game(self._game_metadata_by_game[game_name][0],
-                                                              self._games_events_by_game[game_name]))
-
+        parsed_games = list(self.iter_games())
+        logger.info(f"Parsed {len(parsed_games)} games")
         return parsed_games
@@ -1,4 +1,5 @@
 import logging
+import pickle
 
 from maccabistats.parse.maccabipedia.maccabipedia_source import MaccabiPediaSource
 
@@ -13,3 +14,8 @@ class MaccabiPediaSingleFileSource(MaccabiPediaSource):
 
     def find_last_created_source_maccabi_games_file(self) -> str:
         return self.file_to_use
+
+    def load_serialized_games(self):
+        logger.info(f"Loading source {self.name} as MaccabiGamesStats from: {self.file_to_use}")
+        with open(self.file_to_use, 'rb') as f:
+            self.maccabi_games_stats = pickle.load(f)
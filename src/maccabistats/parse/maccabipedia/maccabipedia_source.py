@@ -1,6 +1,7 @@
 import logging
 
-from maccabistats.parse.maccabipedia.maccabipedia_parser import MaccabiPediaParser
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabipedia.maccabipedia_parser import MaccabiPediaParser, MaccabiPediaStreamingParser
 from maccabistats.parse.maccabistats_source import MaccabiStatsSource
 from maccabistats.parse.sources import SourcesNames
 
@@ -21,7 +22,10 @@ class MaccabiPediaSource(MaccabiStatsSource):
         Parse the raw data and saves it on self.maccabi_games_stats
         """
 
-        maccabipedia_parser = MaccabiPediaParser()
+        if MaccabiStatsConfigSingleton.maccabipedia.streaming_parse:
+            maccabipedia_parser = MaccabiPediaStreamingParser()
+        else:
+            maccabipedia_parser = MaccabiPediaParser()
         return maccabipedia_parser.parse()
 
     def run_specific_fixes(self):
@@ -2,17 +2,18 @@ import glob
 import logging
 import os
 import pickle
-from datetime import datetime
 from pathlib import Path
 
 from maccabistats.parse.general_fixes import run_general_fixes
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games_store import SerializedGamesStore
 
 logger = logging.getLogger(__name__)
 
 home_folder = Path.home().as_posix()
 serialized_sources_path_pattern = os.path.join(home_folder, "maccabistats", "sources", "{source_name}",
                                                "{source_name}-{version}-{date}.games")
+serialized_sources_store_path_pattern = os.path.join(home_folder, "maccabistats", "sources", "{source_name}", "store")
 
 """
 This class is responsible to set the api for each maccabistats source, the common usage should be :
@@ -32,9 +33,8 @@ class MaccabiStatsSource(object):
         self.maccabi_games_stats = None
 
     @property
-    def _serialized_games_path(self):
-        return serialized_sources_path_pattern.format(source_name=self.name, version=self.maccabi_games_stats.version,
-                                                      date=datetime.now().strftime("%Y-%m-%d %H-%M-%S"))
+    def games_store(self) -> SerializedGamesStore:
+        return SerializedGamesStore(serialized_sources_store_path_pattern.format(source_name=self.name))
 
     @property
     def _serialized_games_path_pattern(self):
@@ -79,7 +79,18 @@ class MaccabiStatsSource(object):
         Load the serialized games to self.maccabi_games_stats
         :return: MaccabiGamesStats
         """
-        last_created_source_games_file = self.find_last_created_source_maccabi_games_file()
+        if self.games_store.exists:
+            newer_source_games_files = [path for path in glob.glob(self._serialized_games_path_pattern)
+                                        if os.path.getctime(path) > self.games_store.last_saved_time]
+            if not newer_source_games_files:
+                logger.info(f"Loading source {self.name} as MaccabiGamesStats from its games store")
+                self.maccabi_games_stats = self.games_store.load()
+                return
+
+            # Serialized by an older maccabistats (or manually) after the last save to the store
+            last_created_source_games_file = max(newer_source_games_files, key=os.path.getctime)
+        else:
+            last_created_source_games_file = self.find_last_created_source_maccabi_games_file()
 
         logger.info(f"Loading source {self.name} as MaccabiGamesStats from: {last_created_source_games_file},"
                     f" This is the last created serialized maccabi games file on this source folder")
@@ -87,6 +98,17 @@ class MaccabiStatsSource(object):
             self.maccabi_games_stats = pickle.load(f)
 
     def find_last_created_source_maccabi_games_file(self) -> str:
+        """
+        Returns a single file with all the source games (pickled MaccabiGamesStats).
+        When the games store exists this is its base snapshot (run compact_games_store first, this method never changes
+        the store), otherwise we fall back to the newest old style .games file.
+        """
+        if self.games_store.exists:
+            if self.games_store.deltas_count > 0:
+                raise RuntimeError(f"The games store of source {self.name} has {self.games_store.deltas_count} deltas "
+                                   f"that are not in its base snapshot, run compact_games_store first")
+            return self.games_store.base_file_path
+
         serialized_source_games = glob.glob(self._serialized_games_path_pattern)
         if not serialized_source_games:
             raise RuntimeError(f"Cant find source serialized games at: {self._serialized_games_path_pattern}")
@@ -94,20 +116,22 @@ class MaccabiStatsSource(object):
         last_created_serialized_maccabi_games_file = max(serialized_source_games, key=os.path.getctime)
         return last_created_serialized_maccabi_games_file
 
-    def serialize_games(self):
+    def compact_games_store(self) -> None:
         """
-        Serialize the parsed games (without any fixes).
+        Merge the source games store deltas to a single base snapshot (see find_last_created_source_maccabi_games_file).
         """
+        if not self.games_store.exists:
+            logger.info(f"Source {self.name} does not have a games store, nothing to compact")
+            return
 
-        source_games_file_path = self._serialized_games_path
-        Path(source_games_file_path).parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Compacting source ({self.name}) games store at: {self.games_store.folder_path}")
+        self.games_store.compact()
 
-        logger.info(f"Serializing source ({self.name} MaccabiGamesStats to: {source_games_file_path})")
-        if os.path.isfile(source_games_file_path):
-            # todo: bkup the old file
-            # old_file_path = Path(self._serialized_games_path)
-            # old_file_path.stem+= int(time())
-            pass
+    def serialize_games(self):
+        """
+        Serialize the parsed games to the source games store, only the games that were changed since the last
+        serialization are written.
+        """
 
-        with open(source_games_file_path, 'wb') as f:
-            pickle.dump(self.maccabi_games_stats, f)
+        logger.info(f"Serializing source ({self.name}) MaccabiGamesStats to: {self.games_store.folder_path}")
+        self.games_store.save(self.maccabi_games_stats)
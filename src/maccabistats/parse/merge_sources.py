@@ -57,7 +57,7 @@ def __merge_two_games(table_game, maccabitlv_site_game):
     :rtype: maccabistats.models.game_data.GameData
     """
 
-    logger.info(f"Merging games at date :{table_game.date}")
+    logger.debug(f"Merging games at date :{table_game.date}")
     __override_general_game_details_from_table(maccabitlv_site_game, table_game)
 
     # TODO - this might be in another function
@@ -76,6 +76,7 @@ def __merge_two_games(table_game, maccabitlv_site_game):
         logger.info(f"Found diff - home team score: {table_game.home_team.score}(table) - {maccabitlv_site_game.home_team.score}(maccabitlv site)")
         maccabitlv_site_game.home_team.score = table_game.home_team.score
 
+    maccabitlv_site_game.refresh_fingerprint()
     return maccabitlv_site_game
 
 
@@ -8,6 +8,7 @@ from maccabistats.parse.maccabi_tlv_site.maccabi_tlv_site_source import MaccabiT
 from maccabistats.parse.maccabipedia.maccabipedia_source import MaccabiPediaSource
 from maccabistats.parse.maccabipedia.maccabipedia_single_file_source import MaccabiPediaSingleFileSource
 from maccabistats.parse.merge_sources import merge_maccabitlv_and_table
+from maccabistats.parse.source_pipeline import SourcePipeline
 from maccabistats.parse.table.table_source import TableSource
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
@@ -33,57 +34,52 @@ def __validate_folders_to_save_maccabi_games_exists():
         os.makedirs(folder_to_save_games)
 
 
-def _run_source(source):
+def _run_source(source, resume: bool = False):
     """
     Run the given maccabi games stats source, serialized the output to the disk and returns the MaccabiGamesStats final object (after fixes).
+    The source runs as stages (see SourcePipeline), stages which their input was not changed since the last run are skipped.
 
     :param source: source instance to run
     :type source: maccabistats.parse.maccabistats_source.MaccabiStatsSource
+    :param resume: Use the parsed games of the last run instead of parsing the source again
     """
 
     logger.info(f"Running source: {source.name}")
     logger.info("Validating setup for source crawling is ready.")
     __validate_folders_to_save_maccabi_games_exists()
 
-    logger.info("Parsing the source: {name}".format(name=source.name))
-    source.parse_maccabi_games()
-    source.run_general_fixes()
-    source.run_specific_fixes()
-
-    logger.info("Loading the source: {name}".format(name=source.name))
-    source.serialize_games()
-
-    return _load_from_source(source)  # Include general fixes
+    # The fixes already ran on the returned games, so we do not load them back from the disk (and fix them again)
+    return SourcePipeline(source, resume=resume).run()
 
 
-def run_maccabitlv_site_source():
+def run_maccabitlv_site_source(resume: bool = False):
     """
     Runs the MaccabiTlv-Site source and serialize its output.
 
     :rtype: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
     """
 
-    return _run_source(MaccabiTlvSiteSource())
+    return _run_source(MaccabiTlvSiteSource(), resume=resume)
 
 
-def run_table_source():
+def run_table_source(resume: bool = False):
     """
     Runs the Table source and serialize its output.
 
     :rtype: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
     """
 
-    return _run_source(TableSource())
+    return _run_source(TableSource(), resume=resume)
 
 
-def run_maccabipedia_source():
+def run_maccabipedia_source(resume: bool = False):
     """
     Runs the MaccabiPedia source and serialize its output.
 
     :rtype: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
     """
 
-    return _run_source(MaccabiPediaSource())
+    return _run_source(MaccabiPediaSource(), resume=resume)
 
 
 def merge_maccabi_games_from_all_input_serialized_sources():
@@ -0,0 +1,185 @@
+"""
+Runs a source as explicit stages: parse -> general fixes -> specific fixes -> serialize.
+
+The output of each stage is saved (as lossless json) to the source pipeline folder, keyed by the stage input hash
+(the games fingerprint & the maccabistats code), so a stage whose input was not changed since the last run is skipped
+and its output is loaded instead. The parse stage input is the remote site, so its output is reused only when resuming
+(for example after a failure in the later stages).
+
+Each run writes a report with the wall time (and the peak memory, when measured) of every stage:
+
+sources/{source_name}/pipeline/
+    parse-{key}.json
+    general_fixes-{key}.json
+    specific_fixes-{key}.json
+    run-report-{date}.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from maccabistats.parse.maccabistats_source import MaccabiStatsSource, home_folder
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.version import version as maccabistats_version
+
+logger = logging.getLogger(__name__)
+
+source_pipeline_folder_path_pattern = os.path.join(home_folder, "maccabistats", "sources", "{source_name}", "pipeline")
+
+_ARTIFACT_FILE_NAME_PATTERN = "{stage_name}-{key}.json"
+_RUN_REPORT_FILE_NAME_PATTERN = "run-report-{date}.json"
+
+
+@dataclass
+class StageReport(object):
+    name: str
+    wall_time_seconds: float
+    peak_memory_bytes: Optional[int]  # None when the memory was not measured
+    games_count: int
+    cached: bool
+    key: Optional[str] = None
+
+
+@dataclass
+class SourcePipelineRunReport(object):
+    source_name: str
+    started_at: str
+    maccabistats_version: str = maccabistats_version
+    stages: List[StageReport] = field(default_factory=list)
+
+    @property
+    def total_wall_time_seconds(self) -> float:
+        return sum(stage.wall_time_seconds for stage in self.stages)
+
+    def __str__(self) -> str:
+        stages_lines = "\n".join(f"   {stage.name}: {stage.wall_time_seconds:.1f}s, "
+                                 f"{_format_peak_memory(stage.peak_memory_bytes)}{stage.games_count} games"
+                                 f"{' (cached)' if stage.cached else ''}" for stage in self.stages)
+        return f"Source {self.source_name} run ({self.total_wall_time_seconds:.1f}s):\n{stages_lines}"
+
+
+def _format_peak_memory(peak_memory_bytes: Optional[int]) -> str:
+    return "" if peak_memory_bytes is None else f"peak memory: {peak_memory_bytes / 2 ** 20:.1f}MB, "
+
+
+@dataclass
+class _Stage(object):
+    name: str
+    run: Callable[[], None]
+    # Whether the stage output can be reused from the last run with the same input
+    cacheable: bool = True
+    # The stage input does not depend on the games (such as parsing), so it is cached only when resuming
+    only_on_resume: bool = False
+
+
+class SourcePipeline(object):
+    def __init__(self, source: MaccabiStatsSource, resume: bool = False, measure_memory: bool = False):
+        """
+        :param resume: Reuse the parsed games of the last run (if there are any) instead of parsing the source again
+        :param measure_memory: Measure each stage peak memory with tracemalloc, off by default as tracing every
+                               allocation slows down the stages a lot
+        """
+        self.source = source
+        self.resume = resume
+        self.measure_memory = measure_memory
+        self.folder_path = Path(source_pipeline_folder_path_pattern.format(source_name=source.name))
+
+        self.stages = [_Stage('parse', source.parse_maccabi_games, only_on_resume=True),
+                       _Stage('general_fixes', source.run_general_fixes),
+                       _Stage('specific_fixes', source.run_specific_fixes),
+                       _Stage('serialize', source.serialize_games, cacheable=False)]
+
+    @property
+    def _code_hash(self) -> str:
+        """
+        Hash of all the maccabistats code (the stages use the models, stats & utilities too, not only the parsing
+        code), a cached stage output is not used after the code was changed.
+        """
+        maccabistats_package_path = Path(__file__).parents[1]
+        code_hash = hashlib.sha1(maccabistats_version.encode('utf-8'))
+        for code_file_path in sorted(maccabistats_package_path.rglob('*.py')):
+            code_hash.update(code_file_path.relative_to(maccabistats_package_path).as_posix().encode('utf-8'))
+            code_hash.update(code_file_path.read_bytes())
+
+        return code_hash.hexdigest()
+
+    def _stage_key(self, stage: _Stage, code_hash: str) -> str:
+        stage_input = "" if stage.only_on_resume else self.source.maccabi_games_stats.fingerprint
+        return hashlib.sha1(f"{self.source.name} {stage.name} {stage_input} {code_hash}".encode('utf-8')).hexdigest()
+
+    def _artifact_path(self, stage: _Stage, key: str) -> Path:
+        return self.folder_path / _ARTIFACT_FILE_NAME_PATTERN.format(stage_name=stage.name, key=key)
+
+    def _save_artifact(self, stage: _Stage, key: str) -> None:
+        for old_artifact_path in self.folder_path.glob(_ARTIFACT_FILE_NAME_PATTERN.format(stage_name=stage.name,
+                                                                                          key='*')):
+            old_artifact_path.unlink()
+
+        self.source.maccabi_games_stats.serialize_to_json(str(self._artifact_path(stage, key)))
+
+    def _run_stage(self, stage: _Stage, code_hash: str) -> StageReport:
+        if self.measure_memory:
+            tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+
+        key = None
+        cached = False
+        if stage.cacheable and (self.resume or not stage.only_on_resume):
+            key = self._stage_key(stage, code_hash)
+            cached = self._artifact_path(stage, key).is_file()
+
+        if cached:
+            logger.info(f"Skipping stage {stage.name} of source {self.source.name}, its input was not changed")
+            self.source.maccabi_games_stats = MaccabiGamesStats.from_json_file(str(self._artifact_path(stage, key)))
+        else:
+            logger.info(f"Running stage {stage.name} of source {self.source.name}")
+            stage.run()
+            # The fixes change the games in place, their cached fingerprints should be calculated again
+            self.source.maccabi_games_stats.refresh_fingerprints()
+
+            if stage.cacheable:
+                key = key or self._stage_key(stage, code_hash)
+                self._save_artifact(stage, key)
+
+        return StageReport(name=stage.name, wall_time_seconds=time.perf_counter() - start_time,
+                           peak_memory_bytes=tracemalloc.get_traced_memory()[1] if self.measure_memory else None,
+                           games_count=len(self.source.maccabi_games_stats), cached=cached, key=key)
+
+    def run(self) -> MaccabiGamesStats:
+        """
+        Run all the stages and write the run report, returns the source games (after the fixes).
+        """
+        self.folder_path.mkdir(parents=True, exist_ok=True)
+        run_report = SourcePipelineRunReport(self.source.name, started_at=datetime.now().isoformat(timespec='seconds'))
+
+        started_tracemalloc = self.measure_memory and not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+
+        try:
+            code_hash = self._code_hash
+            for stage in self.stages:
+                run_report.stages.append(self._run_stage(stage, code_hash))
+        finally:
+            if started_tracemalloc:
+                tracemalloc.stop()
+            self._write_run_report(run_report)
+
+        logger.info(str(run_report))
+        return MaccabiGamesStats(self.source.maccabi_games_stats.games, description=f'Source: {self.source.name}')
+
+    def _write_run_report(self, run_report: SourcePipelineRunReport) -> None:
+        run_report_path = self.folder_path / _RUN_REPORT_FILE_NAME_PATTERN.format(
+            date=datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
+        run_report_path.write_text(json.dumps(asdict(run_report), indent=2, ensure_ascii=False), encoding='utf-8')
+        logger.info(f"Wrote source {self.source.name} run report to: {run_report_path}")
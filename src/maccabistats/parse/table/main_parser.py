@@ -2,7 +2,7 @@
 
 from pathlib import Path
 import json
-from dateutil.parser import parse as datetime_parser
+from maccabistats.date_parsing import parse_date
 from maccabistats.models.game_data import GameData
 from maccabistats.models.team_in_game import TeamInGame
 
@@ -41,7 +41,7 @@ def parse_to_maccabistats_game(jsoned_game):
 
     home_team = TeamInGame(jsoned_game['home_team'], None, jsoned_game['home_team_score'], [])
     away_team = TeamInGame(jsoned_game['away_team'], None, jsoned_game['away_team_score'], [])
-    date = datetime_parser(jsoned_game['date'])
+    date = parse_date(jsoned_game['date'])
     game = GameData("ליגת העל", jsoned_game["fixture"], "", jsoned_game["stadium"], "", jsoned_game["referee"], home_team, away_team,
                     jsoned_game["season"], [], date)
 
@@ -33,3 +33,4 @@ class TableSource(MaccabiStatsSource):
 
         logger.info("Running fix specific games for maccabi-tlv site source")
         self.maccabi_games_stats = fix_specific_games(self.maccabi_games_stats)
+        self.maccabi_games_stats.refresh_fingerprints()
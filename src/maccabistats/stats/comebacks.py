@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The biggest opponent advantage that won_from_any_goal_diff counts as a comeback
+MAX_COMEBACK_GOALS_DISADVANTAGE = 5
+
 
 class MaccabiGamesComebacksStats(object):
     """
@@ -54,15 +57,33 @@ class MaccabiGamesComebacksStats(object):
         return len(self.won_from_any_goal_diff())
 
     def won_from_any_goal_diff(self) -> MaccabiGamesStats:
-        all_comebacks = [self.won_from_exactly_x_goal_diff(1),
-                         self.won_from_exactly_x_goal_diff(2),
-                         self.won_from_exactly_x_goal_diff(3),
-                         self.won_from_exactly_x_goal_diff(4),
-                         self.won_from_exactly_x_goal_diff(5)]
+        all_comebacks = [self.won_from_exactly_x_goal_diff(goals_disadvantage)
+                         for goals_disadvantage in range(1, MAX_COMEBACK_GOALS_DISADVANTAGE + 1)]
 
         return self.maccabi_games_stats.create_maccabi_stats_from_games(list(chain.from_iterable(all_comebacks)))
 
-    def _conditions_for_winning_comeback_occur(self, game: GameData,
+    @classmethod
+    def is_winning_comeback(cls, game: GameData) -> bool:
+        """
+        Whether maccabi won this game after the opponent was ahead (won_from_any_goal_diff has this game).
+        """
+        if not game.is_maccabi_win:
+            return False
+
+        max_opponent_goals_advantage = cls._max_opponent_goals_advantage(game)
+        return -MAX_COMEBACK_GOALS_DISADVANTAGE <= max_opponent_goals_advantage <= -1 and \
+            cls._conditions_for_winning_comeback_occur(game, max_opponent_goals_advantage)
+
+    @classmethod
+    def is_potential_comeback_not_won(cls, game: GameData) -> bool:
+        """
+        Whether the opponent was ahead by 2 goals or more and maccabi did not win this game
+        (games_with_potential_comebacks_that_maccabi_didnt_win has this game).
+        """
+        return cls._max_opponent_goals_advantage(game) < -1 and not game.is_maccabi_win
+
+    @classmethod
+    def _conditions_for_winning_comeback_occur(cls, game: GameData,
                                                winning_comeback_from_x_goals_disadvantage: int) -> bool:
         """
         Check whether the conditions for winning comeback exists in this game:
@@ -73,7 +94,7 @@ class MaccabiGamesComebacksStats(object):
         :param winning_comeback_from_x_goals_disadvantage: the goal diff to come from.
         """
 
-        if not self._max_opponent_goals_advantage(game) == winning_comeback_from_x_goals_disadvantage:
+        if not cls._max_opponent_goals_advantage(game) == winning_comeback_from_x_goals_disadvantage:
             return False
 
         total_score = game.maccabi_team.score + game.not_maccabi_team.score
@@ -122,7 +143,7 @@ class MaccabiGamesComebacksStats(object):
         Return a list of games that Maccabi could have comebacks at
         """
         return self.maccabi_games_stats.create_maccabi_stats_from_games(
-            [game for game in self.games if self._max_opponent_goals_advantage(game) < -1 and not game.is_maccabi_win])
+            [game for game in self.games if self.is_potential_comeback_not_won(game)])
 
     def _conditions_for_tie_comeback_occur(self, game: GameData, tie_comeback_from_x_goals_disadvantage: int) -> bool:
         """
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+import typing
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.team_in_game import TeamInGame
+from maccabistats.stats_utilities.games_ids import index_games_by_id
+
+if TYPE_CHECKING:
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+_GAME_FIELDS = ['competition', 'fixture', '_full_date', 'stadium', 'crowd', 'referee', 'season', 'technical_result']
+_TEAM_FIELDS = ['name', 'current_name', 'coach', 'score']
+
+# (player name, player number, team side, event json_dict items)
+EventKey = Tuple[str, Any, str, Tuple]
+
+
+@dataclass
+class GameDiff(object):
+    """
+    The changes of a single game, the players & events are described like GameData.events (with "team" as the team side).
+    """
+    game_id: str
+    old_game: GameData
+    new_game: GameData
+    # Field name -> (old value, new value), teams fields are prefixed with their side, such as: home_team.coach
+    changed_fields: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    added_players: List[Dict] = field(default_factory=list)
+    removed_players: List[Dict] = field(default_factory=list)
+    added_events: List[Dict] = field(default_factory=list)
+    removed_events: List[Dict] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        lines = [f"{self.game_id}:"]
+        lines.extend(f"    {field_name}: {old_value} --> {new_value}"
+                     for field_name, (old_value, new_value) in self.changed_fields.items())
+        lines.extend(f"    + player: {player}" for player in self.added_players)
+        lines.extend(f"    - player: {player}" for player in self.removed_players)
+        lines.extend(f"    + event: {event}" for event in self.added_events)
+        lines.extend(f"    - event: {event}" for event in self.removed_events)
+
+        return "\n".join(lines)
+
+
+@dataclass
+class MaccabiGamesStatsDiff(object):
+    added_games: List[GameData] = field(default_factory=list)
+    removed_games: List[GameData] = field(default_factory=list)
+    modified_games: List[GameDiff] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added_games or self.removed_games or self.modified_games)
+
+    def __str__(self) -> str:
+        lines = [f"Added games: {len(self.added_games)}, Removed games: {len(self.removed_games)}, "
+                 f"Modified games: {len(self.modified_games)}"]
+        lines.extend(f"+ {game}" for game in self.added_games)
+        lines.extend(f"- {game}" for game in self.removed_games)
+        lines.extend(str(game_diff) for game_diff in self.modified_games)
+
+        return "\n".join(lines)
+
+
+def diff_maccabi_games_stats(old: MaccabiGamesStats, new: MaccabiGamesStats) -> MaccabiGamesStatsDiff:
+    """
+    Find the games that were added, removed or modified from old to new.
+    The games are matched by their game id, only games with a different fingerprint are compared in depth.
+    """
+    old_games_by_id = index_games_by_id(old.games)
+    new_games_by_id = index_games_by_id(new.games)
+
+    games_diff = MaccabiGamesStatsDiff(
+        added_games=[game for game_id, game in new_games_by_id.items() if game_id not in old_games_by_id],
+        removed_games=[game for game_id, game in old_games_by_id.items() if game_id not in new_games_by_id])
+
+    for game_id, new_game in new_games_by_id.items():
+        old_game = old_games_by_id.get(game_id)
+        if old_game is not None and old_game.fingerprint != new_game.fingerprint:
+            games_diff.modified_games.append(diff_games(old_game, new_game, game_id))
+
+    logger.info(f"Found {len(games_diff.added_games)} added games, {len(games_diff.removed_games)} removed games and "
+                f"{len(games_diff.modified_games)} modified games")
+    return games_diff
+
+
+def diff_games(old_game: GameData, new_game: GameData, game_id: Optional[str] = None) -> GameDiff:
+    game_diff = GameDiff(game_id=game_id or new_game.game_id, old_game=old_game, new_game=new_game)
+
+    for field_name in _GAME_FIELDS:
+        old_value, new_value = getattr(old_game, field_name), getattr(new_game, field_name)
+        if old_value != new_value:
+            game_diff.changed_fields[field_name.lstrip('_')] = (old_value, new_value)
+
+    if old_game._half_parsed_events != new_game._half_parsed_events:
+        game_diff.changed_fields['half_parsed_events'] = (old_game._half_parsed_events, new_game._half_parsed_events)
+
+    for team_side in ['home_team', 'away_team']:
+        old_team, new_team = getattr(old_game, team_side), getattr(new_game, team_side)
+        for field_name in _TEAM_FIELDS:
+            old_value, new_value = getattr(old_team, field_name), getattr(new_team, field_name)
+            if old_value != new_value:
+                game_diff.changed_fields[f"{team_side}.{field_name}"] = (old_value, new_value)
+
+        old_players = Counter((player.name, player.number) for player in old_team.players)
+        new_players = Counter((player.name, player.number) for player in new_team.players)
+        game_diff.added_players.extend(dict(name=name, number=number, team=team_side)
+                                       for name, number in (new_players - old_players).elements())
+        game_diff.removed_players.extend(dict(name=name, number=number, team=team_side)
+                                         for name, number in (old_players - new_players).elements())
+
+        old_events, new_events = _team_events(old_team, team_side), _team_events(new_team, team_side)
+        game_diff.added_events.extend(_event_key_as_dict(event) for event in (new_events - old_events).elements())
+        game_diff.removed_events.extend(_event_key_as_dict(event) for event in (old_events - new_events).elements())
+
+    return game_diff
+
+
+def _team_events(team: TeamInGame, team_side: str) -> typing.Counter[EventKey]:
+    return Counter((player.name, player.number, team_side, tuple(event.json_dict().items()))
+                   for player in team.players
+                   for event in player.events)
+
+
+def _event_key_as_dict(event_key: EventKey) -> Dict:
+    name, number, team_side, event_items = event_key
+    return dict(name=name, number=number, **dict(event_items), team=team_side)
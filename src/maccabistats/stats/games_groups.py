@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+from sys import maxsize
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+GroupStats = Tuple[str, float]  # Group name (team, coach, referee...) to the current stat
+
+# The keys the games can be grouped by, each one gets a game and returns the name of its group
+GROUPING_KEYS: Dict[str, Callable[[GameData], str]] = dict(
+    opponent=lambda game: game.not_maccabi_team.current_name,
+    coach=lambda game: game.maccabi_team.coach,
+    referee=lambda game: game.referee,
+    stadium=lambda game: game.stadium,
+    competition=lambda game: game.competition,
+)
+
+
+class GamesGroupResults(object):
+    """
+    The results & goals of one group of games (such as all the games against one opponent), summed game by game.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.games_count = 0
+        self.wins_count = 0
+        self.losses_count = 0
+        self.ties_count = 0
+        self.clean_sheets_count = 0
+        self.total_goals_for_maccabi = 0
+        self.total_goals_against_maccabi = 0
+
+    def add_game(self, game: GameData) -> None:
+        maccabi_score_diff = game.maccabi_score_diff
+
+        self.games_count += 1
+        self.wins_count += maccabi_score_diff > 0
+        self.losses_count += maccabi_score_diff < 0
+        self.ties_count += maccabi_score_diff == 0
+        self.clean_sheets_count += game.not_maccabi_team.score == 0
+        self.total_goals_for_maccabi += game.maccabi_team.score
+        self.total_goals_against_maccabi += game.not_maccabi_team.score
+
+    @property
+    def total_goals_diff_for_maccabi(self) -> int:
+        return self.total_goals_for_maccabi - self.total_goals_against_maccabi
+
+    # The same as MaccabiGamesResultsStats percentages & ratio (rounded to 3 digits after the point)
+
+    def _games_percentage(self, count: int) -> float:
+        if self.games_count == 0:
+            return maxsize
+
+        return round(count / self.games_count, 3)
+
+    @property
+    def wins_percentage(self) -> float:
+        return self._games_percentage(self.wins_count)
+
+    @property
+    def losses_percentage(self) -> float:
+        return self._games_percentage(self.losses_count)
+
+    @property
+    def ties_percentage(self) -> float:
+        return self._games_percentage(self.ties_count)
+
+    @property
+    def clean_sheets_percentage(self) -> float:
+        return self._games_percentage(self.clean_sheets_count)
+
+    @property
+    def goals_ratio(self) -> float:
+        """
+        Goals for maccabi / Goals against maccabi
+        """
+        if self.total_goals_against_maccabi == 0:
+            return maxsize
+
+        return round(self.total_goals_for_maccabi / self.total_goals_against_maccabi, 3)
+
+    def __repr__(self) -> str:
+        return f'{self.name} | {self.games_count} games ({self.wins_count} wins, {self.ties_count} ties, ' \
+               f'{self.losses_count} losses) | goals {self.total_goals_for_maccabi}-{self.total_goals_against_maccabi}'
+
+
+class MaccabiGamesGroupsStats(object):
+    """
+    Groups the games by a key (opponent, coach, referee, stadium, competition) and sums the results of each group,
+    in one pass over the games per key (on its first use).
+    The teams, coaches & referees stats are views over those groups, they sort the groups by one of their stats,
+    the top & minimum games limitations are applied after the groups are summed.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        self.games = maccabi_games_stats.games
+        self._groups_by_key: Dict[str, Dict[str, GamesGroupResults]] = dict()
+
+    def groups(self, grouping_key: str) -> Dict[str, GamesGroupResults]:
+        """
+        :param grouping_key: One of GROUPING_KEYS: opponent, coach, referee, stadium, competition
+        :return: The group name to its results, ordered by the first game of each group
+        """
+        if grouping_key not in GROUPING_KEYS:
+            raise RuntimeError(f"Unknown grouping key: {grouping_key}, the known keys: {list(GROUPING_KEYS)}")
+
+        if grouping_key not in self._groups_by_key:
+            group_name_of_game = GROUPING_KEYS[grouping_key]
+            groups = dict()
+            for game in self.games:
+                group_name = group_name_of_game(game)
+                if group_name not in groups:
+                    groups[group_name] = GamesGroupResults(group_name)
+                groups[group_name].add_game(game)
+            self._groups_by_key[grouping_key] = groups
+
+        return self._groups_by_key[grouping_key]
+
+    def sum_by_group(self, grouping_key: str, game_score_callback: Callable[[GameData], float]) -> Dict[str, float]:
+        """
+        Sum a score which is not part of the groups results (such as the red cards of each game) for every group.
+        :return: The group name to its total score, ordered like the groups
+        """
+        group_name_of_game = GROUPING_KEYS[grouping_key]
+        groups_scores = {group_name: 0 for group_name in self.groups(grouping_key)}
+        for game in self.games:
+            groups_scores[group_name_of_game(game)] += game_score_callback(game)
+
+        return groups_scores
+
+    def sorted_groups(self, grouping_key: str, group_stat: Callable[[GamesGroupResults], float],
+                      top_n: Optional[int] = None, minimum_games: Optional[int] = 0) -> List[GroupStats]:
+        """
+        :param grouping_key: One of GROUPING_KEYS
+        :param group_stat: Gets the results of one group and returns its stat (to sort by)
+        :param top_n: Return only the first top_n groups (all of them when None)
+        :param minimum_games: Ignore the groups with less games than that
+        :return: The groups names and stats, sorted by the stat (desc), like Counter.most_common()
+        """
+        minimum_games = minimum_games or 0
+
+        groups_stats = []
+        for group in self.groups(grouping_key).values():
+            if group.games_count >= minimum_games:
+                groups_stats.append((group.name, group_stat(group)))
+            else:
+                logger.debug(f"Ignoring {group.name} in this calculation, required games length is: {minimum_games}, "
+                             f"group games length: {group.games_count}")
+
+        groups_stats.sort(key=lambda group_stats: group_stats[1], reverse=True)
+        return groups_stats[:top_n]
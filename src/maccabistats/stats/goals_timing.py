@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Tuple, List, Optional
+from typing import TYPE_CHECKING, Tuple, List, Dict, Optional
+
+import numpy as np
 
 from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
 
 if TYPE_CHECKING:
+    from maccabistats.models.team_in_game import TeamInGame
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
-_ZERO_TIME = datetime.strptime("0:00:00", "%H:%M:%S")
 _TOP_GAMES_NUMBER = 5
+_MACCABI_GOALS = 'maccabi'
+_NOT_MACCABI_GOALS = 'not_maccabi'
 
 GameGoalTiming = Tuple[GameData, int]  # The game and the time it took to score the required goals number
 
@@ -17,47 +21,152 @@ GameGoalTiming = Tuple[GameData, int]  # The game and the time it took to score
 class MaccabiGamesGoalsTiming(object):
     """
     This class will handle all goals timing statistics.
+
+    The goals minutes of every game are read once (for maccabi & the opponents), as a games X goals matrix,
+    the fastest goals of every goals number are calculated together from the differences of this matrix columns.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
 
+        self._goals_minutes: Optional[Dict[str, np.ndarray]] = None
+        self._minimum_goals_time_frames: Dict[str, np.ndarray] = dict()
+
     def fastest_two_goals(self, top_games_number=_TOP_GAMES_NUMBER) -> List[GameGoalTiming]:
-        return self._top_games_with_minimum_goals_time_frame(2)[:top_games_number]
+        return self.fastest_x_goals(2, top_games_number)
 
     def fastest_three_goals(self, top_games_number=_TOP_GAMES_NUMBER) -> List[GameGoalTiming]:
-        return self._top_games_with_minimum_goals_time_frame(3)[:top_games_number]
+        return self.fastest_x_goals(3, top_games_number)
 
     def fastest_four_goals(self, top_games_number=_TOP_GAMES_NUMBER) -> List[GameGoalTiming]:
-        return self._top_games_with_minimum_goals_time_frame(4)[:top_games_number]
-
-    def _top_games_with_minimum_goals_time_frame(self, goals_number: int) -> List[GameGoalTiming]:
-        games_with_enough_goals = [game for game in self.maccabi_games_stats if game.maccabi_score >= goals_number]
-
-        games_goals_timings = [(game, _minimum_goals_time_frame_for_a_game(game, goals_number)) for game in
-                               games_with_enough_goals]
-        games_goals_timings_without_errors = [item for item in games_goals_timings if item[1] is not None]
-
-        return sorted(games_goals_timings_without_errors, key=lambda item: item[1])
+        return self.fastest_x_goals(4, top_games_number)
+
+    def fastest_x_goals(self, goals_number: int, top_games_number=_TOP_GAMES_NUMBER) -> List[GameGoalTiming]:
+        """
+        :return: The games maccabi scored goals_number goals at the shortest time frame, with this time frame (minutes)
+        """
+        return self._top_games_with_minimum_goals_time_frame(_MACCABI_GOALS, goals_number)[:top_games_number]
+
+    def fastest_x_goals_conceded(self, goals_number: int, top_games_number=_TOP_GAMES_NUMBER) -> List[GameGoalTiming]:
+        """
+        :return: The games maccabi conceded goals_number goals at the shortest time frame, with this time frame
+        """
+        return self._top_games_with_minimum_goals_time_frame(_NOT_MACCABI_GOALS, goals_number)[:top_games_number]
+
+    def fastest_goals(self, top_games_number=_TOP_GAMES_NUMBER) -> Dict[int, List[GameGoalTiming]]:
+        """
+        :return: The goals number (2 and above) to the games maccabi scored that many goals the fastest
+        """
+        return self._top_games_by_goals_number(_MACCABI_GOALS, top_games_number)
+
+    def fastest_goals_conceded(self, top_games_number=_TOP_GAMES_NUMBER) -> Dict[int, List[GameGoalTiming]]:
+        """
+        :return: The goals number (2 and above) to the games maccabi conceded that many goals the fastest
+        """
+        return self._top_games_by_goals_number(_NOT_MACCABI_GOALS, top_games_number)
+
+    @property
+    def _games_goals_minutes(self) -> Dict[str, np.ndarray]:
+        """
+        The goals minutes of each game (a row), ordered by time and padded with inf, for maccabi & the opponents.
+        """
+        if self._goals_minutes is None:
+            games_goals_minutes = {_MACCABI_GOALS: [], _NOT_MACCABI_GOALS: []}
+            for game in self.games:
+                maccabi_goals_minutes, not_maccabi_goals_minutes = _goals_minutes_for_game(game)
+                games_goals_minutes[_MACCABI_GOALS].append(sorted(maccabi_goals_minutes))
+                games_goals_minutes[_NOT_MACCABI_GOALS].append(sorted(not_maccabi_goals_minutes))
+
+            self._goals_minutes = {goals_side: _pad_games_goals_minutes(goals_minutes)
+                                   for goals_side, goals_minutes in games_goals_minutes.items()}
+
+        return self._goals_minutes
+
+    def _minimum_goals_time_frames_for_all_goals_numbers(self, goals_side: str) -> np.ndarray:
+        """
+        :return: A games X goals number matrix, [game, k] is the minimum minutes between k goals of this game side
+                 (inf when the game has less than k goals), columns 0 & 1 are not used.
+        """
+        if goals_side not in self._minimum_goals_time_frames:
+            goals_minutes = self._games_goals_minutes[goals_side]
+            games_count, max_goals_number = goals_minutes.shape
+
+            minimum_time_frames = np.full((games_count, max_goals_number + 1), np.inf)
+            with np.errstate(invalid='ignore'):  # inf - inf (windows of padding only) is nan, ignored by fmin
+                for goals_number in range(2, max_goals_number + 1):
+                    # The time frame of every goals_number consecutive goals, for all the games at once
+                    windows_count = max_goals_number - goals_number + 1
+                    time_frames = goals_minutes[:, goals_number - 1:] - goals_minutes[:, :windows_count]
+                    minimum_time_frames[:, goals_number] = np.fmin.reduce(time_frames, axis=1)
+
+            minimum_time_frames[np.isnan(minimum_time_frames)] = np.inf
+            self._minimum_goals_time_frames[goals_side] = minimum_time_frames
+
+        return self._minimum_goals_time_frames[goals_side]
+
+    def _top_games_with_minimum_goals_time_frame(self, goals_side: str, goals_number: int) -> List[GameGoalTiming]:
+        minimum_time_frames = self._minimum_goals_time_frames_for_all_goals_numbers(goals_side)
+        if goals_number >= minimum_time_frames.shape[1]:
+            return []
+
+        goals_number_time_frames = minimum_time_frames[:, goals_number]
+        games_scores = np.fromiter((_game_score(game, goals_side) for game in self.games), dtype=int,
+                                   count=len(self.games))
+        # We might miss some data on the actual scorers and time (even if we have the final result)
+        games_with_enough_goals = np.flatnonzero((games_scores >= goals_number) &
+                                                 np.isfinite(goals_number_time_frames))
+
+        games_order = np.argsort(goals_number_time_frames[games_with_enough_goals], kind='stable')
+        return [(self.games[game_index], int(goals_number_time_frames[game_index]))
+                for game_index in games_with_enough_goals[games_order]]
+
+    def _top_games_by_goals_number(self, goals_side: str, top_games_number: int) -> Dict[int, List[GameGoalTiming]]:
+        max_goals_number = self._minimum_goals_time_frames_for_all_goals_numbers(goals_side).shape[1] - 1
+        goals_numbers_top_games = {
+            goals_number: self._top_games_with_minimum_goals_time_frame(goals_side, goals_number)[:top_games_number]
+            for goals_number in range(2, max_goals_number + 1)}
+
+        return {goals_number: top_games for goals_number, top_games in goals_numbers_top_games.items() if top_games}
+
+
+def _game_score(game: GameData, goals_side: str) -> int:
+    return game.maccabi_score if goals_side == _MACCABI_GOALS else game.not_maccabi_team.score
+
+
+def _team_goals_minutes(team: TeamInGame) -> Tuple[List[int], List[int]]:
+    """
+    :return: The minutes of the team goals & own goals
+    """
+    goals_minutes = []
+    own_goals_minutes = []
+    for player in team.players:
+        for goal in player.get_events_by_type(GameEventTypes.GOAL_SCORE):
+            goal_minute = int(goal.time_occur.total_seconds() / 60)
+            if goal.goal_type == GoalTypes.OWN_GOAL:
+                own_goals_minutes.append(goal_minute)
+            else:
+                goals_minutes.append(goal_minute)
 
+    return goals_minutes, own_goals_minutes
 
-def _maccabi_goals_minutes_for_game(goals):
-    minutes = []
 
-    for current_goal in goals:
-        goal_time = datetime.strptime(current_goal['time_occur'], "%H:%M:%S") - _ZERO_TIME
-        minutes.append(int(goal_time.total_seconds() / 60))
+def _goals_minutes_for_game(game: GameData) -> Tuple[List[int], List[int]]:
+    """
+    :return: The minutes of maccabi goals & of the opponent goals, like GameData.maccabi_goals()
+             (each own goal is counted for the other team)
+    """
+    maccabi_goals_minutes, maccabi_own_goals_minutes = _team_goals_minutes(game.maccabi_team)
+    not_maccabi_goals_minutes, not_maccabi_own_goals_minutes = _team_goals_minutes(game.not_maccabi_team)
 
-    return minutes
+    return maccabi_goals_minutes + not_maccabi_own_goals_minutes, not_maccabi_goals_minutes + maccabi_own_goals_minutes
 
 
-def _minimum_goals_time_frame_for_a_game(maccabi_game: GameData, goals_number: int) -> Optional[int]:
-    maccabi_goals_time = _maccabi_goals_minutes_for_game(maccabi_game.maccabi_goals())
+def _pad_games_goals_minutes(games_goals_minutes: List[List[int]]) -> np.ndarray:
+    max_goals_number = max((len(goals_minutes) for goals_minutes in games_goals_minutes), default=0)
 
-    # We might miss some data on the actual scorers and time (even if we have the final result)
-    if len(maccabi_goals_time) < goals_number:
-        return None
+    padded_goals_minutes = np.full((len(games_goals_minutes), max_goals_number), np.inf)
+    for game_index, goals_minutes in enumerate(games_goals_minutes):
+        padded_goals_minutes[game_index, :len(goals_minutes)] = goals_minutes
 
-    return min([maccabi_goals_time[i + goals_number - 1] - maccabi_goals_time[i] for i in
-                range(len(maccabi_goals_time) - goals_number + 1)])
+    return padded_goals_minutes
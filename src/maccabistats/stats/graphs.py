@@ -1,46 +1,140 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from maccabistats.models.player_game_events import GameEventTypes
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-from collections import Counter
+logger = logging.getLogger(__name__)
+
+_RENDERED_CHARTS_CACHE_SIZE = 512
+_MINIMUM_CHARTS_TO_RENDER_WITH_PROCESSES = 8
+
+
+class PlayerChartType(Enum):
+    GOALS_HISTOGRAM = "goals_histogram"  # The player goals by minutes
+    GOALS_BY_THIRDS = "goals_by_thirds"  # The player goals by thirds (0-30, 30-60, 60-90, 90-120)
+
+
+# The games fingerprint, player name, chart type & image format -> the rendered image
+RenderedChartKey = Tuple[str, str, PlayerChartType, str]
+
+
+class _RenderedChartsCache(object):
+    """
+    The last rendered images (LRU), shared by all the games stats (the key starts with the games fingerprint)
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._images: OrderedDict[RenderedChartKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: RenderedChartKey) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._images:
+                return None
+            self._images.move_to_end(key)
+            return self._images[key]
+
+    def set(self, key: RenderedChartKey, image: bytes) -> None:
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_size:
+                self._images.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+
+rendered_charts_cache = _RenderedChartsCache(_RENDERED_CHARTS_CACHE_SIZE)
+
+
+def _render_chart(chart_data: Counter, chart_type: PlayerChartType, image_format: str) -> bytes:
+    """
+    Render the chart without a display (Agg canvas, no pyplot state), so it can run on a server or a worker process.
+    """
+    from matplotlib.figure import Figure  # Importing matplotlib is slow, so we import it only when a graph is drawn
+
+    figure = Figure()
+    axes = figure.subplots()
+    x, y = zip(*sorted(chart_data.items()))
+    if chart_type == PlayerChartType.GOALS_HISTOGRAM:
+        axes.plot(x, y)
+    else:
+        axes.bar(x, y, width=0.5)
+        axes.set_xticks(x)
+
+    image = io.BytesIO()
+    figure.savefig(image, format=image_format)
+    return image.getvalue()
+
+
+def _render_charts_chunk(charts_to_render: List[Tuple[Counter, PlayerChartType, str]]) -> List[bytes]:
+    return [_render_chart(*chart_to_render) for chart_to_render in charts_to_render]
 
 
 class MaccabiGamesGraphsStats(object):
     """
-    This class will handle all the graphs for maccabi games stats
+    This class will handle all the graphs for maccabi games stats.
+
+    The charts can be shown (interactively) or rendered to image bytes (png/svg) without a display,
+    the rendered images are cached by the games fingerprint, so the same chart is rendered once.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
 
+        # The games fingerprint the minutes were collected at, and the minutes of each player
+        self._players_goals_minutes: Optional[Tuple[str, Dict[str, List[int]]]] = None
+
     @staticmethod
     def _show_histogram_of_this_counter(data_counter) -> None:
+        import matplotlib.pyplot as plt  # Importing matplotlib is slow, so we import it only when a graph is shown
+
         x, y = zip(*sorted(data_counter.items()))
         plt.plot(x, y)
         plt.show()
 
     @staticmethod
     def _show_bar_charts_of_this_counter(data_counter) -> None:
+        import matplotlib.pyplot as plt
+
         x, y = zip(*sorted(data_counter.items()))
         plt.bar(x, y, width=0.5)
         plt.xticks(x)
         plt.show()
 
-    def _get_all_goals_minutes_for_player(self, player_name: str):
-        player_goals = [goal for game in self.maccabi_games_stats.games for goal in game.goals() if
-                        goal['name'] == player_name]
-
-        def convert_timedelta_str_to_minutes(t):
-            full_datetime = datetime.strptime(t, "%H:%M:%S")
-            delta = timedelta(hours=full_datetime.hour, minutes=full_datetime.minute)
-            return int(delta.total_seconds() / 60)
-
-        player_goals = [convert_timedelta_str_to_minutes(goal['time_occur']) for goal in player_goals]
+    def _get_all_goals_minutes_for_player(self, player_name: str, games_fingerprint: Optional[str] = None) -> List[int]:
+        """
+        :param games_fingerprint: The current games fingerprint (when the caller already has it)
+        """
+        games_fingerprint = games_fingerprint or self.maccabi_games_stats.fingerprint
+        if self._players_goals_minutes is None or self._players_goals_minutes[0] != games_fingerprint:
+            # All the players goals minutes are collected at once (ordered by the games), on the first use and again
+            # after the games were changed (and their fingerprints were refreshed)
+            players_goals_minutes = dict()
+            for game in self.maccabi_games_stats.games:
+                for player in game.maccabi_team.players:
+                    for goal in player.get_events_by_type(GameEventTypes.GOAL_SCORE):
+                        players_goals_minutes.setdefault(player.name, []).append(
+                            int(goal.time_occur.total_seconds() / 60))
+
+            self._players_goals_minutes = (games_fingerprint, players_goals_minutes)
+
+        player_goals = self._players_goals_minutes[1].get(player_name)
         if not player_goals:
             raise RuntimeError(
                 "Could not find any goals for this player, are you sure this is the player name : {name}?".format(
@@ -48,11 +142,23 @@ class MaccabiGamesGraphsStats(object):
 
         return player_goals
 
-    def goals_distribution_for_player(self, player_name: str) -> Counter:
+    def goals_distribution_for_player(self, player_name: str, games_fingerprint: Optional[str] = None) -> Counter:
         """
         Return ths distribution of the given player goals by minutes
         """
-        return Counter(self._get_all_goals_minutes_for_player(player_name))
+        return Counter(self._get_all_goals_minutes_for_player(player_name, games_fingerprint))
+
+    def goals_by_thirds_for_player(self, player_name: str, games_fingerprint: Optional[str] = None) -> Counter:
+        """
+        Return the given player goals by thirds (0 for 0-30, 1 for 30-60, 2 for 60-90, 3 for 90-120)
+        """
+        return Counter(int(goal_minute / 30) for goal_minute in
+                       self._get_all_goals_minutes_for_player(player_name, games_fingerprint))
+
+    def _player_chart_data(self, player_name: str, chart_type: PlayerChartType, games_fingerprint: str) -> Counter:
+        if chart_type == PlayerChartType.GOALS_HISTOGRAM:
+            return self.goals_distribution_for_player(player_name, games_fingerprint)
+        return self.goals_by_thirds_for_player(player_name, games_fingerprint)
 
     def show_histogram_for_player_goals(self, player_name) -> Counter:
         goals = self.goals_distribution_for_player(player_name)
@@ -64,10 +170,78 @@ class MaccabiGamesGraphsStats(object):
         """
         Show bar charts of player goals by thirds (0-30, 30-60, 60-90, 90-120)
         """
-
-        all_goals_by_thirds = [int(goal_minute / 30) for goal_minute in
-                               self._get_all_goals_minutes_for_player(player_name)]
-        goals_by_thirds = Counter(all_goals_by_thirds)
+        goals_by_thirds = self.goals_by_thirds_for_player(player_name)
 
         self._show_bar_charts_of_this_counter(goals_by_thirds)
         return goals_by_thirds
+
+    # region Rendering charts to images
+
+    def render_player_chart(self, player_name: str, chart_type: PlayerChartType = PlayerChartType.GOALS_HISTOGRAM,
+                            image_format: str = 'png') -> bytes:
+        """
+        :param chart_type: Such as PlayerChartType.GOALS_BY_THIRDS
+        :param image_format: png or svg (any format matplotlib can save)
+        :return: The chart image (cached for these games)
+        """
+        return self.render_players_charts([player_name], chart_type, image_format, processes_count=1)[player_name]
+
+    def render_histogram_for_player_goals(self, player_name: str, image_format: str = 'png') -> bytes:
+        return self.render_player_chart(player_name, PlayerChartType.GOALS_HISTOGRAM, image_format)
+
+    def render_bar_chart_for_player_goals_by_thirds(self, player_name: str, image_format: str = 'png') -> bytes:
+        return self.render_player_chart(player_name, PlayerChartType.GOALS_BY_THIRDS, image_format)
+
+    def render_players_charts(self, players_names: Iterable[str],
+                              chart_type: PlayerChartType = PlayerChartType.GOALS_HISTOGRAM,
+                              image_format: str = 'png', processes_count: Optional[int] = None) -> Dict[str, bytes]:
+        """
+        Render the chart of many players, the charts that are not cached are rendered over a pool of processes.
+
+        :param processes_count: The number of rendering processes, 1 renders in this process, defaults to the CPUs count
+        :return: Player name -> the chart image, ordered like players_names
+        """
+        # The chart data is collected under the same fingerprint as the cache key, so a chart of changed games
+        # (with refreshed fingerprints) is never cached with the minutes of the old games
+        games_fingerprint = self.maccabi_games_stats.fingerprint
+        players_images: Dict[str, Optional[bytes]] = dict()
+        charts_to_render: Dict[str, Tuple[Counter, PlayerChartType, str]] = dict()
+        for player_name in players_names:
+            players_images[player_name] = rendered_charts_cache.get(
+                (games_fingerprint, player_name, chart_type, image_format))
+            if players_images[player_name] is None:
+                # Raises for unknown players before rendering any of the charts
+                charts_to_render[player_name] = (self._player_chart_data(player_name, chart_type, games_fingerprint),
+                                                 chart_type, image_format)
+
+        processes_count = processes_count or os.cpu_count() or 1
+        rendered_images = None
+        # Starting the processes is not worth it for a few charts
+        if processes_count > 1 and len(charts_to_render) >= _MINIMUM_CHARTS_TO_RENDER_WITH_PROCESSES:
+            try:
+                rendered_images = self._render_charts_with_processes(list(charts_to_render.values()),
+                                                                     processes_count)
+            except (OSError, BrokenProcessPool):
+                logger.exception("Could not render the charts with processes, rendering them in this process")
+
+        if rendered_images is None:
+            rendered_images = _render_charts_chunk(list(charts_to_render.values()))
+
+        for player_name, rendered_image in zip(charts_to_render, rendered_images):
+            rendered_charts_cache.set((games_fingerprint, player_name, chart_type, image_format), rendered_image)
+            players_images[player_name] = rendered_image
+
+        return players_images
+
+    @staticmethod
+    def _render_charts_with_processes(charts_to_render: List[Tuple[Counter, PlayerChartType, str]],
+                                      processes_count: int) -> List[bytes]:
+        chunk_size = -(-len(charts_to_render) // processes_count)  # Ceil, so each process gets one chunk
+        chunks = [charts_to_render[index: index + chunk_size] for index in range(0, len(charts_to_render), chunk_size)]
+        logger.info(f"Rendering {len(charts_to_render)} charts with {processes_count} processes")
+
+        with ProcessPoolExecutor(max_workers=processes_count) as executor:
+            # map keeps the chunks order, so each image gets back to its player
+            return [image for images_chunk in executor.map(_render_charts_chunk, chunks) for image in images_chunk]
+
+    # endregion
@@ -1,25 +1,114 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from maccabistats.models.player_game_events import GoalTypes
+import numpy as np
+
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
-from datetime import timedelta
 from collections import Counter
 
+GoalCondition = Callable[[Dict], bool]  # Gets a goal of GameData.goals() and returns whether to count it
+
+
+class MaccabiGoalsTable(NamedTuple):
+    """
+    The maccabi goals (without own goals) of the games, a row for each goal (ordered by game & time),
+    the score diffs are maccabi goals minus the opponent goals (before & after the goal).
+    """
+    scorers_names: List[str]  # Ordered like players.best_scorers ranks the players with the same goals
+    scorer_ids: np.ndarray  # Index of the scorer name at scorers_names
+    minutes: np.ndarray
+    score_diff_before: np.ndarray
+    score_diff_after: np.ndarray
+    game_ids: np.ndarray  # Index of the game at the games
+
 
 class MaccabiGamesImportantGoalsStats(object):
     """
     This class will handle all important goals statistics.
+
+    The maccabi goals are built once as a table (scorer, minute, score diffs and game) from the players events,
+    every important goals question is a filter over the table columns and a count of the goals of each scorer.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
 
+        self._goals_table: Optional[MaccabiGoalsTable] = None
+
+    @property
+    def goals_table(self) -> MaccabiGoalsTable:
+        if self._goals_table is None:
+            self._goals_table = self._build_goals_table()
+
+        return self._goals_table
+
+    def _build_goals_table(self) -> MaccabiGoalsTable:
+        scorers_ids: Dict[str, int] = dict()
+        scorer_ids, minutes, score_diff_before, score_diff_after, game_ids = [], [], [], [], []
+
+        for game_id, game in enumerate(self.games):
+            # Like GameData.goals(): ordered by time (maccabi players first at the same time), own goals are counted
+            # for the other team
+            game_goals = [(goal.time_occur, player.name, goal.goal_type != GoalTypes.OWN_GOAL, True)
+                          for player in game.maccabi_team.players
+                          for goal in player.get_events_by_type(GameEventTypes.GOAL_SCORE)]
+            game_goals.extend((goal.time_occur, player.name, goal.goal_type == GoalTypes.OWN_GOAL, False)
+                              for player in game.not_maccabi_team.players
+                              for goal in player.get_events_by_type(GameEventTypes.GOAL_SCORE))
+
+            # The scorers ids are given by the players order (the same order players.best_scorers counts them)
+            for _, player_name, maccabi_goal, maccabi_player in game_goals:
+                if maccabi_goal and maccabi_player and player_name not in scorers_ids:
+                    scorers_ids[player_name] = len(scorers_ids)
+
+            score_diff = 0
+            for time_occur, player_name, maccabi_goal, maccabi_player in sorted(game_goals, key=lambda goal: goal[0]):
+                score_diff += 1 if maccabi_goal else -1
+                if maccabi_goal and maccabi_player:
+                    scorer_ids.append(scorers_ids[player_name])
+                    minutes.append(time_occur.total_seconds() / 60)
+                    score_diff_before.append(score_diff - 1)
+                    score_diff_after.append(score_diff)
+                    game_ids.append(game_id)
+
+        return MaccabiGoalsTable(scorers_names=list(scorers_ids), scorer_ids=np.array(scorer_ids, dtype=int),
+                                 minutes=np.array(minutes, dtype=float),
+                                 score_diff_before=np.array(score_diff_before, dtype=int),
+                                 score_diff_after=np.array(score_diff_after, dtype=int),
+                                 game_ids=np.array(game_ids, dtype=int))
+
+    def _important_goals_mask(self, minimum_diff_for_maccabi: int, maximum_diff_for_maccabi: int,
+                              from_minute: Optional[float] = None,
+                              goal_condition: Optional[GoalCondition] = None) -> np.ndarray:
+        goals_table = self.goals_table
+
+        important_goals = (minimum_diff_for_maccabi <= goals_table.score_diff_after) & \
+                          (goals_table.score_diff_after <= maximum_diff_for_maccabi)
+        if from_minute is not None:
+            important_goals &= goals_table.minutes > from_minute
+        if goal_condition is not None:
+            # A custom condition gets the goals as GameData.goals() returns them, ordered like the table rows
+            important_goals &= np.array([goal_condition(goal) for game in self.games for goal in game.goals()
+                                         if goal['team'] == game.maccabi_team.name and
+                                         goal['goal_type'] != GoalTypes.OWN_GOAL.value], dtype=bool)
+
+        return important_goals
+
+    def _scorers_goals_count(self, goals_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        :return: The goals count of each scorer (by the scorer id), of the goals in the mask (all the goals if None)
+        """
+        goals_table = self.goals_table
+        scorer_ids = goals_table.scorer_ids if goals_mask is None else goals_table.scorer_ids[goals_mask]
+
+        return np.bincount(scorer_ids, minlength=len(goals_table.scorers_names))
+
     def get_top_scorers_for_advantage(self):
         """
         Get all players who score goal that made maccabi the lead team AFTER the goal was scored.
@@ -28,31 +117,58 @@ class MaccabiGamesImportantGoalsStats(object):
         return self.get_top_scorers(1, 1)
 
     def get_top_scorers(self, minimum_diff_for_maccabi: int = -2, maximum_diff_for_maccabi: int = 1,
-                        goal_condition=None) -> List[Tuple[str, float]]:
-        if goal_condition is None:
-            goal_condition = lambda x: True
+                        goal_condition: Optional[GoalCondition] = None,
+                        from_minute: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        :param goal_condition: A custom condition on the goals (as GameData.goals() returns them), slower than the
+                               other filters
+        :param from_minute: Count only the goals after this minute
+        :return: The players and their important goals (maccabi score diff after the goal is in the given range),
+                 like Counter.most_common()
+        """
+        goals_table = self.goals_table
+        important_scorer_ids = goals_table.scorer_ids[self._important_goals_mask(
+            minimum_diff_for_maccabi, maximum_diff_for_maccabi, from_minute, goal_condition)]
+
+        # Counter.most_common() ranks the players with the same goals by their first counted goal
+        scorer_ids, first_goals_positions, goals_counts = np.unique(important_scorer_ids, return_index=True,
+                                                                    return_counts=True)
+        scorers_order = np.lexsort((first_goals_positions, -goals_counts))
+        return [(goals_table.scorers_names[scorer_ids[scorer_index]], int(goals_counts[scorer_index]))
+                for scorer_index in scorers_order]
+
+    def _players_total_goals(self) -> Counter:
+        """
+        Like players.best_scorers (from the goals table)
+        """
+        scorers_goals_count = self._scorers_goals_count()
+        scorers_order = np.lexsort((np.arange(len(scorers_goals_count)), -scorers_goals_count))
+
+        return Counter({self.goals_table.scorers_names[scorer_id]: int(scorers_goals_count[scorer_id])
+                        for scorer_id in scorers_order})
 
-        maccabi_goals = [goal for game in self.games for goal in game.goals() if
-                         goal['team'] == "מכבי תל אביב" and goal['goal_type'] != GoalTypes.OWN_GOAL.value]
-        maccabi_important_goals = [
-            goal for goal in maccabi_goals if
-            (minimum_diff_for_maccabi <= goal['maccabi_score'] - goal['not_maccabi_score'] <= maximum_diff_for_maccabi)
-            and goal_condition(goal)]
+    def _players_total_played(self) -> Counter:
+        """
+        Like players.most_played (from the players occurrences index)
+        """
+        players_occurrences = self.maccabi_games_stats.players_occurrences
+        players_played = Counter({player_name: len(players_occurrences.player_played_games(player_name))
+                                  for player_name in players_occurrences.players_names})
 
-        important_goals_scorers_names = [goal['name'] for goal in maccabi_important_goals]
-        return Counter(important_goals_scorers_names).most_common()
+        return Counter(dict(players_played.most_common()))
 
     def get_top_scorers_by_percentage_from_all_their_goals(
             self, minimum_diff_for_maccabi: int = -2, maximum_diff_for_maccabi: int = 1,
-            minimum_important_goals: int = 10, goal_condition=None) -> List[Tuple[str, float]]:
+            minimum_important_goals: int = 10, goal_condition: Optional[GoalCondition] = None,
+            from_minute: Optional[float] = None) -> List[Tuple[str, float]]:
         """
-        Return the important goals percentage for each player from his total goals.
+        Return the important goals percentage for each player from the player total goals.
         Only for those who scored at least (minimum_important_goals).
         """
-        players_total_goals = Counter(dict(self.maccabi_games_stats.players.best_scorers))
+        players_total_goals = self._players_total_goals()
         players_important_goals = Counter(
             dict(self.get_top_scorers(minimum_diff_for_maccabi, maximum_diff_for_maccabi,
-                                      goal_condition=goal_condition)))
+                                      goal_condition=goal_condition, from_minute=from_minute)))
 
         best_players = Counter()
         for player_name, total_goals_for_player in players_total_goals.items():
@@ -64,14 +180,15 @@ class MaccabiGamesImportantGoalsStats(object):
         return best_players.most_common()
 
     def get_top_players_for_goals_per_game(self, minimum_diff_for_maccabi: int = -2, maximum_diff_for_maccabi: int = 1,
-                                           minimum_games: int = 10, goal_condition=None) -> List[Tuple[str, float]]:
+                                           minimum_games: int = 10, goal_condition: Optional[GoalCondition] = None,
+                                           from_minute: Optional[float] = None) -> List[Tuple[str, float]]:
         """
         Return the important goals per game for each player, only for those who played at least (minimum_games).
         """
-        players_total_played = Counter(dict(self.maccabi_games_stats.players.most_played))
+        players_total_played = self._players_total_played()
         players_important_goals = Counter(
             dict(self.get_top_scorers(minimum_diff_for_maccabi, maximum_diff_for_maccabi,
-                                      goal_condition=goal_condition)))
+                                      goal_condition=goal_condition, from_minute=from_minute)))
 
         best_players = Counter()
         for player_name, total_games_for_player in players_total_played.items():
@@ -83,21 +200,20 @@ class MaccabiGamesImportantGoalsStats(object):
         return best_players.most_common()
 
     def get_top_scorers_in_last_minutes(self, minimum_diff_for_maccabi=-2, maximum_diff_for_maccabi=1, from_minute=75):
-        return self.get_top_scorers(minimum_diff_for_maccabi, maximum_diff_for_maccabi,
-                                    lambda g: g['time_occur'] > str(timedelta(minutes=from_minute)))
+        return self.get_top_scorers(minimum_diff_for_maccabi, maximum_diff_for_maccabi, from_minute=from_minute)
 
     def get_top_scorers_in_last_minutes_by_percentage_from_all_their_goals(
             self, minimum_diff_for_maccabi: int = -2, maximum_diff_for_maccabi: int = 1,
             from_minute: int = 75, minimum_important_goals: int = 10) -> List[Tuple[str, float]]:
         """
-        Return the important goals percentage (in the last minutes) for each player from his total goals,
+        Return the important goals percentage (in the last minutes) for each player from the player total goals,
         Only for those who scored at least (minimum_important_goals).
         """
         return self.get_top_scorers_by_percentage_from_all_their_goals(
             minimum_diff_for_maccabi=minimum_diff_for_maccabi,
             maximum_diff_for_maccabi=maximum_diff_for_maccabi,
             minimum_important_goals=minimum_important_goals,
-            goal_condition=lambda g: g['time_occur'] > str(timedelta(minutes=from_minute)))
+            from_minute=from_minute)
 
     def get_top_players_for_goals_in_last_minutes_per_game(self, minimum_diff_for_maccabi: int = -2,
                                                            maximum_diff_for_maccabi: int = 1, minimum_games: int = 10,
@@ -108,5 +224,4 @@ class MaccabiGamesImportantGoalsStats(object):
         return self.get_top_players_for_goals_per_game(minimum_diff_for_maccabi=minimum_diff_for_maccabi,
                                                        maximum_diff_for_maccabi=maximum_diff_for_maccabi,
                                                        minimum_games=minimum_games,
-                                                       goal_condition=lambda g: g['time_occur'] > str(
-                                                           timedelta(minutes=from_minute)))
+                                                       from_minute=from_minute)
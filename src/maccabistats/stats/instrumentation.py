@@ -0,0 +1,260 @@
+"""
+Opt-in instrumentation of the stats helpers (MaccabiGamesStats.players, .streaks, .seasons and so on) and of the
+MaccabiGamesStats filters, without changing them.
+
+When enabled, every public method & property of these classes is wrapped, and for each one we record:
+calls count, total (inclusive) wall time, own wall time and the memory it left allocated (using tracemalloc).
+
+Enable it with a context manager:
+    with StatsInstrumentation() as instrumentation:
+        maccabi_games_stats.players.best_scorers
+    instrumentation.to_json('report.json')  # Or: instrumentation.dump_stats('stats.prof'), readable by pstats
+
+Or for a whole process, set MACCABISTATS_INSTRUMENTATION to a file path, the report is written there on exit
+(a pstats dump when the path ends with .prof/.pstats, otherwise a json report).
+"""
+from __future__ import annotations
+
+import atexit
+import inspect
+import json
+import logging
+import marshal
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Tuple, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTATION_ENV_VAR = 'MACCABISTATS_INSTRUMENTATION'
+_PSTATS_FILES_SUFFIXES = ('.prof', '.pstats')
+
+# pstats identifies a function by (file name, line number, function name)
+_FunctionKey = Tuple[str, int, str]
+
+
+@dataclass
+class InstrumentedCallStats:
+    name: str
+    calls: int = 0
+    primitive_calls: int = 0  # Calls which are not recursive, as cProfile counts them
+    total_seconds: float = 0
+    own_seconds: float = 0
+    allocated_bytes: int = 0
+    callers: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _ActiveCall:
+    name: str
+    start_time: float
+    start_memory: int
+    children_seconds: float = 0
+
+
+def _instrumented_classes() -> List[type]:
+    """
+    MaccabiGamesStats and all the stats helpers it holds (every class it imports from maccabistats.stats).
+    """
+    from maccabistats.stats import maccabi_games_stats
+
+    return [value for value in vars(maccabi_games_stats).values()
+            if inspect.isclass(value) and value.__module__.startswith('maccabistats.stats.')]
+
+
+class StatsInstrumentation(object):
+    """
+    Only one instrumentation can be enabled at a time, the stats classes are patched while it is enabled.
+    The calls of all the threads are recorded, each thread has its own calls stack (callers & own time), only
+    the allocations are measured for the whole process.
+    """
+    _enabled_instrumentation: Optional[StatsInstrumentation] = None
+
+    def __init__(self, trace_allocations: bool = True):
+        """
+        :param trace_allocations: Measure allocations with tracemalloc, this slows down the instrumented code.
+        """
+        self.trace_allocations = trace_allocations
+        self.calls_stats: Dict[str, InstrumentedCallStats] = dict()
+
+        self._functions_keys: Dict[str, _FunctionKey] = dict()
+        self._threads_calls = threading.local()
+        self._calls_stats_lock = threading.Lock()
+        self._patched_attributes: List[Tuple[type, str, object]] = []
+        self._started_tracemalloc = False
+
+    # region enable & disable
+
+    def enable(self) -> None:
+        if StatsInstrumentation._enabled_instrumentation is not None:
+            raise RuntimeError("Stats instrumentation is already enabled, disable it before enabling another one")
+
+        for instrumented_class in _instrumented_classes():
+            self._patch_class(instrumented_class)
+
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        StatsInstrumentation._enabled_instrumentation = self
+        logger.info(f"Enabled stats instrumentation, patched {len(self._patched_attributes)} methods & properties")
+
+    def disable(self) -> None:
+        for instrumented_class, attribute_name, original_attribute in reversed(self._patched_attributes):
+            setattr(instrumented_class, attribute_name, original_attribute)
+        self._patched_attributes = []
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        if StatsInstrumentation._enabled_instrumentation is self:
+            StatsInstrumentation._enabled_instrumentation = None
+
+    def __enter__(self) -> StatsInstrumentation:
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.disable()
+
+    def _patch_class(self, instrumented_class: type) -> None:
+        for attribute_name, attribute in list(vars(instrumented_class).items()):
+            if attribute_name.startswith('_'):
+                continue
+
+            name = f"{instrumented_class.__name__}.{attribute_name}"
+            if isinstance(attribute, property) and attribute.fget is not None:
+                patched_attribute = property(self._wrap(name, attribute.fget), attribute.fset, attribute.fdel,
+                                             attribute.__doc__)
+            elif isinstance(attribute, staticmethod):
+                patched_attribute = staticmethod(self._wrap(name, attribute.__func__))
+            elif isinstance(attribute, classmethod):
+                patched_attribute = classmethod(self._wrap(name, attribute.__func__))
+            elif inspect.isfunction(attribute):
+                patched_attribute = self._wrap(name, attribute)
+            else:
+                continue
+
+            self._patched_attributes.append((instrumented_class, attribute_name, attribute))
+            setattr(instrumented_class, attribute_name, patched_attribute)
+
+    # endregion
+
+    # region recording
+
+    @property
+    def _active_calls(self) -> List[_ActiveCall]:
+        # The calls stack of the current thread
+        if not hasattr(self._threads_calls, 'active_calls'):
+            self._threads_calls.active_calls = []
+
+        return self._threads_calls.active_calls
+
+    def _wrap(self, name: str, function: Callable) -> Callable:
+        code = getattr(function, '__code__', None)
+        self._functions_keys[name] = (code.co_filename, code.co_firstlineno, name) if code else ('~', 0, name)
+
+        def instrumented(*args, **kwargs):
+            self._start_call(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._end_call()
+
+        instrumented.__name__ = function.__name__
+        instrumented.__qualname__ = function.__qualname__
+        instrumented.__doc__ = function.__doc__
+        instrumented.__wrapped__ = function
+        return instrumented
+
+    def _start_call(self, name: str) -> None:
+        start_memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        self._active_calls.append(_ActiveCall(name, time.perf_counter(), start_memory))
+
+    def _end_call(self) -> None:
+        active_calls = self._active_calls
+        active_call = active_calls.pop()
+        elapsed_seconds = time.perf_counter() - active_call.start_time
+        allocated_bytes = tracemalloc.get_traced_memory()[0] - active_call.start_memory \
+            if tracemalloc.is_tracing() else 0
+        is_recursive = any(outer_call.name == active_call.name for outer_call in active_calls)
+        caller = active_calls[-1] if active_calls else None
+        if caller is not None:
+            caller.children_seconds += elapsed_seconds
+
+        with self._calls_stats_lock:
+            call_stats = self.calls_stats.get(active_call.name)
+            if call_stats is None:
+                call_stats = self.calls_stats[active_call.name] = InstrumentedCallStats(active_call.name)
+
+            call_stats.calls += 1
+            call_stats.own_seconds += elapsed_seconds - active_call.children_seconds
+            if not is_recursive:
+                # Like cProfile, the total time of a recursive call is already counted by its outer call
+                call_stats.primitive_calls += 1
+                call_stats.total_seconds += elapsed_seconds
+                call_stats.allocated_bytes += allocated_bytes
+
+            if caller is not None:
+                call_stats.callers[caller.name] = call_stats.callers.get(caller.name, 0) + 1
+
+    # endregion
+
+    # region reports
+
+    def report(self) -> List[InstrumentedCallStats]:
+        """
+        The recorded stats, the slowest (by total time) first.
+        """
+        with self._calls_stats_lock:
+            return sorted(self.calls_stats.values(), key=lambda call_stats: call_stats.total_seconds, reverse=True)
+
+    def to_json(self, file_path: str) -> None:
+        with open(file_path, 'w', encoding='utf-8') as report_file:
+            json.dump(dict(calls=[asdict(call_stats) for call_stats in self.report()]), report_file,
+                      ensure_ascii=False, indent=2)
+
+    def dump_stats(self, file_path: str) -> None:
+        """
+        Write the stats in cProfile dump format, so they can be loaded with pstats.Stats(file_path) (or snakeviz).
+        The callers entries hold only the calls count, the time spent per caller is not recorded.
+        """
+        pstats_dump = dict()
+        for call_stats in self.report():
+            callers = {self._functions_keys[caller_name]: (calls, calls, 0.0, 0.0)
+                       for caller_name, calls in call_stats.callers.items()}
+            pstats_dump[self._functions_keys[call_stats.name]] = (call_stats.primitive_calls, call_stats.calls,
+                                                                  call_stats.own_seconds, call_stats.total_seconds,
+                                                                  callers)
+
+        with open(file_path, 'wb') as dump_file:
+            marshal.dump(pstats_dump, dump_file)
+
+    def save(self, file_path: str) -> None:
+        if file_path.endswith(_PSTATS_FILES_SUFFIXES):
+            self.dump_stats(file_path)
+        else:
+            self.to_json(file_path)
+
+        logger.info(f"Saved stats instrumentation report to: {file_path}")
+
+    # endregion
+
+
+def enable_instrumentation_from_environment() -> Optional[StatsInstrumentation]:
+    """
+    Enable the instrumentation for the whole process when MACCABISTATS_INSTRUMENTATION is set (to the report path).
+    """
+    report_path = os.environ.get(INSTRUMENTATION_ENV_VAR)
+    if not report_path or StatsInstrumentation._enabled_instrumentation is not None:
+        return None
+
+    instrumentation = StatsInstrumentation()
+    instrumentation.enable()
+    atexit.register(instrumentation.save, report_path)
+
+    return instrumentation
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from maccabistats.stats.consts import LEAGUE_COMPETITIONS
+from maccabistats.stats_utilities.points_calculator import possible_points_for_game, points_for_game
+
+if TYPE_CHECKING:
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+FixturePoints = Tuple[Optional[int], int]  # League fixture (None when unknown) to the season points after it
+
+
+class MaccabiGamesLeaguePointsStats(object):
+    """
+    This class will handle the league points of the games (2 or 3 points for a win, by the game date).
+
+    The points & possible points of each game are calculated once, with their prefix sums,
+    so the points (and success rate) of any contiguous range of games is calculated at O(1).
+
+    The games are treated as immutable once this object is created: the prefix sums & the competitions check are
+    cached on the first use and never invalidated, create a new MaccabiGamesStats for changed games.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        self.maccabi_games_stats = maccabi_games_stats
+        self.games = maccabi_games_stats.games
+
+        # Cached on the first use, for the games as they are at that time (see the class docstring)
+        self._non_league_competitions: Optional[List[str]] = None
+        self._points_prefix_sums: Optional[List[int]] = None
+        self._possible_points_prefix_sums: Optional[List[int]] = None
+
+    def _validate_league_games(self, calculation_description: str) -> None:
+        if self._non_league_competitions is None:
+            self._non_league_competitions = [competition for competition in
+                                             self.maccabi_games_stats.available_competitions
+                                             if competition not in LEAGUE_COMPETITIONS]
+
+        if self._non_league_competitions:
+            raise TypeError(f'{calculation_description} supported only for league games, '
+                            f'current competitions: {self.maccabi_games_stats.available_competitions}')
+
+    @property
+    def points_prefix_sums(self) -> List[int]:
+        """
+        points_prefix_sums[i] is the points of the first i games
+        """
+        self._validate_league_games('Calculating points is')
+        if self._points_prefix_sums is None:
+            self._points_prefix_sums = list(accumulate((points_for_game(game) for game in self.games), initial=0))
+
+        return self._points_prefix_sums
+
+    @property
+    def possible_points_prefix_sums(self) -> List[int]:
+        """
+        possible_points_prefix_sums[i] is the possible points of the first i games
+        """
+        self._validate_league_games('Calculating possible points is')
+        if self._possible_points_prefix_sums is None:
+            self._possible_points_prefix_sums = list(
+                accumulate((possible_points_for_game(game) for game in self.games), initial=0))
+
+        return self._possible_points_prefix_sums
+
+    def points_between(self, start_game_index: int = 0, end_game_index: Optional[int] = None) -> int:
+        """
+        The points of games[start_game_index:end_game_index] (the games are ordered by date)
+        """
+        start_game_index, end_game_index, _ = slice(start_game_index, end_game_index).indices(len(self.games))
+        return self.points_prefix_sums[end_game_index] - self.points_prefix_sums[start_game_index]
+
+    def possible_points_between(self, start_game_index: int = 0, end_game_index: Optional[int] = None) -> int:
+        """
+        The possible points of games[start_game_index:end_game_index] (the games are ordered by date)
+        """
+        start_game_index, end_game_index, _ = slice(start_game_index, end_game_index).indices(len(self.games))
+        return self.possible_points_prefix_sums[end_game_index] - self.possible_points_prefix_sums[start_game_index]
+
+    def success_rate_between(self, start_game_index: int = 0, end_game_index: Optional[int] = None) -> float:
+        """
+        Points / possible points of games[start_game_index:end_game_index]
+        """
+        self._validate_league_games('Calculating success rate')
+        return round(self.points_between(start_game_index, end_game_index) /
+                     self.possible_points_between(start_game_index, end_game_index), 3)
+
+    @property
+    def total_points(self) -> int:
+        return self.points_between()
+
+    @property
+    def success_rate(self) -> float:
+        return self.success_rate_between()
+
+    def rolling_points(self, games_count: int = 5) -> List[int]:
+        """
+        The form of maccabi - the points of each games_count consecutive games,
+        the first item is the points of the first games_count games, the last is the points of the last games.
+        """
+        points_prefix_sums = self.points_prefix_sums
+        return [points_prefix_sums[end_game_index] - points_prefix_sums[end_game_index - games_count]
+                for end_game_index in range(games_count, len(self.games) + 1)]
+
+    def rolling_success_rate(self, games_count: int = 5) -> List[float]:
+        """
+        Like rolling_points, as points / possible points of each games_count consecutive games
+        """
+        return [self.success_rate_between(end_game_index - games_count, end_game_index)
+                for end_game_index in range(games_count, len(self.games) + 1)]
+
+    def seasons_points_progression(self) -> Dict[str, List[FixturePoints]]:
+        """
+        The points maccabi had after each fixture of every season,
+        the games without a known fixture are counted after the known fixtures (by their date).
+        """
+        self._validate_league_games('Calculating points is')
+
+        seasons_games_points: Dict[str, List[Tuple[Optional[int], int]]] = defaultdict(list)
+        for game_index, game in enumerate(self.games):
+            seasons_games_points[game.season].append(
+                (game.league_fixture, self.points_prefix_sums[game_index + 1] - self.points_prefix_sums[game_index]))
+
+        seasons_progression = dict()
+        for season, games_points in seasons_games_points.items():
+            games_points.sort(key=lambda game_points: (game_points[0] is None, game_points[0] or 0))
+            season_points = accumulate(game_points for _, game_points in games_points)
+            seasons_progression[season] = [(fixture, points)
+                                           for (fixture, _), points in zip(games_points, season_points)]
+
+        return seasons_progression
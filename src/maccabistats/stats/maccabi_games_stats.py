@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import json
 import logging
 from collections import defaultdict
 from tempfile import NamedTemporaryFile
-from typing import List, Union, Dict, Any, DefaultDict
-
-from dateutil.parser import parse as datetime_parser
+from typing import List, Union, Dict, Any, DefaultDict, Iterator, Optional
 
+from maccabistats.date_parsing import parse_date
 from maccabistats.models.game_data import GameData
 from maccabistats.models.player import Player
 from maccabistats.stats.averages import MaccabiGamesAverageStats
@@ -17,14 +17,20 @@ from maccabistats.stats.comebacks import MaccabiGamesComebacksStats
 from maccabistats.stats.consts import TROPHY_COMPETITIONS, EUROPE_COMPETITIONS, LEAGUE_COMPETITIONS, \
     NON_OFFICIAL_COMPETITIONS
 from maccabistats.stats.export import ExportMaccabiGamesStats
+from maccabistats.stats.games_diff import MaccabiGamesStatsDiff, diff_maccabi_games_stats
+from maccabistats.stats.games_groups import MaccabiGamesGroupsStats
 from maccabistats.stats.goals_timing import MaccabiGamesGoalsTiming
 from maccabistats.stats.graphs import MaccabiGamesGraphsStats
 from maccabistats.stats.important_goals import MaccabiGamesImportantGoalsStats
+from maccabistats.stats.instrumentation import enable_instrumentation_from_environment
+from maccabistats.stats.league_points import MaccabiGamesLeaguePointsStats
 from maccabistats.stats.players import MaccabiGamesPlayersStats
 from maccabistats.stats.players_and_teams_streaks import PlayersAndTeamsStreaksStats
 from maccabistats.stats.players_categories import MaccabiGamesPlayersCategoriesStats
+from maccabistats.stats.players_cumulative import MaccabiGamesPlayersCumulativeStats
 from maccabistats.stats.players_events_sumamry import MaccabiGamesPlayersEventsSummaryStats
 from maccabistats.stats.players_first_and_last_games import MaccabiGamesPlayersFirstAndLastGamesStats
+from maccabistats.stats.players_occurrences import MaccabiGamesPlayersOccurrencesStats
 from maccabistats.stats.players_special_games import MaccabiGamesPlayersSpecialGamesStats
 from maccabistats.stats.players_streaks import MaccabiGamesPlayersStreaksStats
 from maccabistats.stats.referees import MaccabiGamesRefereesStats
@@ -35,12 +41,14 @@ from maccabistats.stats.summary import MaccabiGamesSummary
 from maccabistats.stats.teams import MaccabiGamesTeamsStats
 from maccabistats.stats.teams_names_convertor import TeamNamesConvertor
 from maccabistats.stats.teams_streaks import MaccabiGamesTeamsStreaksStats
-from maccabistats.stats_utilities.points_calculator import calculate_points_for_games, \
-    calculate_possible_points_for_games
+from maccabistats.stats.windows import MaccabiGamesWindowsStats
 from maccabistats.version import version as maccabistats_version
 
 logger = logging.getLogger(__name__)
 
+_JSON_GAMES_LIST_PREFIX = ', "games": ['
+_JSON_GAMES_LIST_SUFFIX = ']}'
+
 
 class MaccabiGamesStats:
     _DEFAULT_DESCRIPTION = 'All games'
@@ -49,6 +57,7 @@ class MaccabiGamesStats:
         self.games: List[GameData] = sorted(games, key=lambda g: g.date)  # Sort the games by date
         self.description = description or self._DEFAULT_DESCRIPTION
 
+        self.groups = MaccabiGamesGroupsStats(self)
         self.coaches = MaccabiGamesCoachesStats(self)
         self.players = MaccabiGamesPlayersStats(self)
         self.streaks = MaccabiGamesStreaksStats(self)
@@ -60,13 +69,17 @@ class MaccabiGamesStats:
         self.graphs = MaccabiGamesGraphsStats(self)
         self.players_streaks = MaccabiGamesPlayersStreaksStats(self)
         self.teams_streaks = MaccabiGamesTeamsStreaksStats(self)
+        self.windows = MaccabiGamesWindowsStats(self)
         self.teams = MaccabiGamesTeamsStats(self)
         self.players_events_summary = MaccabiGamesPlayersEventsSummaryStats(self)
+        self.players_occurrences = MaccabiGamesPlayersOccurrencesStats(self)
         self.players_special_games = MaccabiGamesPlayersSpecialGamesStats(self)
         self.players_first_and_last_games = MaccabiGamesPlayersFirstAndLastGamesStats(self)
         self.players_categories = MaccabiGamesPlayersCategoriesStats(self)
+        self.players_cumulative = MaccabiGamesPlayersCumulativeStats(self)
         self.summary = MaccabiGamesSummary(self)
         self.goals_timing = MaccabiGamesGoalsTiming(self)
+        self.league_points = MaccabiGamesLeaguePointsStats(self)
         self.export = ExportMaccabiGamesStats(self)
         self.players_and_teams_streaks = PlayersAndTeamsStreaksStats(self)
 
@@ -185,16 +198,19 @@ class MaccabiGamesStats:
     # region date based
 
     def played_before(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
-        return MaccabiGamesStats([game for game in self.games if game.played_before(date)],
+        # Parse the date once, instead of once per game
+        parsed_date = parse_date(date) if isinstance(date, str) else date
+        return MaccabiGamesStats([game for game in self.games if game.played_before(parsed_date)],
                                  self._new_description(f'Played before: {date}'))
 
     def played_after(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
-        return MaccabiGamesStats([game for game in self.games if game.played_after(date)],
+        parsed_date = parse_date(date) if isinstance(date, str) else date
+        return MaccabiGamesStats([game for game in self.games if game.played_after(parsed_date)],
                                  self._new_description(f'Player after: {date}'))
 
     def played_at(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
         if isinstance(date, str):
-            date = datetime_parser(date, dayfirst=True).date()
+            date = parse_date(date, dayfirst=True).date()
         elif isinstance(date, datetime.datetime):
             date = date.date()  # Leave only year & month & day
 
@@ -324,26 +340,14 @@ class MaccabiGamesStats:
         """
         Calculate points is supported only for league games
         """
-        current_competitions = self.available_competitions
-
-        if not set(current_competitions) <= set(LEAGUE_COMPETITIONS):
-            raise TypeError(f'Calculating points is supported only for league games, '
-                            f'current competitions: {current_competitions}')
-
-        return calculate_points_for_games(self)
+        return self.league_points.total_points
 
     @property
     def success_rate(self):
         """
         Calculate the success rate of the current games (points/possible points)
         """
-        current_competitions = self.available_competitions
-
-        if not set(current_competitions) <= set(LEAGUE_COMPETITIONS):
-            raise TypeError(f'Calculating success rate supported only for league games, '
-                            f'current competitions: {current_competitions}')
-
-        return round(calculate_points_for_games(self) / calculate_possible_points_for_games(self), 3)
+        return self.league_points.success_rate
 
     def get_summary(self) -> Dict[str, Any]:
         summary = {'games': len(self),
@@ -379,14 +383,90 @@ class MaccabiGamesStats:
         team_games_stats = self.get_games_against_team(team_name)
         return team_games_stats.summary
 
+    def diff(self, other: MaccabiGamesStats) -> MaccabiGamesStatsDiff:
+        """
+        Find what was changed from other to self: added/removed games and modified games (down to the events).
+        """
+        return diff_maccabi_games_stats(old=other, new=self)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of all the games fingerprints (see GameData.fingerprint), changed whenever a game is changed/added/removed.
+        The games order does not matter (fixes may append games without sorting them again).
+        """
+        games_fingerprints = "".join(sorted(game.fingerprint for game in self.games))
+        return hashlib.sha1(games_fingerprints.encode('utf-8')).hexdigest()
+
+    def refresh_fingerprints(self) -> None:
+        """
+        Call this after changing the games in place (such as in fixes), see GameData.refresh_fingerprint.
+        """
+        for game in self.games:
+            game.refresh_fingerprint()
+
     def to_json(self) -> str:
-        return json.dumps([game.to_json() for game in self.games], indent=4)
+        """
+        Lossless json of these games (with the teams, players and events), which can be loaded with from_json.
+        The json is written with a game per line, so it can be loaded while streaming the file (see from_json_file).
+        """
+        return "".join(self._iter_json_lines())
+
+    def _iter_json_lines(self) -> Iterator[str]:
+        header = json.dumps(dict(version=self.version, description=self.description), ensure_ascii=False)
+        yield f"{header[:-1]}{_JSON_GAMES_LIST_PREFIX}\n"
+
+        for game_index, game in enumerate(self.games):
+            separator = "," if game_index < len(self.games) - 1 else ""
+            yield f"{json.dumps(game.json_dict(), ensure_ascii=False)}{separator}\n"
+
+        yield f"{_JSON_GAMES_LIST_SUFFIX}\n"
+
+    def serialize_to_json(self, file_path: Optional[str] = None) -> str:
+        """
+        :param file_path: Where to save the json, When no path is given a temporary file is created.
+        :return: The path of the json file
+        """
+        if file_path is None:
+            with NamedTemporaryFile(delete=False, suffix='.json') as temp_json:
+                file_path = temp_json.name
+
+        logger.info(f"Serializing current maccabi games stats to json file at: {file_path}")
+        with open(file_path, 'w', encoding='utf-8') as json_file:
+            json_file.writelines(self._iter_json_lines())
+
+        return file_path
 
-    def serialize_to_json(self) -> None:
-        # TODO, there is too much escaped stuff in this function output
-        with NamedTemporaryFile(delete=False, mode='w') as temp_json:
-            logger.info(f"Serializing current maccabi games stats to temporary json file at: {temp_json.name}")
-            temp_json.file.write(self.to_json())
+    @classmethod
+    def from_json(cls, json_text: str) -> MaccabiGamesStats:
+        return cls._from_json_lines(iter(json_text.splitlines()))
+
+    @classmethod
+    def from_json_file(cls, file_path: str) -> MaccabiGamesStats:
+        logger.info(f"Loading maccabi games from json file: {file_path}")
+        with open(file_path, 'r', encoding='utf-8') as json_file:
+            return cls._from_json_lines(json_file)
+
+    @classmethod
+    def _from_json_lines(cls, json_lines: Iterator[str]) -> MaccabiGamesStats:
+        """
+        Parse the games line by line (as written by to_json), so we never hold the whole json document in memory.
+        When the json was re-formatted (by some other tool) we fall back to load it as a whole.
+        """
+        first_line = next(json_lines, "").rstrip()
+        if not first_line.endswith(_JSON_GAMES_LIST_PREFIX):
+            json_document = json.loads(first_line + "".join(json_lines))
+            return cls([GameData.from_json_dict(game) for game in json_document['games']], json_document['description'])
+
+        header = json.loads(first_line[:-len(_JSON_GAMES_LIST_PREFIX)] + "}")
+        games = []
+        for line in json_lines:
+            line = line.rstrip().rstrip(",")
+            if line == _JSON_GAMES_LIST_SUFFIX:
+                break
+            games.append(GameData.from_json_dict(json.loads(line)))
+
+        return cls(games, header['description'])
 
     def __len__(self) -> int:
         return len(self.games)
@@ -421,3 +501,7 @@ class MaccabiGamesStats:
             summary += f" (החל מ {self.first_game_date} ועד {self.last_game_date})"
 
         return summary
+
+
+# Opt-in (MACCABISTATS_INSTRUMENTATION), See maccabistats.stats.instrumentation
+enable_instrumentation_from_environment()
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
 import logging
-from collections import Counter
 from sys import maxsize
-from typing import Tuple, TYPE_CHECKING
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from maccabistats.maccabipedia.players import MaccabiPediaPlayers
+from maccabistats.models.player_game_events import GameEventTypes
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 logger = logging.getLogger(__name__)
 
+# The players events that are divided between the home players and the others (like
+# TeamInGame.scored_players_with_amount, assist_players_with_amount & goal_involved_players_with_amount)
+PLAYERS_EVENTS_NAMES = ('goals', 'assists', 'goals_involved')
+
+HomePlayersDivision = Tuple[int, int]  # The events of the home players and the events of the other players
+
+
+class _SeasonsPlayersEvents(NamedTuple):
+    """
+    The events of each player at each season, as a seasons X players X events (goals, assists) matrix.
+    """
+    seasons: List[str]  # Ordered by the first game of each season
+    players_names: List[str]
+    events: np.ndarray
+
 
 class MaccabiGamesPlayersCategoriesStats(object):
     """
@@ -19,41 +36,91 @@ class MaccabiGamesPlayersCategoriesStats(object):
     Players category are a group of players grouped by a condition, like: all home players.
     On this group we will ask some questions, like:
      * How many goals did they score? how much % of the goals did they score? and so on
+
+    The players events are summed once per season & player, the home players are a mask over the players,
+    so the home players events of every season (and of all the games) are masked sums of this matrix.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
-        self.maccabi_home_players_names = MaccabiPediaPlayers.get_players_data().home_players
 
-    def _home_players_events(self, game_events_callable) -> Tuple[int, int]:
+        self._seasons_players_events: Optional[_SeasonsPlayersEvents] = None
+
+    @property
+    def maccabi_home_players_names(self) -> Set[str]:
+        # Loaded on the first use, so creating MaccabiGamesStats does not depend on maccabipedia players data
+        return MaccabiPediaPlayers.get_players_data().home_players
+
+    @property
+    def _players_events_by_season(self) -> _SeasonsPlayersEvents:
+        """
+        The goals & assists (own goals included, like TeamInGame.scored_players_with_amount) of each player
+        at each season, summed in one pass over the games.
+        """
+        if self._seasons_players_events is None:
+            seasons_ids: Dict[str, int] = dict()
+            players_ids: Dict[str, int] = dict()
+            season_ids, player_ids, players_events = [], [], []
+
+            for game in self.games:
+                season_id = seasons_ids.setdefault(game.season, len(seasons_ids))
+                for player in game.maccabi_team.players:
+                    goals = player.event_count_by_type(GameEventTypes.GOAL_SCORE)
+                    assists = player.event_count_by_type(GameEventTypes.GOAL_ASSIST)
+                    if goals > 0 or assists > 0:
+                        season_ids.append(season_id)
+                        player_ids.append(players_ids.setdefault(player.name, len(players_ids)))
+                        players_events.append((goals, assists))
+
+            events = np.zeros((len(seasons_ids), len(players_ids), 2), dtype=int)
+            np.add.at(events, (np.array(season_ids, dtype=int), np.array(player_ids, dtype=int)),
+                      np.array(players_events, dtype=int).reshape(-1, 2))
+            self._seasons_players_events = _SeasonsPlayersEvents(seasons=list(seasons_ids),
+                                                                 players_names=list(players_ids), events=events)
+
+        return self._seasons_players_events
+
+    def home_players_division_by_season(self, events_name: str) -> Dict[str, HomePlayersDivision]:
+        """
+        :param events_name: One of PLAYERS_EVENTS_NAMES: goals, assists, goals_involved
+        :return: Season -> the events made by home players and by non home players at this season
+        """
+        if events_name not in PLAYERS_EVENTS_NAMES:
+            raise RuntimeError(f"Unknown players events: {events_name}, the known events: {PLAYERS_EVENTS_NAMES}")
+
+        seasons_players_events = self._players_events_by_season
+        if events_name == 'goals_involved':
+            players_events = seasons_players_events.events.sum(axis=2)
+        else:
+            players_events = seasons_players_events.events[:, :, PLAYERS_EVENTS_NAMES.index(events_name)]
+
+        # The home players are a mask over the players, each season events are divided by a masked sum
+        home_players_names = self.maccabi_home_players_names
+        home_players_mask = np.array([player_name in home_players_names
+                                      for player_name in seasons_players_events.players_names], dtype=bool)
+        home_players_events = players_events[:, home_players_mask].sum(axis=1)
+        all_players_events = players_events.sum(axis=1)
+
+        return {season: (int(home_players_events[season_id]),
+                         int(all_players_events[season_id] - home_players_events[season_id]))
+                for season_id, season in enumerate(seasons_players_events.seasons)}
+
+    def _home_players_events(self, events_name: str) -> HomePlayersDivision:
         """
         Calculate the events made by home player and by non home players.
-        Use the given callable to choose which events to calculate
 
-        :param game_events_callable: A callable that should return a counter,
-               One of those as example: "scored_players_with_amount" and so on
-        :return: The total goals from home players and total goals form non home players
+        :param events_name: One of PLAYERS_EVENTS_NAMES: goals, assists, goals_involved
+        :return: The total events from home players and total events form non home players
         """
-        total_home_players_events = 0
-        total_non_home_players_events = 0
-
-        goals_by_player_name = Counter()
-        for game in self.maccabi_games_stats:
-            goals_by_player_name += game_events_callable(game)
-
-        for player_name, goals_count in goals_by_player_name.items():
-            if player_name in self.maccabi_home_players_names:
-                total_home_players_events += goals_count
-            else:
-                total_non_home_players_events += goals_count
-
-        return total_home_players_events, total_non_home_players_events
+        seasons_divisions = self.home_players_division_by_season(events_name).values()
+        return (sum(home_players_events for home_players_events, _ in seasons_divisions),
+                sum(non_home_players_events for _, non_home_players_events in seasons_divisions))
 
     # home players scored
 
     def _home_players_goals_division(self) -> Tuple[int, int]:
-        return self._home_players_events(game_events_callable=lambda game: game.maccabi_team.scored_players_with_amount)
+        return self._home_players_events('goals')
 
     def home_players_goals_count(self) -> int:
         return self._home_players_goals_division()[0]
@@ -68,7 +135,7 @@ class MaccabiGamesPlayersCategoriesStats(object):
     # home players assists
 
     def _home_players_assists_division(self) -> Tuple[int, int]:
-        return self._home_players_events(game_events_callable=lambda game: game.maccabi_team.assist_players_with_amount)
+        return self._home_players_events('assists')
 
     def home_players_assists_count(self) -> int:
         return self._home_players_assists_division()[0]
@@ -84,8 +151,7 @@ class MaccabiGamesPlayersCategoriesStats(object):
     # home players goals involved
 
     def _home_players_goals_involved_division(self) -> Tuple[int, int]:
-        return self._home_players_events(
-            game_events_callable=lambda game: game.maccabi_team.goal_involved_players_with_amount)
+        return self._home_players_events('goals_involved')
 
     def home_players_goals_involved_count(self) -> int:
         return self._home_players_goals_involved_division()[0]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from maccabistats.date_parsing import parse_date
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+
+if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
+    from maccabistats.models.player_in_game import PlayerInGame
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerCumulativeStats(NamedTuple):
+    """
+    The stats of a player for maccabi, counted the same as the players stats (goals without own goals,
+    red cards with second yellow cards, wins of the games the player played at).
+    """
+    appearances: int = 0
+    goals: int = 0
+    assists: int = 0
+    yellow_cards: int = 0
+    red_cards: int = 0
+    wins: int = 0
+
+    def __add__(self, other: PlayerCumulativeStats) -> PlayerCumulativeStats:
+        return PlayerCumulativeStats(*(value + other_value for value, other_value in zip(self, other)))
+
+
+PlayerMilestone = Tuple[str, 'GameData']  # The player name to the game the milestone was reached at
+
+_NO_STATS = PlayerCumulativeStats()
+
+
+def player_game_stats(game: GameData, player: PlayerInGame) -> PlayerCumulativeStats:
+    """
+    The stats of a player in one game (appearances=1 if the player played)
+    """
+    events_count = Counter(event.event_type for event in player.events)
+    own_goals_count = sum(1 for event in player.events if event.event_type == GameEventTypes.GOAL_SCORE and
+                          event.goal_type == GoalTypes.OWN_GOAL)
+    played = events_count[GameEventTypes.LINE_UP] > 0 or events_count[GameEventTypes.SUBSTITUTION_IN] > 0
+
+    return PlayerCumulativeStats(
+        appearances=int(played),
+        goals=events_count[GameEventTypes.GOAL_SCORE] - own_goals_count,
+        assists=events_count[GameEventTypes.GOAL_ASSIST],
+        yellow_cards=events_count[GameEventTypes.YELLOW_CARD],
+        red_cards=events_count[GameEventTypes.RED_CARD] + events_count[GameEventTypes.SECOND_YELLOW_CARD],
+        wins=int(played and game.is_maccabi_win))
+
+
+class _PlayerCumulativeIndex(object):
+    """
+    The games of one player (by their index at the date sorted games) and the cumulative stats after each of them.
+    Each stat is kept as a column as well (the stat after each game), to binary search the milestones.
+    """
+
+    def __init__(self) -> None:
+        self.games_indexes: List[int] = []
+        self.games_dates: List[datetime.datetime] = []
+        self.cumulative_stats: List[PlayerCumulativeStats] = []
+        self.cumulative_stats_columns: List[List[int]] = [[] for _ in PlayerCumulativeStats._fields]
+
+    def add_game(self, game_index: int, game: GameData, game_stats: PlayerCumulativeStats) -> None:
+        last_stats = self.cumulative_stats[-1] if self.cumulative_stats else _NO_STATS
+        cumulative_stats = last_stats + game_stats
+        self.games_indexes.append(game_index)
+        self.games_dates.append(game.date)
+        self.cumulative_stats.append(cumulative_stats)
+        for stat_column, stat_value in zip(self.cumulative_stats_columns, cumulative_stats):
+            stat_column.append(stat_value)
+
+    def stats_after_this_many_games(self, player_games_count: int) -> PlayerCumulativeStats:
+        return self.cumulative_stats[player_games_count - 1] if player_games_count > 0 else _NO_STATS
+
+
+class MaccabiGamesPlayersCumulativeStats(object):
+    """
+    This class will handle the players stats as of a date or a game, like:
+     * How many goals did a player score for maccabi until 01/01/2000?
+     * How many appearances did a player have before this game?
+
+    The games are already sorted by date, each player gets the cumulative stats after each game of the player
+    (built once, in one pass over the games), so every "as of" question is a binary search on the player games.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats):
+        self.maccabi_games_stats = maccabi_games_stats
+        self.games = maccabi_games_stats.games
+
+        self._players_indexes: Optional[Dict[str, _PlayerCumulativeIndex]] = None
+        self._games_positions: Optional[Dict[int, int]] = None
+
+    @property
+    def _players_cumulative_indexes(self) -> Dict[str, _PlayerCumulativeIndex]:
+        if self._players_indexes is None:
+            players_indexes = dict()
+            for game_index, game in enumerate(self.games):
+                for player in game.maccabi_team.players:
+                    game_stats = player_game_stats(game, player)
+                    if game_stats == _NO_STATS:
+                        continue
+
+                    if player.name not in players_indexes:
+                        players_indexes[player.name] = _PlayerCumulativeIndex()
+                    players_indexes[player.name].add_game(game_index, game, game_stats)
+
+            self._players_indexes = players_indexes
+
+        return self._players_indexes
+
+    def _game_index(self, game: GameData) -> int:
+        if self._games_positions is None:
+            self._games_positions = {id(current_game): game_index for game_index, current_game in enumerate(self.games)}
+
+        if id(game) not in self._games_positions:
+            raise RuntimeError(f"The game: {game} is not one of these games")
+        return self._games_positions[id(game)]
+
+    def player_stats_as_of_date(self, player_name: str,
+                                date: Union[datetime.datetime, datetime.date, str]) -> PlayerCumulativeStats:
+        """
+        The player stats from the games played until this date (including it), like players.* on played_before(date)
+        :param player_name: The player to get the stats of (players with no games get zeros)
+        :param date: Such as 2000-01-30
+        """
+        if isinstance(date, str):
+            date = parse_date(date)
+        elif not isinstance(date, datetime.datetime):
+            date = datetime.datetime(date.year, date.month, date.day)
+
+        player_index = self._players_cumulative_indexes.get(player_name)
+        if player_index is None:
+            return _NO_STATS
+
+        return player_index.stats_after_this_many_games(bisect_right(player_index.games_dates, date))
+
+    def player_stats_before_game(self, player_name: str, game: GameData,
+                                 including_this_game: bool = False) -> PlayerCumulativeStats:
+        """
+        The player stats before this game (one of these games), like the career appearances before this game.
+        """
+        game_index = self._game_index(game)
+        player_index = self._players_cumulative_indexes.get(player_name)
+        if player_index is None:
+            return _NO_STATS
+
+        bisect_function = bisect_right if including_this_game else bisect_left
+        return player_index.stats_after_this_many_games(bisect_function(player_index.games_indexes, game_index))
+
+    def player_milestone_game(self, player_name: str, milestone: int, stat_name: str = 'goals') -> Optional[GameData]:
+        """
+        :param milestone: Such as 100, for the game of the 100th goal
+        :param stat_name: One of PlayerCumulativeStats fields (appearances, goals, assists...)
+        :return: The game the player reached this milestone at, None if it was not reached
+        """
+        if stat_name not in PlayerCumulativeStats._fields:
+            raise RuntimeError(f"Unknown player stat: {stat_name}, the known stats: {PlayerCumulativeStats._fields}")
+
+        player_index = self._players_cumulative_indexes.get(player_name)
+        if player_index is None:
+            return None
+
+        stat_position = PlayerCumulativeStats._fields.index(stat_name)
+        player_games_count = bisect_left(player_index.cumulative_stats_columns[stat_position], milestone)
+        if player_games_count == len(player_index.cumulative_stats):
+            return None
+
+        return self.games[player_index.games_indexes[player_games_count]]
+
+    def players_milestones(self, milestone: int, stat_name: str = 'goals') -> List[PlayerMilestone]:
+        """
+        All the players that reached this milestone (like 100 appearances) and the game they reached it at,
+        ordered by the games dates. Calculated in one pass over the games, without building the players indexes.
+        """
+        if stat_name not in PlayerCumulativeStats._fields:
+            raise RuntimeError(f"Unknown player stat: {stat_name}, the known stats: {PlayerCumulativeStats._fields}")
+        stat_position = PlayerCumulativeStats._fields.index(stat_name)
+
+        players_stat = Counter()
+        players_milestones = []
+        for game in self.games:
+            for player in game.maccabi_team.players:
+                player_stat_before_game = players_stat[player.name]
+                players_stat[player.name] += player_game_stats(game, player)[stat_position]
+                if player_stat_before_game < milestone <= players_stat[player.name]:
+                    players_milestones.append((player.name, game))
+
+        return players_milestones
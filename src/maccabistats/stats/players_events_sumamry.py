@@ -116,6 +116,7 @@ class MaccabiGamesPlayersEventsSummaryStats(object):
         Prints the comparison of the current (self) maccabi games stats to the given object.
         All of the shown numbers will be relevant to the other.
         If we will show for example "+2", means that self has two more items in the given field than "other".
+        To find exactly which games/events were changed use MaccabiGamesStats.diff.
         :type other: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
         :rtype: str
         """
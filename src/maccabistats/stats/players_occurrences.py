@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional
+
+from maccabistats.models.player_game_events import GameEventTypes
+
+if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerOccurrence(Enum):
+    APPEARANCE = "appearance"
+    GOAL = "goal"
+    ASSIST = "assist"
+    CAPTAIN = "captain"
+
+
+class PlayerPlayedGame(NamedTuple):
+    """
+    A game the player played at, with the player events in it
+    (goals are counted like TeamInGame.scored_players_with_amount, own goals included).
+    """
+    game: GameData
+    goals: int
+    assists: int
+    captain: bool
+
+
+PlayedGameCondition = Callable[[PlayerPlayedGame], bool]
+
+_OCCURRENCES_CONDITIONS: Dict[PlayerOccurrence, PlayedGameCondition] = {
+    PlayerOccurrence.APPEARANCE: lambda played_game: True,
+    PlayerOccurrence.GOAL: lambda played_game: played_game.goals > 0,
+    PlayerOccurrence.ASSIST: lambda played_game: played_game.assists > 0,
+    PlayerOccurrence.CAPTAIN: lambda played_game: played_game.captain,
+}
+
+
+class _PlayerOccurrences(object):
+    def __init__(self) -> None:
+        self.played_games: List[PlayerPlayedGame] = []
+        # The positions (at played_games) of the games of each occurrence
+        self.occurrences: Dict[PlayerOccurrence, List[int]] = {occurrence: [] for occurrence in PlayerOccurrence}
+
+    def add_played_game(self, played_game: PlayerPlayedGame) -> None:
+        for occurrence, occurrence_condition in _OCCURRENCES_CONDITIONS.items():
+            if occurrence_condition(played_game):
+                self.occurrences[occurrence].append(len(self.played_games))
+        self.played_games.append(played_game)
+
+
+class MaccabiGamesPlayersOccurrencesStats(object):
+    """
+    This class will handle the games of each player occurrence (appearance, goal, assist, captaincy), like:
+     * The first game a player scored at
+     * The 3rd game a player was the captain at
+
+    The played games of each player (with the player goals, assists & captaincy) are indexed once,
+    in one pass over the games, the special games & first and last games stats are calculated from this index.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats):
+        self.maccabi_games_stats = maccabi_games_stats
+        self.games = maccabi_games_stats.games
+
+        self._players_occurrences: Optional[Dict[str, _PlayerOccurrences]] = None
+
+    @property
+    def _occurrences_by_player_name(self) -> Dict[str, _PlayerOccurrences]:
+        if self._players_occurrences is None:
+            players_occurrences = dict()
+            for game in self.games:
+                for player in game.maccabi_team.players:
+                    events_count = Counter(event.event_type for event in player.events)
+                    if events_count[GameEventTypes.LINE_UP] == 0 and events_count[GameEventTypes.SUBSTITUTION_IN] == 0:
+                        continue  # Only the games the player played at
+
+                    if player.name not in players_occurrences:
+                        players_occurrences[player.name] = _PlayerOccurrences()
+                    players_occurrences[player.name].add_played_game(PlayerPlayedGame(
+                        game=game, goals=events_count[GameEventTypes.GOAL_SCORE],
+                        assists=events_count[GameEventTypes.GOAL_ASSIST],
+                        captain=events_count[GameEventTypes.CAPTAIN] > 0))
+
+            self._players_occurrences = players_occurrences
+
+        return self._players_occurrences
+
+    @property
+    def players_names(self) -> List[str]:
+        """
+        The players that played in these games, ordered by their first game
+        """
+        return list(self._occurrences_by_player_name.keys())
+
+    def player_played_games(self, player_name: str) -> List[PlayerPlayedGame]:
+        player_occurrences = self._occurrences_by_player_name.get(player_name)
+        return player_occurrences.played_games if player_occurrences is not None else []
+
+    def player_occurrence_game(self, player_name: str, occurrence: PlayerOccurrence,
+                               occurrence_number: int = 1) -> Optional[GameData]:
+        """
+        :param occurrence: Such as PlayerOccurrence.GOAL
+        :param occurrence_number: 1 for the first game of this occurrence, 2 for the second, -1 for the last game...
+        :return: The game of this occurrence, None if the player does not have that many occurrences
+        """
+        player_occurrences = self._occurrences_by_player_name.get(player_name)
+        if player_occurrences is None or occurrence_number == 0:
+            return None
+
+        occurrence_positions = player_occurrences.occurrences[occurrence]
+        occurrence_index = occurrence_number - 1 if occurrence_number > 0 else occurrence_number
+        if not -len(occurrence_positions) <= occurrence_index < len(occurrence_positions):
+            return None
+
+        return player_occurrences.played_games[occurrence_positions[occurrence_index]].game
+
+    def player_first_game_by_condition(self, player_name: str, played_game_condition: PlayedGameCondition,
+                                       search_from_last_game: bool = False) -> Optional[GameData]:
+        """
+        :param played_game_condition: Gets a played game of the player, such as: lambda g: g.goals >= 2
+        :param search_from_last_game: Return the last game that satisfies the condition
+        :return: The first (or last) played game of the player that satisfies the condition
+        """
+        played_games = self.player_played_games(player_name)
+        if search_from_last_game:
+            played_games = reversed(played_games)
+
+        return next((played_game.game for played_game in played_games if played_game_condition(played_game)), None)
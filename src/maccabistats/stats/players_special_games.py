@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import datetime
+import heapq
 import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING, List, Callable
+from typing import TYPE_CHECKING, List, Callable, DefaultDict, Optional
 
 from maccabistats.maccabipedia.players import MaccabiPediaPlayers
 from maccabistats.models.game_data import GameData
 from maccabistats.stats.players_games_condition import PlayerAging
-from maccabistats.stats.players_games_condition import PlayerGameMatcher, PlayerGamesCondition
+from maccabistats.stats.players_games_condition import PlayerGameMatcher
+from maccabistats.stats.players_occurrences import PlayedGameCondition, PlayerOccurrence
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 logger = logging.getLogger(__name__)
 
+# The PlayerPlayedGame field that counts each occurrence (which can happen more than once in a game)
+_OCCURRENCES_COUNTS_FIELDS = {
+    PlayerOccurrence.GOAL: 'goals',
+    PlayerOccurrence.ASSIST: 'assists',
+}
+
 
 class PlayerAgeAtSpecialGame(object):
     _days_in_year = 365.2425
@@ -35,114 +43,148 @@ class MaccabiGamesPlayersSpecialGamesStats(object):
     """
     This class will handle all players events and the first time they occur, like:
      * First time that a player score - who's the youngest?
+
+    The special game of each player comes from the players occurrences index,
+    the players are joined with their birth dates and only the requested amount of players is sorted (with heapq).
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
-        self.players_birth_dates = MaccabiPediaPlayers.get_players_data().players_dates
 
-    def _players_by_game_condition_ordered_by_age(self,
-                                                  player_game_condition: Callable[[GameData, str], bool],
-                                                  player_game_to_search_for: PlayerGameMatcher,
-                                                  order_by_age_option: PlayerAging,
-                                                  players_count: int) -> List[PlayerAgeAtSpecialGame]:
+    @property
+    def players_birth_dates(self) -> DefaultDict[str, datetime.datetime]:
+        # Loaded on the first use, so creating MaccabiGamesStats does not depend on maccabipedia players data
+        return MaccabiPediaPlayers.get_players_data().players_dates
+
+    def _players_by_special_game_ordered_by_age(self,
+                                                player_special_game: Callable[[str], Optional[GameData]],
+                                                order_by_age_option: PlayerAging,
+                                                players_count: int) -> List[PlayerAgeAtSpecialGame]:
         """
-        :param player_game_condition: A function that will check whether the given player satisfy a condition in a game
-        :param player_game_to_search_for: Search for first/last game of this player (to satisfy the condition)
+        :param player_special_game: Gets a player name and returns the special game of this player (None if missing)
         :param order_by_age_option: Do we want the youngest or oldest players?
         :param: The amount of players we want to return
-        :return: The players that satisfy the player game condition, from youngest and above
+        :return: The players that have a special game, from youngest and above
         """
-        games_by_player_name = self.maccabi_games_stats.played_games_by_player_name()
-
-        first_game_by_player_name = dict()
-        for player_name, player_games in games_by_player_name.items():
-            if player_game_to_search_for.value == PlayerGameMatcher.LAST_GAME.value:
-                player_games = reversed(player_games)  # We should search for the player last game
-
-            first_game = next((game for game in player_games if player_game_condition(game, player_name)), None)
-            if first_game is None:
+        players_ages = []
+        for player_name in self.maccabi_games_stats.players_occurrences.players_names:
+            special_game = player_special_game(player_name)
+            if special_game is None:
                 continue  # This player does not satisfy the condition
             if MaccabiPediaPlayers.missing_birth_date_value == self.players_birth_dates[player_name]:
                 continue  # This player does not have any birth date on our db
 
-            first_game_by_player_name[player_name] = PlayerAgeAtSpecialGame(player_name,
-                                                                            self.players_birth_dates[player_name],
-                                                                            first_game)
+            players_ages.append(PlayerAgeAtSpecialGame(player_name, self.players_birth_dates[player_name],
+                                                       special_game))
 
-        players_by_age = sorted(first_game_by_player_name.values(),
-                                key=lambda player_first_game: player_first_game.time_in_days)
         if order_by_age_option.value == PlayerAging.OLDEST_PLAYERS.value:
-            players_by_age = list(reversed(players_by_age))
+            # Reversed, so the players with the same age are ordered like the reversed youngest players
+            return heapq.nlargest(players_count, reversed(players_ages), key=_player_age)
+        return heapq.nsmallest(players_count, players_ages, key=_player_age)
+
+    def _player_game_by_condition(self, played_game_condition: PlayedGameCondition,
+                                  player_game_to_search_for: PlayerGameMatcher) -> Callable[[str], Optional[GameData]]:
+        search_from_last_game = player_game_to_search_for.value == PlayerGameMatcher.LAST_GAME.value
+        return lambda player_name: self.maccabi_games_stats.players_occurrences.player_first_game_by_condition(
+            player_name, played_game_condition, search_from_last_game)
+
+    def _player_game_by_occurrences_count(self, occurrence: PlayerOccurrence, count_at_least: int,
+                                          player_game_to_search_for: PlayerGameMatcher) \
+            -> Callable[[str], Optional[GameData]]:
+        """
+        The first (or last) game of the player with at least count_at_least of this occurrence (goals or assists),
+        for a single occurrence this is the first (or last) occurrence game from the index.
+        """
+        if count_at_least == 1:
+            occurrence_number = -1 if player_game_to_search_for.value == PlayerGameMatcher.LAST_GAME.value else 1
+            return lambda player_name: self.maccabi_games_stats.players_occurrences.player_occurrence_game(
+                player_name, occurrence, occurrence_number)
 
-        return players_by_age[:players_count]
+        count_field = _OCCURRENCES_COUNTS_FIELDS[occurrence]
+        return self._player_game_by_condition(lambda played_game: getattr(played_game, count_field) >= count_at_least,
+                                              player_game_to_search_for)
+
+    def youngest_players_by_occurrence(self, occurrence: PlayerOccurrence, occurrence_number: int = 1,
+                                       players_count: int = 50) -> List[PlayerAgeAtSpecialGame]:
+        """
+        :param occurrence: Such as PlayerOccurrence.GOAL
+        :param occurrence_number: The youngest players at their occurrence_number goal (-1 for their last goal)
+        """
+        return self._players_by_special_game_ordered_by_age(
+            lambda player_name: self.maccabi_games_stats.players_occurrences.player_occurrence_game(
+                player_name, occurrence, occurrence_number),
+            PlayerAging.YOUNGEST_PLAYERS, players_count)
+
+    def oldest_players_by_occurrence(self, occurrence: PlayerOccurrence, occurrence_number: int = 1,
+                                     players_count: int = 50) -> List[PlayerAgeAtSpecialGame]:
+        """
+        :param occurrence: Such as PlayerOccurrence.CAPTAIN
+        :param occurrence_number: The oldest players at their occurrence_number captaincy (-1 for their last one)
+        """
+        return self._players_by_special_game_ordered_by_age(
+            lambda player_name: self.maccabi_games_stats.players_occurrences.player_occurrence_game(
+                player_name, occurrence, occurrence_number),
+            PlayerAging.OLDEST_PLAYERS, players_count)
 
     def youngest_players_by_first_time_to_play(self, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(PlayerGamesCondition.play_in_game,
-                                                              PlayerGameMatcher.FIRST_GAME,
-                                                              PlayerAging.YOUNGEST_PLAYERS, players_count)
+        return self.youngest_players_by_occurrence(PlayerOccurrence.APPEARANCE, 1, players_count)
 
     def oldest_players_by_first_time_to_play(self, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(PlayerGamesCondition.play_in_game,
-                                                              PlayerGameMatcher.FIRST_GAME, PlayerAging.OLDEST_PLAYERS,
-                                                              players_count)
+        return self.oldest_players_by_occurrence(PlayerOccurrence.APPEARANCE, 1, players_count)
 
     def oldest_players_by_last_time_to_play(self, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(PlayerGamesCondition.play_in_game,
-                                                              PlayerGameMatcher.LAST_GAME, PlayerAging.OLDEST_PLAYERS,
-                                                              players_count)
+        return self.oldest_players_by_occurrence(PlayerOccurrence.APPEARANCE, -1, players_count)
 
     def youngest_players_by_first_time_to_score(self, score_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_score_x_goals_in_game__condition(score_at_least),
-            PlayerGameMatcher.FIRST_GAME, PlayerAging.YOUNGEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.GOAL, score_at_least, PlayerGameMatcher.FIRST_GAME),
+            PlayerAging.YOUNGEST_PLAYERS, players_count)
 
     def youngest_players_by_first_time_to_goal_involved(self, involved_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(involved_at_least),
-            PlayerGameMatcher.FIRST_GAME, PlayerAging.YOUNGEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_condition(
+                lambda played_game: played_game.goals + played_game.assists >= involved_at_least,
+                PlayerGameMatcher.FIRST_GAME),
+            PlayerAging.YOUNGEST_PLAYERS, players_count)
 
     def oldest_players_by_first_time_to_score(self, score_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_score_x_goals_in_game__condition(score_at_least),
-            PlayerGameMatcher.FIRST_GAME, PlayerAging.OLDEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.GOAL, score_at_least, PlayerGameMatcher.FIRST_GAME),
+            PlayerAging.OLDEST_PLAYERS, players_count)
 
     def oldest_players_by_last_time_to_score(self, score_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_score_x_goals_in_game__condition(score_at_least),
-            PlayerGameMatcher.LAST_GAME, PlayerAging.OLDEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.GOAL, score_at_least, PlayerGameMatcher.LAST_GAME),
+            PlayerAging.OLDEST_PLAYERS, players_count)
 
     def youngest_players_by_first_time_to_assist(self, assist_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_assist_x_goals_in_game__condition(assist_at_least),
-            PlayerGameMatcher.FIRST_GAME, PlayerAging.YOUNGEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.ASSIST, assist_at_least,
+                                                   PlayerGameMatcher.FIRST_GAME),
+            PlayerAging.YOUNGEST_PLAYERS, players_count)
 
     def oldest_players_by_first_time_to_assist(self, assist_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_assist_x_goals_in_game__condition(assist_at_least),
-            PlayerGameMatcher.FIRST_GAME, PlayerAging.OLDEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.ASSIST, assist_at_least,
+                                                   PlayerGameMatcher.FIRST_GAME),
+            PlayerAging.OLDEST_PLAYERS, players_count)
 
     def oldest_players_by_last_time_to_assist(self, assist_at_least: int = 1, players_count: int = 50):
-        return self._players_by_game_condition_ordered_by_age(
-            PlayerGamesCondition.create_assist_x_goals_in_game__condition(assist_at_least),
-            PlayerGameMatcher.LAST_GAME, PlayerAging.OLDEST_PLAYERS, players_count)
+        return self._players_by_special_game_ordered_by_age(
+            self._player_game_by_occurrences_count(PlayerOccurrence.ASSIST, assist_at_least,
+                                                   PlayerGameMatcher.LAST_GAME),
+            PlayerAging.OLDEST_PLAYERS, players_count)
 
     def youngest_players_by_first_time_to_be_captain(self, players_count: int = 500):
-        return self._players_by_game_condition_ordered_by_age(_player_was_captain_in_a_game,
-                                                              PlayerGameMatcher.FIRST_GAME,
-                                                              PlayerAging.YOUNGEST_PLAYERS, players_count)
+        return self.youngest_players_by_occurrence(PlayerOccurrence.CAPTAIN, 1, players_count)
 
     def oldest_players_by_first_time_to_be_captain(self, players_count: int = 500):
-        return self._players_by_game_condition_ordered_by_age(_player_was_captain_in_a_game,
-                                                              PlayerGameMatcher.FIRST_GAME, PlayerAging.OLDEST_PLAYERS,
-                                                              players_count)
+        return self.oldest_players_by_occurrence(PlayerOccurrence.CAPTAIN, 1, players_count)
 
     def oldest_players_by_last_time_to_be_captain(self, players_count: int = 500):
-        return self._players_by_game_condition_ordered_by_age(_player_was_captain_in_a_game,
-                                                              PlayerGameMatcher.LAST_GAME, PlayerAging.OLDEST_PLAYERS,
-                                                              players_count)
+        return self.oldest_players_by_occurrence(PlayerOccurrence.CAPTAIN, -1, players_count)
 
 
-def _player_was_captain_in_a_game(game: GameData, player_name: str) -> bool:
-    return player_name in game.maccabi_team.captains_players_with_amount
+def _player_age(player_age_at_special_game: PlayerAgeAtSpecialGame) -> datetime.timedelta:
+    return player_age_at_special_game.time_in_days
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import typing
-from typing import TYPE_CHECKING, Tuple, List
+from typing import TYPE_CHECKING, Tuple, List, Callable
 
 if TYPE_CHECKING:
+    from maccabistats.stats.games_groups import GamesGroupResults
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 from collections import Counter
@@ -18,42 +19,42 @@ class MaccabiGamesRefereesStats(object):
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
 
+    def _referees_sorted_by(self, referee_results_stat: Callable[[GamesGroupResults], int]) -> List[RefereeStats]:
+        """
+        :return: The referees with a positive stat (like a Counter of the games), sorted by it
+        """
+        return [(referee_name, referee_stat) for referee_name, referee_stat in
+                self.maccabi_games_stats.groups.sorted_groups('referee', referee_results_stat) if referee_stat > 0]
+
+    def _referees_percentage(self, referee_results_stat: Callable[[GamesGroupResults], int]) \
+            -> List[RefereePercentageStats]:
+        referees_percentage: typing.Counter[str] = Counter()
+        for referee_name, judged_times in self.most_judged_referee:
+            referee_results = self.maccabi_games_stats.groups.groups('referee')[referee_name]
+            key_name = "{referee} - {judged}".format(referee=referee_name, judged=judged_times)
+            referees_percentage[key_name] = round(referee_results_stat(referee_results) / judged_times * 100, 2)
+
+        return referees_percentage.most_common()
+
     @property
     def most_judged_referee(self) -> List[RefereeStats]:
-        return Counter(game.referee for game in self.games).most_common()
+        return self._referees_sorted_by(lambda r: r.games_count)
 
     @property
     def best_referee(self) -> List[RefereeStats]:
-        return Counter(game.referee for game in self.games if game.is_maccabi_win).most_common()
+        return self._referees_sorted_by(lambda r: r.wins_count)
 
     @property
     def worst_referee(self) -> List[RefereeStats]:
-        return Counter(game.referee for game in self.games if game.maccabi_score_diff < 0).most_common()
+        return self._referees_sorted_by(lambda r: r.losses_count)
 
     @property
     def best_referee_by_percentage(self) -> List[RefereePercentageStats]:
-        # Both return as Counter.most_common() which is list (of tuples)
-        judged_games = Counter(dict(self.most_judged_referee))
-        games_won_with_referees = Counter(dict(self.best_referee))
-
-        best_referee: typing.Counter[str] = Counter()
-        for referee_name, judged_times in judged_games.items():
-            key_name = "{referee} - {judged}".format(referee=referee_name, judged=judged_times)
-            best_referee[key_name] = round(games_won_with_referees[referee_name] / judged_times * 100, 2)
-
-        return best_referee.most_common()
+        return self._referees_percentage(lambda r: r.wins_count)
 
     @property
     def worst_referee_by_percentage(self) -> List[RefereePercentageStats]:
-        # Both return as Counter.most_common() which is list (of tuples)
-        judged_games = Counter(dict(self.most_judged_referee))
-        games_lost_with_referees = Counter(dict(self.worst_referee))
-
-        best_referee: typing.Counter[str] = Counter()
-        for referee_name, judged_times in judged_games.items():
-            key_name = "{referee} - {judged}".format(referee=referee_name, judged=judged_times)
-            best_referee[key_name] = round(games_lost_with_referees[referee_name] / judged_times * 100, 2)
-
-        return best_referee.most_common()
+        return self._referees_percentage(lambda r: r.losses_count)
@@ -2,42 +2,196 @@ from __future__ import annotations
 
 import logging
 import pprint
-from collections import OrderedDict
-from typing import TYPE_CHECKING, Union, Any, Callable
+from collections import Counter
+from sys import maxsize
+from typing import TYPE_CHECKING, Union, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.stats.comebacks import MaccabiGamesComebacksStats
+from maccabistats.stats.players_categories import HomePlayersDivision
 
 if TYPE_CHECKING:
+    from maccabistats.models.player_in_game import PlayerInGame
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 logger = logging.getLogger(__name__)
 
 
+class _SeasonGamesSummary(object):
+    """
+    The additive values of one season games (counts, players names), summed game by game.
+    The seasons metrics are calculated from it, the same way the stats helpers calculate them from the games.
+    """
+
+    def __init__(self) -> None:
+        self.games_count = 0
+        self.wins_count = 0
+        self.losses_count = 0
+        self.ties_count = 0
+        self.clean_sheets_count = 0
+        self.goals_for_maccabi = 0
+        self.goals_against_maccabi = 0
+        self.comebacks_to_win_count = 0
+        self.potential_comebacks_not_won_count = 0
+
+        self.captains: Set[str] = set()
+        self.played_players: Set[str] = set()
+        self.scored_players: Set[str] = set()
+        self.assisted_players: Set[str] = set()
+        self.goal_involved_players: Set[str] = set()
+        self.penalties_scorers: Set[str] = set()
+
+    def add_game_results(self, game: GameData) -> None:
+        self.games_count += 1
+        self.wins_count += game.is_maccabi_win
+        self.losses_count += game.maccabi_score_diff < 0
+        self.ties_count += game.maccabi_score_diff == 0
+        self.clean_sheets_count += game.not_maccabi_team.score == 0
+        self.goals_for_maccabi += game.maccabi_score
+        self.goals_against_maccabi += game.not_maccabi_team.score
+
+    def add_game_players(self, game: GameData) -> None:
+        for player in game.maccabi_team.players:
+            self._add_player(player)
+
+    def add_game_comebacks(self, game: GameData) -> None:
+        self.comebacks_to_win_count += MaccabiGamesComebacksStats.is_winning_comeback(game)
+        self.potential_comebacks_not_won_count += MaccabiGamesComebacksStats.is_potential_comeback_not_won(game)
+
+    def _add_player(self, player: PlayerInGame) -> None:
+        events_count = Counter(event.event_type for event in player.events)
+        goals_types_count = Counter(event.goal_type for event in player.events
+                                    if event.event_type == GameEventTypes.GOAL_SCORE)
+
+        goals = events_count[GameEventTypes.GOAL_SCORE]
+        assists = events_count[GameEventTypes.GOAL_ASSIST]
+        goals_for_maccabi = goals - goals_types_count[GoalTypes.OWN_GOAL]
+
+        if events_count[GameEventTypes.CAPTAIN] > 0:
+            self.captains.add(player.name)
+        if events_count[GameEventTypes.LINE_UP] > 0 or events_count[GameEventTypes.SUBSTITUTION_IN] > 0:
+            self.played_players.add(player.name)
+        if goals_for_maccabi > 0:
+            self.scored_players.add(player.name)
+        if assists > 0:
+            self.assisted_players.add(player.name)
+        if assists + goals_for_maccabi > 0:
+            self.goal_involved_players.add(player.name)
+        if goals_types_count[GoalTypes.PENALTY] > 0:
+            self.penalties_scorers.add(player.name)
+
+
+def _percentage(count: int, total: int) -> float:
+    if total == 0:
+        return maxsize
+
+    return round(count / total, 3)
+
+
+def _average(total: int, games_count: int) -> float:
+    # Same as MaccabiGamesAverageStats._prettify_averages
+    return float("{0:.2f}".format(total / games_count))
+
+
+def _home_players_ratio(home_players_division: HomePlayersDivision) -> float:
+    home_players_events, non_home_players_events = home_players_division
+    return _percentage(home_players_events, home_players_events + non_home_players_events)
+
+
+_SeasonMetric = Callable[[_SeasonGamesSummary], Any]
+
+_RESULTS_METRICS: Dict[str, _SeasonMetric] = dict(
+    games_count=lambda s: s.games_count,
+    wins_count=lambda s: s.wins_count,
+    wins_percentage=lambda s: _percentage(s.wins_count, s.games_count),
+    losses_count=lambda s: s.losses_count,
+    losses_percentage=lambda s: _percentage(s.losses_count, s.games_count),
+    ties_count=lambda s: s.ties_count,
+    ties_percentage=lambda s: _percentage(s.ties_count, s.games_count),
+    total_goals_diff_for_maccabi=lambda s: s.goals_for_maccabi - s.goals_against_maccabi,
+    average_goals_diff=lambda s: _average(s.goals_for_maccabi - s.goals_against_maccabi, s.games_count),
+    total_goals_for_maccabi=lambda s: s.goals_for_maccabi,
+    average_goals_for_maccabi=lambda s: _average(s.goals_for_maccabi, s.games_count),
+    total_goals_against_maccabi=lambda s: s.goals_against_maccabi,
+    average_goals_against_maccabi=lambda s: _average(s.goals_against_maccabi, s.games_count),
+    clean_sheets_count=lambda s: s.clean_sheets_count,
+    clean_sheets_percentage=lambda s: _percentage(s.clean_sheets_count, s.games_count),
+    goals_ratio=lambda s: maxsize if s.goals_against_maccabi == 0 else round(
+        s.goals_for_maccabi / s.goals_against_maccabi, 3),
+)
+
+_PLAYERS_METRICS: Dict[str, _SeasonMetric] = dict(
+    captains_count=lambda s: len(s.captains),
+    played_players_count=lambda s: len(s.played_players),
+    scored_players_count=lambda s: len(s.scored_players),
+    assisted_players_count=lambda s: len(s.assisted_players),
+    goal_involved_players_count=lambda s: len(s.goal_involved_players),
+    penalties_scorers_count=lambda s: len(s.penalties_scorers),
+)
+
+_COMEBACKS_METRICS: Dict[str, _SeasonMetric] = dict(
+    comebacks_to_win_count=lambda s: s.comebacks_to_win_count,
+    potential_comebacks_not_won_count=lambda s: s.potential_comebacks_not_won_count,
+)
+
+# Each part of the seasons summaries is summed in its own pass over the games, only when one of its metrics is used
+# (the players events & the goals timeline of each game are much slower to go over than the games results)
+_SEASON_SUMMARY_PARTS: Dict[str, Tuple[Callable[[_SeasonGamesSummary, GameData], None], Dict[str, _SeasonMetric]]] = {
+    'results': (_SeasonGamesSummary.add_game_results, _RESULTS_METRICS),
+    'players': (_SeasonGamesSummary.add_game_players, _PLAYERS_METRICS),
+    'comebacks': (_SeasonGamesSummary.add_game_comebacks, _COMEBACKS_METRICS),
+}
+_SEASON_METRICS: Dict[str, Tuple[str, _SeasonMetric]] = {
+    metric_name: (summary_part, season_metric)
+    for summary_part, (_, part_metrics) in _SEASON_SUMMARY_PARTS.items()
+    for metric_name, season_metric in part_metrics.items()}
+
+# The home players metrics are calculated for all the seasons at once, by the players categories stats
+# (metric name -> the players events name & the metric of each season home players division)
+_HOME_PLAYERS_METRICS: Dict[str, Tuple[str, Callable[[HomePlayersDivision], Any]]] = dict(
+    home_players_goals_count=('goals', lambda division: division[0]),
+    home_players_goals_ratio=('goals', _home_players_ratio),
+    home_players_assists_count=('assists', lambda division: division[0]),
+    home_players_assists_ratio=('assists', _home_players_ratio),
+    home_players_goals_involved_count=('goals_involved', lambda division: division[0]),
+    home_players_goals_involved_ratio=('goals_involved', _home_players_ratio),
+)
+
+
 class MaccabiGamesSeasonsStats:
     """
     This class is responsible for maccabi seasons manipulating, such as sorting by wins count, goals for maccabi and so on.
 
-    The pattern for adding "sort_by" function is to add lambda which receive just the season maccabi games stats object,
-    inside the function itself you should set the key with lambda that 'removes' the season string.
-    example function - sort_by_wins_count.
+    The seasons are summarized in a single pass over the games (per summary part, on its first use), each metric is
+    a column of season -> value, calculated once from the seasons summaries. The seasons are sorted by those columns,
+    the season MaccabiGamesStats is created only when it is indexed (seasons['1990/91'] or seasons[0]).
+
+    The pattern for adding "sort_by" function is to add the metric to one of the metrics dicts above
+    (gets the season summary), and sort by its name, example function - sort_by_wins_count.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
 
-        # In order to avoid recursion, when we face one season ony, don't create new MaccabiGamesStats object
-        if len(self.maccabi_games_stats.available_seasons) == 1:
-            self._seasons_dict = {self.maccabi_games_stats.available_seasons[0]: self.maccabi_games_stats}
-        else:
-            self._seasons_dict = {season: self.maccabi_games_stats.get_games_by_season(season) for season in
-                                  self.maccabi_games_stats.available_seasons}
+        self._seasons_summaries: Optional[Dict[str, _SeasonGamesSummary]] = None
+        self._summarized_parts: Set[str] = set()
+        self._metrics_columns: Dict[str, Dict[str, Any]] = dict()
+        self._sorted_seasons: Optional[List[str]] = None
+        self._seasons_games_stats: Dict[str, MaccabiGamesStats] = dict()
 
-        # sort attribute use to show the relevant data after sorting.
-        self._current_sort_attribute_function = str  # Use empty str as default sort
+        # sort attribute use to show the relevant data after sorting (None shows the season games stats).
+        self._current_sort_metric: Optional[str] = None
         self._current_sort_attribute_description = "order by season number"
 
     def __repr__(self) -> str:
         # Pad the season representation to 7 chars, like '2015/16', to have one year seasons aligned (like '1955')
-        ordered_seasons = pprint.pformat([f'{season: <7} ({self._current_sort_attribute_function(self[season])})'
-                                          for season in self._seasons_dict.keys()])
+        if self._current_sort_metric is None:
+            ordered_seasons = pprint.pformat([f'{season: <7} ({self[season]})' for season in self.sorted_seasons])
+        else:
+            current_sort_column = self.metric_column(self._current_sort_metric)
+            ordered_seasons = pprint.pformat([f'{season: <7} ({current_sort_column[season]})'
+                                              for season in self.sorted_seasons])
 
         return f'{self._current_sort_attribute_description}: \n\n{ordered_seasons}'
 
@@ -45,56 +199,112 @@ class MaccabiGamesSeasonsStats:
         """
         :param item: Allow to use ['1990-91'] or by indexing [0]
         """
-        if isinstance(item, int):
-            return list(self._seasons_dict.values())[item]
-        else:
-            return self._seasons_dict[item]
+        season = self.sorted_seasons[item] if isinstance(item, int) else item
+        if season not in self._get_seasons_summaries():
+            raise KeyError(season)
+
+        # In order to avoid recursion, when we face one season ony, don't create new MaccabiGamesStats object
+        if len(self._get_seasons_summaries()) == 1:
+            return self.maccabi_games_stats
+
+        if season not in self._seasons_games_stats:
+            self._seasons_games_stats[season] = self.maccabi_games_stats.get_games_by_season(season)
+
+        return self._seasons_games_stats[season]
 
     def __len__(self) -> int:
-        return len(self._seasons_dict)
+        return len(self._get_seasons_summaries())
 
-    def _refresh_sorting(self,
-                         sort_attribute_function: Callable[[MaccabiGamesStats], Any],
-                         sort_attribute_description: str) -> None:
+    @property
+    def sorted_seasons(self) -> List[str]:
         """
-        Updates the current seasons sorting by the given callable (gets MaccabiGamesStats with a seasons games)
-        :param sort_attribute_function: The callable to sort the seasons by (gets season item - MaccabiGamesStats)
+        The seasons names, by the current sorting
+        """
+        if self._sorted_seasons is None:
+            self._sorted_seasons = sorted(self._get_seasons_summaries().keys())
+
+        return self._sorted_seasons
+
+    def _get_seasons_summaries(self, summary_part: str = 'results') -> Dict[str, _SeasonGamesSummary]:
+        if self._seasons_summaries is None:
+            self._seasons_summaries = dict()
+
+        if summary_part not in self._summarized_parts:
+            add_game_to_summary, _ = _SEASON_SUMMARY_PARTS[summary_part]
+            for game in self.maccabi_games_stats.games:
+                if game.season not in self._seasons_summaries:
+                    self._seasons_summaries[game.season] = _SeasonGamesSummary()
+                add_game_to_summary(self._seasons_summaries[game.season], game)
+            self._summarized_parts.add(summary_part)
+
+        return self._seasons_summaries
+
+    def metric_column(self, metric_name: str) -> Dict[str, Any]:
+        """
+        :param metric_name: One of the seasons metrics, such as: wins_percentage, home_players_goals_count
+        :return: The metric value of each season (season -> value)
+        """
+        if metric_name in _HOME_PLAYERS_METRICS:
+            if metric_name not in self._metrics_columns:
+                events_name, division_metric = _HOME_PLAYERS_METRICS[metric_name]
+                self._metrics_columns[metric_name] = {
+                    season: division_metric(home_players_division) for season, home_players_division in
+                    self.maccabi_games_stats.players_categories.home_players_division_by_season(events_name).items()}
+
+            return self._metrics_columns[metric_name]
+
+        if metric_name not in _SEASON_METRICS:
+            raise RuntimeError(f"Unknown seasons metric: {metric_name}, the known metrics: "
+                               f"{list(_SEASON_METRICS) + list(_HOME_PLAYERS_METRICS)}")
+
+        if metric_name not in self._metrics_columns:
+            summary_part, season_metric = _SEASON_METRICS[metric_name]
+            self._metrics_columns[metric_name] = {
+                season: season_metric(season_summary)
+                for season, season_summary in self._get_seasons_summaries(summary_part).items()}
+
+        return self._metrics_columns[metric_name]
+
+    def _refresh_sorting(self, sort_metric: str, sort_attribute_description: str) -> None:
+        """
+        Updates the current seasons sorting by the given metric column
+        :param sort_metric: The metric to sort the seasons by (one of _SEASON_METRICS or _HOME_PLAYERS_METRICS)
         :param sort_attribute_description: The description of this current sorting, will be shown on the repr
         """
-        self._current_sort_attribute_function = sort_attribute_function
+        sort_column = self.metric_column(sort_metric)
+
+        self._current_sort_metric = sort_metric
         self._current_sort_attribute_description = sort_attribute_description
 
-        self._seasons_dict = OrderedDict(
-            sorted(self._seasons_dict.items(), key=lambda item: self._current_sort_attribute_function(item[1]),
-                   reverse=True))
+        self._sorted_seasons = sorted(self.sorted_seasons, key=sort_column.__getitem__, reverse=True)
 
     # region Games Results
     def sort_by_games_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s),
+        self._refresh_sorting(sort_metric='games_count',
                               sort_attribute_description="sort by games count")
 
     def sort_by_wins_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.wins_count,
+        self._refresh_sorting(sort_metric='wins_count',
                               sort_attribute_description="sort by wins count")
 
     def sort_by_wins_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.wins_percentage,
+        self._refresh_sorting(sort_metric='wins_percentage',
                               sort_attribute_description="sort by wins percentage")
 
     def sort_by_losses_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.losses_count,
+        self._refresh_sorting(sort_metric='losses_count',
                               sort_attribute_description="sort by losses count")
 
     def sort_by_losses_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.losses_percentage,
+        self._refresh_sorting(sort_metric='losses_percentage',
                               sort_attribute_description="sort by losses percentage")
 
     def sort_by_ties_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.ties_count,
+        self._refresh_sorting(sort_metric='ties_count',
                               sort_attribute_description="sort by ties count")
 
     def sort_by_ties_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.ties_percentage,
+        self._refresh_sorting(sort_metric='ties_percentage',
                               sort_attribute_description="sort by ties percentage")
 
     # endregion
@@ -102,105 +312,105 @@ class MaccabiGamesSeasonsStats:
     # region Goals manipulations:
 
     def sort_by_total_goals_diff(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_diff_for_maccabi,
+        self._refresh_sorting(sort_metric='total_goals_diff_for_maccabi',
                               sort_attribute_description="sort by total goals diff for maccabi")
 
     def sort_by_average_goals_diff_per_game(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.averages.maccabi_diff,
+        self._refresh_sorting(sort_metric='average_goals_diff',
                               sort_attribute_description="sort by average (per game) goal diff for maccabi")
 
     def sort_by_total_goals_for_maccabi(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_for_maccabi,
+        self._refresh_sorting(sort_metric='total_goals_for_maccabi',
                               sort_attribute_description="sort by total goals for maccabi")
 
     def sort_by_average_goals_for_maccabi_per_game(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.averages.goals_for_maccabi,
+        self._refresh_sorting(sort_metric='average_goals_for_maccabi',
                               sort_attribute_description="sort by average goals (per game) for maccabi")
 
     def sort_by_total_goals_against_maccabi(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_against_maccabi,
+        self._refresh_sorting(sort_metric='total_goals_against_maccabi',
                               sort_attribute_description="sort by total goals against maccabi")
 
     def sort_by_average_goals_against_maccabi_per_game(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.averages.goals_against_maccabi,
+        self._refresh_sorting(sort_metric='average_goals_against_maccabi',
                               sort_attribute_description="sort by average goals (per game) against maccabi")
 
     def sort_by_clean_sheet_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.clean_sheets_count,
+        self._refresh_sorting(sort_metric='clean_sheets_count',
                               sort_attribute_description="sort by clean sheets count")
 
     def sort_by_clean_sheet_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.clean_sheets_percentage,
+        self._refresh_sorting(sort_metric='clean_sheets_percentage',
                               sort_attribute_description="sort by clean sheets percentage")
 
     def sort_by_goals_ratio(self) -> None:
         """
         Goals for maccabi / Goals against maccabi
         """
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.goals_ratio,
+        self._refresh_sorting(sort_metric='goals_ratio',
                               sort_attribute_description=
                               "sort by goals ratio (Goals for maccabi / Goals against maccabi)")
 
     def sort_by_home_players_goals_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.players_categories.home_players_goals_count(),
+        self._refresh_sorting(sort_metric='home_players_goals_count',
                               sort_attribute_description="sort by home players goals count")
 
     def sort_by_home_players_goals_ratio(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.players_categories.home_players_goals_ratio(),
+        self._refresh_sorting(sort_metric='home_players_goals_ratio',
                               sort_attribute_description="sort by home players goals ratio")
 
     def sort_by_home_players_assists_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.players_categories.home_players_assists_count(),
+        self._refresh_sorting(sort_metric='home_players_assists_count',
                               sort_attribute_description="sort by home players assists count")
 
     def sort_by_home_players_assists_ratio(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.players_categories.home_players_assists_ratio(),
+        self._refresh_sorting(sort_metric='home_players_assists_ratio',
                               sort_attribute_description="sort by home players assists ratio")
 
     def sort_by_home_players_goals_involved_count(self) -> None:
         self._refresh_sorting(
-            sort_attribute_function=lambda s: s.players_categories.home_players_goals_involved_count(),
+            sort_metric='home_players_goals_involved_count',
             sort_attribute_description="sort by home players goals involved count")
 
     def sort_by_home_players_goals_involved_ratio(self) -> None:
         self._refresh_sorting(
-            sort_attribute_function=lambda s: s.players_categories.home_players_goals_involved_ratio(),
+            sort_metric='home_players_goals_involved_ratio',
             sort_attribute_description="sort by home players goals involved ratio")
 
     def sort_by_captains_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.most_captains),
+        self._refresh_sorting(sort_metric='captains_count',
                               sort_attribute_description="sort by the number of different players that were captains")
 
     def sort_by_played_players_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.most_played),
+        self._refresh_sorting(sort_metric='played_players_count',
                               sort_attribute_description="sort by the number of different players that played")
 
     def sort_by_scored_players_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.best_scorers),
+        self._refresh_sorting(sort_metric='scored_players_count',
                               sort_attribute_description="sort by the number of different players that scored")
 
     def sort_by_assisted_players_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.best_assisters),
+        self._refresh_sorting(sort_metric='assisted_players_count',
                               sort_attribute_description="sort by the number of different players that assisted")
 
     def sort_by_goal_involved_players_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.most_goals_involved),
+        self._refresh_sorting(sort_metric='goal_involved_players_count',
                               sort_attribute_description=
                               "sort by the number of different players that were involved in a goal")
 
     def sort_by_penalties_scorers_amount(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.players.best_scorers_by_penalty),
+        self._refresh_sorting(sort_metric='penalties_scorers_count',
                               sort_attribute_description=
                               "sort by the number of different penalties scorers")
 
     def sort_by_comebacks_to_win_amount(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s.comebacks.won_from_any_goal_diff()),
+        self._refresh_sorting(sort_metric='comebacks_to_win_count',
                               sort_attribute_description=
                               "sort by the number of comebacks to winning")
 
     def sort_by_potential_comebacks_that_maccabi_didnt_win(self) -> None:
         self._refresh_sorting(
-            sort_attribute_function=lambda s: len(s.comebacks.games_with_potential_comebacks_that_maccabi_didnt_win()),
+            sort_metric='potential_comebacks_not_won_count',
             sort_attribute_description=
             "sort by the number of potential comebacks that maccabi didn't win")
     # endregion
@@ -0,0 +1,205 @@
+"""
+Append only store of serialized maccabi games.
+
+The store folder contains a base snapshot (pickled MaccabiGamesStats, just like the old serialized .games files),
+delta segments with the games that were added/changed/removed since the base, and a manifest that lists them:
+
+store/
+    manifest.json
+    base-000001.games
+    delta-000002.games
+    delta-000003.games
+
+Saving new games writes only the changed games, loading is base + deltas, and once there are too many deltas they are
+compacted to a new base (on save, or with an explicit compact).
+Games saved by another maccabistats version are written as a new base, the deltas of a single base share its version.
+Every file is written to a temporary file and then renamed, so a crash while saving never leaves a broken segment.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats_utilities.games_ids import index_games_by_id
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_FILE_NAME = "manifest.json"
+_BASE_FILE_NAME_PATTERN = "base-{segment_id:06d}.games"
+_DELTA_FILE_NAME_PATTERN = "delta-{segment_id:06d}.games"
+
+
+@dataclass
+class _StoreManifest(object):
+    base_file_name: str
+    description: str
+    next_segment_id: int
+    delta_files_names: List[str] = field(default_factory=list)
+    # Game id -> game fingerprint, to find which games were changed without loading the store
+    games_fingerprints: Dict[str, str] = field(default_factory=dict)
+    # The version of the saved MaccabiGamesStats, empty for stores from before it was recorded
+    maccabistats_version: str = ""
+
+
+class SerializedGamesStore(object):
+    def __init__(self, folder_path: str, max_deltas_before_compaction: int = 20):
+        """
+        :param folder_path: The folder of this store, will be created on the first save
+        :param max_deltas_before_compaction: When this amount of deltas is reached, the next save compacts the store
+        """
+        self.folder_path = folder_path
+        self.max_deltas_before_compaction = max_deltas_before_compaction
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.folder_path, _MANIFEST_FILE_NAME)
+
+    @property
+    def exists(self) -> bool:
+        return os.path.isfile(self._manifest_path)
+
+    @property
+    def base_file_path(self) -> str:
+        return os.path.join(self.folder_path, self._read_manifest().base_file_name)
+
+    @property
+    def deltas_count(self) -> int:
+        return len(self._read_manifest().delta_files_names)
+
+    @property
+    def maccabistats_version(self) -> str:
+        return self._read_manifest().maccabistats_version
+
+    @property
+    def last_saved_time(self) -> float:
+        return os.path.getmtime(self._manifest_path)
+
+    def save(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        """
+        Save the given games, only the games that were changed since the last save are written (as a new delta).
+        """
+        games_by_id = index_games_by_id(maccabi_games_stats.games)
+        games_fingerprints = {game_id: game.fingerprint for game_id, game in games_by_id.items()}
+
+        if not self.exists:
+            Path(self.folder_path).mkdir(parents=True, exist_ok=True)
+            self._write_base(maccabi_games_stats, segment_id=1, games_fingerprints=games_fingerprints)
+            return
+
+        manifest = self._read_manifest()
+        if manifest.maccabistats_version != maccabi_games_stats.version:
+            logger.info(f"The games store at {self.folder_path} was saved by maccabistats version "
+                        f"{manifest.maccabistats_version or 'unknown'}, writing the games of version "
+                        f"{maccabi_games_stats.version} as a new base")
+            self._replace_base(maccabi_games_stats, manifest, games_fingerprints)
+            return
+
+        changed_games = {game_id: game for game_id, game in games_by_id.items()
+                         if manifest.games_fingerprints.get(game_id) != games_fingerprints[game_id]}
+        removed_games_ids = [game_id for game_id in manifest.games_fingerprints if game_id not in games_fingerprints]
+
+        if not changed_games and not removed_games_ids:
+            logger.info(f"No games were changed since the last save to {self.folder_path}")
+            return
+
+        delta_file_name = _DELTA_FILE_NAME_PATTERN.format(segment_id=manifest.next_segment_id)
+        logger.info(f"Saving {len(changed_games)} changed games and {len(removed_games_ids)} removed games "
+                    f"to {delta_file_name}")
+        self._write_segment(delta_file_name, dict(changed_games=changed_games, removed_games_ids=removed_games_ids))
+
+        manifest.delta_files_names.append(delta_file_name)
+        manifest.next_segment_id += 1
+        manifest.games_fingerprints = games_fingerprints
+        manifest.description = maccabi_games_stats.description
+        self._write_manifest(manifest)
+
+        if len(manifest.delta_files_names) >= self.max_deltas_before_compaction:
+            self.compact()
+
+    def load(self) -> MaccabiGamesStats:
+        """
+        Load the base snapshot and apply all the deltas on top of it.
+        """
+        manifest = self._read_manifest()
+
+        base_file_path = os.path.join(self.folder_path, manifest.base_file_name)
+        logger.info(f"Loading maccabi games from {base_file_path} with {len(manifest.delta_files_names)} deltas")
+        with open(base_file_path, 'rb') as base_file:
+            base_maccabi_games_stats = pickle.load(base_file)
+        games_by_id = index_games_by_id(base_maccabi_games_stats.games)
+
+        for delta_file_name in manifest.delta_files_names:
+            with open(os.path.join(self.folder_path, delta_file_name), 'rb') as delta_file:
+                delta = pickle.load(delta_file)
+
+            for game_id in delta['removed_games_ids']:
+                games_by_id.pop(game_id, None)
+            games_by_id.update(delta['changed_games'])
+
+        maccabi_games_stats = MaccabiGamesStats(list(games_by_id.values()), manifest.description)
+        # The deltas are saved by the version of the base, keep it so compacting the store does not change it
+        maccabi_games_stats.version = base_maccabi_games_stats.version
+        return maccabi_games_stats
+
+    def compact(self) -> str:
+        """
+        Merge the base and all the deltas to a new base, the old segments are deleted.
+        :return: The new base file path (a pickled MaccabiGamesStats)
+        """
+        manifest = self._read_manifest()
+        if not manifest.delta_files_names:
+            return self.base_file_path
+
+        self._replace_base(self.load(), manifest, manifest.games_fingerprints)
+        return self.base_file_path
+
+    def _replace_base(self, maccabi_games_stats: MaccabiGamesStats, manifest: _StoreManifest,
+                      games_fingerprints: Dict[str, str]) -> None:
+        old_segments_names = [manifest.base_file_name] + manifest.delta_files_names
+        self._write_base(maccabi_games_stats, manifest.next_segment_id, games_fingerprints)
+
+        for segment_name in old_segments_names:
+            os.remove(os.path.join(self.folder_path, segment_name))
+
+    def _write_base(self, maccabi_games_stats: MaccabiGamesStats, segment_id: int,
+                    games_fingerprints: Dict[str, str]) -> None:
+        base_file_name = _BASE_FILE_NAME_PATTERN.format(segment_id=segment_id)
+        logger.info(f"Writing new base snapshot with {len(maccabi_games_stats)} games to "
+                    f"{os.path.join(self.folder_path, base_file_name)}")
+        self._write_segment(base_file_name, maccabi_games_stats)
+
+        self._write_manifest(_StoreManifest(base_file_name=base_file_name,
+                                            description=maccabi_games_stats.description,
+                                            next_segment_id=segment_id + 1,
+                                            games_fingerprints=games_fingerprints,
+                                            maccabistats_version=maccabi_games_stats.version))
+
+    def _write_segment(self, segment_file_name: str, segment: object) -> None:
+        segment_path = os.path.join(self.folder_path, segment_file_name)
+        temp_segment_path = f"{segment_path}.tmp"
+        with open(temp_segment_path, 'wb') as segment_file:
+            pickle.dump(segment, segment_file)
+
+        os.replace(temp_segment_path, segment_path)
+
+    def _read_manifest(self) -> _StoreManifest:
+        if not self.exists:
+            raise RuntimeError(f"Cant find serialized games store manifest at: {self._manifest_path}")
+
+        with open(self._manifest_path, 'r', encoding='utf-8') as manifest_file:
+            return _StoreManifest(**json.load(manifest_file))
+
+    def _write_manifest(self, manifest: _StoreManifest) -> None:
+        # Replace the manifest atomically, so a crash while saving never leaves a broken store
+        temp_manifest_path = f"{self._manifest_path}.tmp"
+        with open(temp_manifest_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(asdict(manifest), manifest_file, ensure_ascii=False, indent=4)
+
+        os.replace(temp_manifest_path, self._manifest_path)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from maccabistats.stats.players_cumulative import PlayerCumulativeStats, player_game_stats
+
+if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+_DAYS_IN_YEAR = 365.2425
+
+
+class PlayerBestWindow(NamedTuple):
+    """
+    The best window of a player, starts & ends with the first & last games dates of the window (or seasons).
+    """
+    player_name: str
+    value: int
+    window_start: Union[datetime.datetime, str]
+    window_end: Union[datetime.datetime, str]
+
+
+def _stat_position(stat_name: str) -> int:
+    if stat_name not in PlayerCumulativeStats._fields:
+        raise RuntimeError(f"Unknown player stat: {stat_name}, the known stats: {PlayerCumulativeStats._fields}")
+
+    return PlayerCumulativeStats._fields.index(stat_name)
+
+
+def _top_players_windows(players_best_windows: Dict[str, PlayerBestWindow],
+                         top_players_count: Optional[int]) -> List[PlayerBestWindow]:
+    return sorted(players_best_windows.values(), key=lambda player_window: player_window.value,
+                  reverse=True)[:top_players_count]
+
+
+class MaccabiGamesWindowsStats(object):
+    """
+    This class will handle the best windows of games, like:
+     * The most wins in any 365 days
+     * The best 3 years of a player (by goals)
+     * The top scorers of any 2 consecutive seasons
+
+    The games are ordered by date, so each question is one pass of a sliding window (two pointers) over the games,
+    the window counters are updated with each game that enters or leaves the window.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats):
+        self.maccabi_games_stats = maccabi_games_stats
+        self.games = maccabi_games_stats.games
+
+    # region Maccabi windows
+
+    def _best_window_by_days(self, game_score: Callable[[GameData], int], days: float) -> MaccabiGamesStats:
+        """
+        :param game_score: The score of each game, the window with the highest total score is returned
+        :param days: The window length, the first & last games of a window are played less than this days apart
+        :return: The games of the first window with the highest score
+        """
+        window_length = datetime.timedelta(days=days)
+
+        best_window: Tuple[int, int, int] = (0, 0, 0)  # The window score, start & end (as a slice of the games)
+        window_start = 0
+        window_score = 0
+        for window_end, game in enumerate(self.games):
+            window_score += game_score(game)
+            while game.date - self.games[window_start].date >= window_length:
+                window_score -= game_score(self.games[window_start])
+                window_start += 1
+
+            if window_score > best_window[0]:
+                best_window = (window_score, window_start, window_end + 1)
+
+        _, best_window_start, best_window_end = best_window
+        return self.maccabi_games_stats.create_maccabi_stats_from_games(self.games[best_window_start:best_window_end])
+
+    def most_wins_in_days(self, days: float = 365) -> MaccabiGamesStats:
+        return self._best_window_by_days(lambda game: int(game.is_maccabi_win), days)
+
+    def most_goals_for_maccabi_in_days(self, days: float = 365) -> MaccabiGamesStats:
+        return self._best_window_by_days(lambda game: game.maccabi_score, days)
+
+    def most_clean_sheets_in_days(self, days: float = 365) -> MaccabiGamesStats:
+        return self._best_window_by_days(lambda game: int(game.not_maccabi_team.score == 0), days)
+
+    # endregion
+
+    # region Players windows
+
+    def players_best_days_window(self, days: float, stat_name: str = 'goals',
+                                 top_players_count: Optional[int] = 20) -> List[PlayerBestWindow]:
+        """
+        The best window (by the given stat) of each player, ordered by the players best windows.
+        :param days: The window length, the first & last games of a window are played less than this days apart
+        :param stat_name: One of PlayerCumulativeStats fields (appearances, goals, assists...)
+        :param top_players_count: Return only the first players (all of them when None)
+        """
+        stat_position = _stat_position(stat_name)
+        window_length = datetime.timedelta(days=days)
+
+        # The stat of each player at each game is calculated once, when the game enters the window
+        games_players_stat: List[Counter] = []
+        players_window_stat = Counter()
+        players_best_windows: Dict[str, PlayerBestWindow] = dict()
+
+        window_start = 0
+        for game in self.games:
+            game_players_stat = Counter()
+            for player in game.maccabi_team.players:
+                game_players_stat[player.name] += player_game_stats(game, player)[stat_position]
+            games_players_stat.append(game_players_stat)
+            players_window_stat.update(game_players_stat)
+
+            while game.date - self.games[window_start].date >= window_length:
+                players_window_stat.subtract(games_players_stat[window_start])
+                window_start += 1
+
+            # A player best window ends with a game the player added to (otherwise it could have ended before)
+            for player_name, player_game_stat in game_players_stat.items():
+                best_window = players_best_windows.get(player_name)
+                if player_game_stat > 0 and \
+                        (best_window is None or players_window_stat[player_name] > best_window.value):
+                    players_best_windows[player_name] = PlayerBestWindow(
+                        player_name, players_window_stat[player_name], self.games[window_start].date, game.date)
+
+        return _top_players_windows(players_best_windows, top_players_count)
+
+    def players_best_years_window(self, years: float = 1, stat_name: str = 'goals',
+                                  top_players_count: Optional[int] = 20) -> List[PlayerBestWindow]:
+        """
+        Like players_best_days_window, with a window of years (such as the best 3 years of each player)
+        """
+        return self.players_best_days_window(years * _DAYS_IN_YEAR, stat_name, top_players_count)
+
+    def player_best_years_window(self, player_name: str, years: float = 1,
+                                 stat_name: str = 'goals') -> Optional[PlayerBestWindow]:
+        """
+        :return: The best years of this player (by the given stat), None for players without this stat
+        """
+        players_best_windows = self.players_best_years_window(years, stat_name, top_players_count=None)
+        return next((player_window for player_window in players_best_windows
+                     if player_window.player_name == player_name), None)
+
+    def players_best_seasons_window(self, seasons_count: int, stat_name: str = 'goals',
+                                    top_players_count: Optional[int] = 20) -> List[PlayerBestWindow]:
+        """
+        The best consecutive seasons of each player (by the given stat), such as the top scorers of any 2 seasons.
+        :param seasons_count: The number of consecutive seasons in a window
+        """
+        stat_position = _stat_position(stat_name)
+
+        seasons_players_stat: Dict[str, Counter] = dict()
+        for game in self.games:
+            season_players_stat = seasons_players_stat.setdefault(game.season, Counter())
+            for player in game.maccabi_team.players:
+                season_players_stat[player.name] += player_game_stats(game, player)[stat_position]
+
+        seasons = sorted(seasons_players_stat.keys())
+        players_window_stat = Counter()
+        players_best_windows: Dict[str, PlayerBestWindow] = dict()
+        for window_end, season in enumerate(seasons):
+            players_window_stat.update(seasons_players_stat[season])
+            window_start = max(window_end - seasons_count + 1, 0)
+            if window_start > 0:
+                players_window_stat.subtract(seasons_players_stat[seasons[window_start - 1]])
+
+            for player_name, player_season_stat in seasons_players_stat[season].items():
+                best_window = players_best_windows.get(player_name)
+                if player_season_stat > 0 and \
+                        (best_window is None or players_window_stat[player_name] > best_window.value):
+                    players_best_windows[player_name] = PlayerBestWindow(
+                        player_name, players_window_stat[player_name], seasons[window_start], season)
+
+        return _top_players_windows(players_best_windows, top_players_count)
+
+    # endregion
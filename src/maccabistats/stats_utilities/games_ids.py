@@ -0,0 +1,28 @@
+from collections import Counter
+from typing import Dict, Iterable
+
+from maccabistats.models.game_data import GameData
+
+
+def index_games_by_id(games: Iterable[GameData]) -> Dict[str, GameData]:
+    """
+    Index the games by their id, duplicated games (same id) are kept by adding their fingerprint to their id,
+    so the id of each duplicated game does not depend on the games order.
+    """
+    games = list(games)
+    games_ids_count = Counter(game.game_id for game in games)
+
+    games_by_id = dict()
+    for game in games:
+        game_id = game.game_id
+        if games_ids_count[game_id] > 1:
+            game_id = f"{game.game_id} #{game.fingerprint[:8]}"
+        # Identical duplicated games have the same fingerprint too, so their order does not matter anymore
+        duplicate_counter = 1
+        unique_game_id = game_id
+        while unique_game_id in games_by_id:
+            duplicate_counter += 1
+            unique_game_id = f"{game_id} #{duplicate_counter}"
+        games_by_id[unique_game_id] = game
+
+    return games_by_id
@@ -11,23 +11,30 @@ if TYPE_CHECKING:
 _AFTER_THIS_DATE_3_POINTS_WERE_GIVEN = datetime(year=1982, month=9, day=25)
 
 
-def calculate_possible_points_for_games(games: MaccabiGamesStats) -> int:
-    games_3_points = games.played_after(_AFTER_THIS_DATE_3_POINTS_WERE_GIVEN)
-
-    return (3 * len(games_3_points)) + (2 * (len(games) - len(games_3_points)))
+def _is_3_points_game(game: GameData) -> bool:
+    # Same as game.played_after, without its handling of dates strings
+    return game.date >= _AFTER_THIS_DATE_3_POINTS_WERE_GIVEN
 
 
-def calculate_points_for_games(games: MaccabiGamesStats) -> int:
-    return sum(_point_for_specific_game(game) for game in games)
+def possible_points_for_game(game: GameData) -> int:
+    return 3 if _is_3_points_game(game) else 2
 
 
-def _point_for_specific_game(game: GameData) -> int:
-    if game.played_after(_AFTER_THIS_DATE_3_POINTS_WERE_GIVEN):
+def points_for_game(game: GameData) -> int:
+    if _is_3_points_game(game):
         return _point_by_result(game=game, win_points=3, tie_points=1, lose_points=0)
     else:
         return _point_by_result(game=game, win_points=2, tie_points=1, lose_points=0)
 
 
+def calculate_possible_points_for_games(games: MaccabiGamesStats) -> int:
+    return sum(possible_points_for_game(game) for game in games)
+
+
+def calculate_points_for_games(games: MaccabiGamesStats) -> int:
+    return sum(points_for_game(game) for game in games)
+
+
 def _point_by_result(game: GameData, win_points: int, tie_points: int, lose_points: int) -> int:
     if game.is_maccabi_win:
         return win_points
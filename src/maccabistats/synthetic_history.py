@@ -0,0 +1,324 @@
+"""
+Deterministic synthetic maccabi history, for benchmarks and offline tests (without downloading MaccabiPedia).
+
+The history looks like the real one: seasons from the 30s until today, squads that change a bit every season,
+lineups & substitutions, goals (with assists & own goals), cards, coaches, referees, stadiums and opponents.
+The scale multiplies the games count (the seasons stay the same, each season just has more games),
+so scale=1 is about the size of the real history and scale=100 is 100 times bigger.
+
+The same (scale, seed) always generates the same games.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Dict, Iterator, TYPE_CHECKING
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent, GoalTypes, \
+    AssistGameEvent, AssistTypes
+from maccabistats.models.player_in_game import PlayerInGame
+from maccabistats.models.team_in_game import TeamInGame
+
+if TYPE_CHECKING:
+    from maccabistats.maccabipedia.players import MaccabiPediaPlayerData
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+MACCABI_TEAM_NAME = "מכבי תל אביב"
+REAL_HISTORY_GAMES_COUNT = 5000
+FIRST_SEASON_YEAR = 1935
+LAST_SEASON_YEAR = 2023
+
+_FIRST_NAMES = ["אבי", "משה", "יוסי", "דני", "ערן", "עומר", "שרן", "גיורא", "נחום", "רפי", "ניר", "איציק", "אלון",
+                "דור", "ליאור", "מוטי", "שלום", "חיים", "זהבי", "יעקב", "בוריס", "טל", "גל", "רון", "אייל", "עידן",
+                "מאור", "שי", "אורי", "יהודה", "בן", "עמית", "נתן", "אליניב", "דייגו", "אנטוניו", "מרקו", "יוסף"]
+_LAST_NAMES = ["כהן", "לוי", "מזרחי", "פרץ", "ביטון", "דהן", "אברהם", "פרידמן", "אזולאי", "גולן", "שפירא", "רוזן",
+               "ברקוביץ", "טל", "אטר", "ייני", "זהבי", "מדר", "רביבו", "שכטר", "פרטוש", "אוחנה", "אלמוג", "גלזר",
+               "בלילטי", "חזיזה", "קנדיל", "דגו", "ביבס", "ברדה", "טייב", "סעדה", "נחמיאס", "אשכנזי", "סבג", "מלכה"]
+_OPPONENTS_NAMES = ["הפועל תל אביב", "מכבי חיפה", "בית\"ר ירושלים", "הפועל באר שבע", "בני יהודה", "הפועל חיפה",
+                    "מכבי נתניה", "הפועל פתח תקווה", "בני סכנין", "מכבי פתח תקווה", "הפועל חדרה", "עירוני קריית שמונה",
+                    "הפועל ירושלים", "מכבי יפו", "הפועל רמת גן", "הפועל כפר סבא", "הכח רמת גן", "שמשון תל אביב",
+                    "מכבי הרצליה", "הפועל חולון", "בני ריינה", "הפועל רעננה", "מכבי בני ריינה", "הפועל אשקלון"]
+_EUROPE_OPPONENTS_NAMES = ["ריאל מדריד", "באיירן מינכן", "צ'לסי", "אייאקס", "פורטו", "סלטיק", "בנפיקה", "דינמו קייב",
+                           "אולימפיאקוס", "פנאתינייקוס", "בזל", "ביתר מוסקבה", "פ.צ. קופנהגן", "רד בול זלצבורג"]
+_REFEREES_NAMES = [f"{first_name} {last_name}" for first_name, last_name in
+                   zip(_FIRST_NAMES[::3], reversed(_LAST_NAMES))]
+_HOME_STADIUM = "אצטדיון בלומפילד"
+
+_LEAGUE_COMPETITION = "ליגת העל"
+_TROPHY_COMPETITION = "גביע המדינה"
+_TOTO_COMPETITION = "גביע הטוטו"
+_EUROPE_COMPETITION = "הליגה האירופית"
+_FRIENDLY_COMPETITION = "ידידות"
+_EUROPE_FIRST_SEASON_YEAR = 1967
+
+_SQUAD_SIZE = 26
+_OPPONENT_SQUAD_SIZE = 20
+_LINEUP_SIZE = 11
+_BENCH_SIZE = 7
+
+_GOALS_TYPES = [GoalTypes.NORMAL_KICK] * 12 + [GoalTypes.HEADER] * 4 + [GoalTypes.PENALTY] * 2 + \
+               [GoalTypes.FREE_KICK, GoalTypes.BICYCLE_KICK, GoalTypes.CHEST, GoalTypes.CORNER]
+_ASSISTS_TYPES = [AssistTypes.NORMAL_ASSIST] * 10 + [AssistTypes.CORNER_ASSIST] * 2 + \
+                 [AssistTypes.FREE_KICK_ASSIST, AssistTypes.THROW_IN_ASSIST, AssistTypes.PENALTY_WINNING_ASSIST]
+
+
+@dataclass
+class _SyntheticSquad:
+    # Ordered by importance, the first players play more and score more
+    players_names: List[str]
+    numbers: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _SyntheticSeason:
+    year: int
+    maccabi_squad: _SyntheticSquad
+    maccabi_coach: str
+    opponents_squads: Dict[str, _SyntheticSquad]
+    league_opponents: List[str]
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{str(self.year + 1)[-2:]}"
+
+
+class _SyntheticHistoryGenerator(object):
+    def __init__(self, scale: float, seed: int):
+        self.scale = scale
+        # The squads do not depend on the games (or the scale), so the players data can be generated without the games
+        self._squads_random = random.Random(seed)
+        self._random = random.Random(seed + 1)
+        self._names_count: Dict[str, int] = dict()
+
+        self.maccabi_players_first_season: Dict[str, int] = dict()
+        self.maccabi_home_players: List[str] = []
+
+    # region names & squads
+
+    def _new_player_name(self) -> str:
+        name = f"{self._squads_random.choice(_FIRST_NAMES)} {self._squads_random.choice(_LAST_NAMES)}"
+        self._names_count[name] = self._names_count.get(name, 0) + 1
+        # Same names get a running number, like MaccabiPedia does for players with the same name
+        return name if self._names_count[name] == 1 else f"{name} ({self._names_count[name]})"
+
+    def _next_squad(self, squad: _SyntheticSquad, squad_size: int, players_left: int) -> _SyntheticSquad:
+        """
+        The next season squad, some of the players left and new players joined (on random places at the squad).
+        """
+        stayed_players = [player_name for player_name in squad.players_names[:squad_size]
+                          if self._squads_random.random() > players_left / squad_size]
+        players_names = list(stayed_players)
+        while len(players_names) < squad_size:
+            players_names.insert(self._squads_random.randint(0, len(players_names)), self._new_player_name())
+
+        free_numbers = [number for number in range(1, 100) if number not in squad.numbers.values()]
+        self._squads_random.shuffle(free_numbers)
+        numbers = {player_name: squad.numbers.get(player_name) or free_numbers.pop() for player_name in players_names}
+
+        return _SyntheticSquad(players_names, numbers)
+
+    def _seasons(self) -> Iterator[_SyntheticSeason]:
+        maccabi_squad = self._next_squad(_SyntheticSquad([]), _SQUAD_SIZE, players_left=0)
+        opponents_squads = {opponent_name: self._next_squad(_SyntheticSquad([]), _OPPONENT_SQUAD_SIZE, players_left=0)
+                            for opponent_name in _OPPONENTS_NAMES + _EUROPE_OPPONENTS_NAMES}
+        maccabi_coach = self._new_player_name()
+
+        for season_year in range(FIRST_SEASON_YEAR, LAST_SEASON_YEAR + 1):
+            maccabi_squad = self._next_squad(maccabi_squad, _SQUAD_SIZE, players_left=6)
+            for player_name in maccabi_squad.players_names:
+                if player_name not in self.maccabi_players_first_season:
+                    self.maccabi_players_first_season[player_name] = season_year
+                    if self._squads_random.random() < 0.3:
+                        self.maccabi_home_players.append(player_name)
+
+            if self._squads_random.random() < 0.4:
+                maccabi_coach = self._new_player_name()
+
+            opponents_squads = {opponent_name: self._next_squad(squad, _OPPONENT_SQUAD_SIZE, players_left=5)
+                                for opponent_name, squad in opponents_squads.items()}
+
+            yield _SyntheticSeason(season_year, maccabi_squad, maccabi_coach, opponents_squads,
+                                   league_opponents=self._squads_random.sample(_OPPONENTS_NAMES, 12))
+
+    # endregion
+
+    # region games
+
+    def _pick_players(self, squad: _SyntheticSquad, substitutions_count: int, is_maccabi: bool) -> List[PlayerInGame]:
+        # The first players of the squad are chosen more often
+        weights = [1 / (index + 3) for index in range(len(squad.players_names))]
+        chosen_players = []
+        while len(chosen_players) < _LINEUP_SIZE + _BENCH_SIZE:
+            player_name = self._random.choices(squad.players_names, weights)[0]
+            if player_name not in chosen_players:
+                chosen_players.append(player_name)
+
+        players = [PlayerInGame(player_name, squad.numbers[player_name], []) for player_name in chosen_players]
+        lineup, bench = players[:_LINEUP_SIZE], players[_LINEUP_SIZE:]
+
+        for player in lineup:
+            player.add_event(GameEvent(GameEventTypes.LINE_UP, timedelta(0)))
+        for player in bench:
+            player.add_event(GameEvent(GameEventTypes.BENCHED, timedelta(0)))
+        if is_maccabi or self._random.random() < 0.5:
+            lineup[0].add_event(GameEvent(GameEventTypes.CAPTAIN, timedelta(0)))
+
+        # The goalkeeper (the last at the lineup) is not substituted
+        for player_out, player_in in zip(self._random.sample(lineup[:-1], substitutions_count),
+                                         self._random.sample(bench, substitutions_count)):
+            substitution_time = timedelta(minutes=self._random.randint(46, 88))
+            player_out.add_event(GameEvent(GameEventTypes.SUBSTITUTION_OUT, substitution_time))
+            player_in.add_event(GameEvent(GameEventTypes.SUBSTITUTION_IN, substitution_time))
+
+        for player in players:
+            if not player.played_in_game:
+                continue
+
+            card_probability = self._random.random()
+            if card_probability < 0.01:
+                first_yellow_minute = self._random.randint(1, 60)
+                player.add_event(GameEvent(GameEventTypes.FIRST_YELLOW_CARD, timedelta(minutes=first_yellow_minute)))
+                second_yellow_time = timedelta(minutes=self._random.randint(first_yellow_minute + 1, 90))
+                player.add_event(GameEvent(GameEventTypes.SECOND_YELLOW_CARD, second_yellow_time))
+                player.add_event(GameEvent(GameEventTypes.RED_CARD, second_yellow_time))
+            elif card_probability < 0.02:
+                player.add_event(GameEvent(GameEventTypes.RED_CARD, timedelta(minutes=self._random.randint(1, 90))))
+            elif card_probability < 0.12:
+                player.add_event(GameEvent(GameEventTypes.YELLOW_CARD, timedelta(minutes=self._random.randint(1, 90))))
+
+        return players
+
+    def _add_goals(self, scoring_team_players: List[PlayerInGame], other_team_players: List[PlayerInGame],
+                   goals_count: int) -> None:
+        scoring_team_played_players = [player for player in scoring_team_players if player.played_in_game]
+        other_team_played_players = [player for player in other_team_players if player.played_in_game]
+        # The goalkeeper is the last at the lineup (rarely scores), the strikers are right before him
+        weights = [0.01 if index == _LINEUP_SIZE - 1 else index + 1 for index in range(len(scoring_team_played_players))]
+
+        for _ in range(goals_count):
+            goal_time = timedelta(minutes=self._random.randint(1, 90))
+
+            if self._random.random() < 0.03:
+                own_goal_scorer = self._random.choice(other_team_played_players)
+                own_goal_scorer.add_event(GoalGameEvent(goal_time, GoalTypes.OWN_GOAL))
+                continue
+
+            scorer = self._random.choices(scoring_team_played_players, weights)[0]
+            goal_type = self._random.choice(_GOALS_TYPES)
+            scorer.add_event(GoalGameEvent(goal_time, goal_type))
+
+            if goal_type != GoalTypes.PENALTY and self._random.random() < 0.6:
+                assister = self._random.choice(scoring_team_played_players)
+                if assister is not scorer:
+                    assister.add_event(AssistGameEvent(goal_time, self._random.choice(_ASSISTS_TYPES)))
+
+    def _season_competitions(self, season_year: int, games_count: int) -> List[str]:
+        league_games_count = round(games_count * 0.6)
+        trophy_games_count = round(games_count * 0.1)
+        europe_games_count = round(games_count * 0.1) if season_year >= _EUROPE_FIRST_SEASON_YEAR else 0
+        toto_games_count = round(games_count * 0.1) if season_year >= 1984 else 0
+
+        competitions = [_LEAGUE_COMPETITION] * league_games_count + [_TROPHY_COMPETITION] * trophy_games_count + \
+                       [_EUROPE_COMPETITION] * europe_games_count + [_TOTO_COMPETITION] * toto_games_count
+        competitions = competitions[:games_count] + [_FRIENDLY_COMPETITION] * (games_count - len(competitions))
+        self._random.shuffle(competitions)
+
+        return competitions
+
+    def _build_game(self, date: datetime, season: _SyntheticSeason, competition: str, fixture: str,
+                    opponent_name: str) -> GameData:
+        # Early seasons had no substitutions at all
+        substitutions_count = 0 if season.year < 1970 else (2 if season.year < 1995 else 4)
+        maccabi_players = self._pick_players(season.maccabi_squad, substitutions_count, is_maccabi=True)
+        opponent_players = self._pick_players(season.opponents_squads[opponent_name], substitutions_count,
+                                              is_maccabi=False)
+
+        self._add_goals(maccabi_players, opponent_players,
+                        goals_count=self._random.choices(range(8), [22, 30, 24, 12, 6, 3, 2, 1])[0])
+        self._add_goals(opponent_players, maccabi_players,
+                        goals_count=self._random.choices(range(6), [38, 32, 18, 8, 3, 1])[0])
+        for player in maccabi_players + opponent_players:
+            player.events.sort(key=lambda event: event.time_occur)
+
+        maccabi_team = TeamInGame(MACCABI_TEAM_NAME, season.maccabi_coach,
+                                  self._team_score(maccabi_players, opponent_players), maccabi_players)
+        opponent_team = TeamInGame(opponent_name, f"מאמן {opponent_name}",
+                                   self._team_score(opponent_players, maccabi_players), opponent_players)
+
+        is_home_game = self._random.random() < 0.5
+        home_team, away_team = (maccabi_team, opponent_team) if is_home_game else (opponent_team, maccabi_team)
+        stadium = _HOME_STADIUM if is_home_game else f"אצטדיון {opponent_name}"
+
+        return GameData(competition=competition, fixture=fixture, date_as_hebrew_string="", stadium=stadium,
+                        crowd=str(self._random.randrange(1000, 30000, 500)),
+                        referee=self._random.choice(_REFEREES_NAMES), home_team=home_team, away_team=away_team,
+                        season_string=season.name, half_parsed_events=[], date=date, technical_result=False)
+
+    @staticmethod
+    def _team_score(team_players: List[PlayerInGame], other_team_players: List[PlayerInGame]) -> int:
+        """
+        The team goals, without its own goals (they are counted to the other team).
+        """
+        goals = sum(player.event_count_by_type(GameEventTypes.GOAL_SCORE) -
+                    player.goals_count_by_goal_type(GoalTypes.OWN_GOAL) for player in team_players)
+        own_goals = sum(player.goals_count_by_goal_type(GoalTypes.OWN_GOAL) for player in other_team_players)
+        return goals + own_goals
+
+    # endregion
+
+    def generate(self) -> Iterator[GameData]:
+        seasons_count = LAST_SEASON_YEAR - FIRST_SEASON_YEAR + 1
+        games_per_season = max(1, round(REAL_HISTORY_GAMES_COUNT * self.scale / seasons_count))
+
+        for season in self._seasons():
+            season_start = datetime(season.year, 8, 20, 20)
+            season_length_hours = (datetime(season.year + 1, 5, 31) - season_start).total_seconds() // 3600
+            fixtures_counters = dict()
+
+            for game_index, competition in enumerate(self._season_competitions(season.year, games_per_season)):
+                date = season_start + timedelta(hours=season_length_hours * game_index // games_per_season)
+
+                fixtures_counters[competition] = fixtures_counters.get(competition, 0) + 1
+                fixture = f"מחזור {fixtures_counters[competition]}" if competition == _LEAGUE_COMPETITION else ""
+
+                opponents_names = _EUROPE_OPPONENTS_NAMES if competition == _EUROPE_COMPETITION \
+                    else season.league_opponents
+                yield self._build_game(date, season, competition, fixture, self._random.choice(opponents_names))
+
+    def generate_maccabi_players_data(self) -> Dict[str, MaccabiPediaPlayerData]:
+        from maccabistats.maccabipedia.players import MaccabiPediaPlayerData
+
+        for _ in self._seasons():
+            pass
+
+        home_players = set(self.maccabi_home_players)
+        return {player_name: MaccabiPediaPlayerData(player_name,
+                                                    datetime(first_season - self._squads_random.randint(17, 23),
+                                                             self._squads_random.randint(1, 12),
+                                                             self._squads_random.randint(1, 28)),
+                                                    player_name in home_players)
+                for player_name, first_season in self.maccabi_players_first_season.items()}
+
+
+def generate_synthetic_games(scale: float = 1, seed: int = 0) -> List[GameData]:
+    """
+    :param scale: 1 is about the real history size, 10 is ten times bigger (more games at each season) and so on
+    :param seed: Each seed generates different (but deterministic) history
+    """
+    return list(_SyntheticHistoryGenerator(scale, seed).generate())
+
+
+def generate_synthetic_players_data(scale: float = 1, seed: int = 0) -> Dict[str, MaccabiPediaPlayerData]:
+    """
+    MaccabiPedia players data (birth dates & home players) for the maccabi players of the synthetic history
+    with the same scale & seed, use it with MaccabiPediaPlayers.set_players_data.
+    """
+    return _SyntheticHistoryGenerator(scale, seed).generate_maccabi_players_data()
+
+
+def generate_synthetic_maccabi_games_stats(scale: float = 1, seed: int = 0) -> MaccabiGamesStats:
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+    return MaccabiGamesStats(generate_synthetic_games(scale, seed), f"Synthetic history (scale={scale}, seed={seed})")
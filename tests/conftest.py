@@ -1,8 +1,37 @@
+import logging
+import os
+
 import pytest
-from maccabistats import load_from_maccabipedia_source
+from maccabistats import load_from_maccabipedia_source, maccabilogging
+from maccabistats.maccabilogging import stop_logging_listener
+from maccabistats.maccabipedia.players import MaccabiPediaPlayers
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.synthetic_history import generate_synthetic_maccabi_games_stats, generate_synthetic_players_data
 
 
 @pytest.fixture(scope="session")
 def maccabipedia_maccabistats() -> MaccabiGamesStats:
     return load_from_maccabipedia_source()
+
+
+@pytest.fixture(scope="session")
+def synthetic_maccabistats() -> MaccabiGamesStats:
+    """
+    Offline games (a fifth of the real history size), the maccabipedia players data is replaced with the synthetic one.
+    """
+    MaccabiPediaPlayers.set_players_data(generate_synthetic_players_data(scale=0.2))
+    return generate_synthetic_maccabi_games_stats(scale=0.2)
+
+
+@pytest.fixture
+def isolated_maccabistats_logger(tmp_path, monkeypatch):
+    monkeypatch.setattr(maccabilogging, 'log_file_path_pattern', os.path.join(tmp_path, "maccabistats-{suffix}.log"))
+    monkeypatch.setattr(maccabilogging, 'log_file_folder_path', str(tmp_path))
+    monkeypatch.setattr(maccabilogging.logger, 'handlers', [])
+    monkeypatch.setattr(maccabilogging.logger, 'level', logging.NOTSET)
+
+    yield maccabilogging.logger
+
+    stop_logging_listener()
+    for handler in maccabilogging.logger.handlers:
+        handler.close()
@@ -0,0 +1,19 @@
+import datetime
+
+import pytest
+from dateutil.parser import parse as datetime_parser
+
+from maccabistats.date_parsing import parse_date
+
+
+@pytest.mark.parametrize('date_string', ['2000-05-03', '2000-05-03 ', '2000-05-03 20:15', '1955-02-05 00:00:00',
+                                         '01.02.1990', 'May 3 2000', '1000'])
+def test__parse_date__should_be_the_same_as_dateutil(date_string):
+    assert parse_date(date_string) == datetime_parser(date_string)
+    assert parse_date(date_string, dayfirst=True) == datetime_parser(date_string, dayfirst=True)
+
+
+def test__parse_date__should_parse_the_formats_dateutil_does_not_know():
+    assert parse_date('1985_11_30') == datetime.datetime(1985, 11, 30)
+    assert parse_date(' 12 ינו 1990') == datetime.datetime(1990, 1, 12)
+    assert parse_date('12 ינו 1990 20:30') == datetime.datetime(1990, 1, 12)
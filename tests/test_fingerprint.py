@@ -0,0 +1,41 @@
+import copy
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games_store import SerializedGamesStore
+
+
+def test__json_round_trip__should_keep_games_ids_and_fingerprints(synthetic_maccabistats):
+    loaded_maccabistats = MaccabiGamesStats.from_json(synthetic_maccabistats.to_json())
+
+    assert [game.game_id for game in loaded_maccabistats] == [game.game_id for game in synthetic_maccabistats]
+    assert loaded_maccabistats.fingerprint == synthetic_maccabistats.fingerprint
+
+
+def test__changed_game__should_have_new_fingerprint(synthetic_maccabistats):
+    game = copy.deepcopy(synthetic_maccabistats[-1])
+    original_fingerprint = game.fingerprint
+
+    game.maccabi_team.players.reverse()
+    game.refresh_fingerprint()
+    assert game.fingerprint == original_fingerprint
+
+    game.maccabi_team.players.pop()
+    game.refresh_fingerprint()
+    assert game.fingerprint != original_fingerprint
+
+
+def test__refreshed_deep_copy__should_be_found_by_the_diff_and_the_store(tmp_path, synthetic_maccabistats):
+    # The cached fingerprints are copied with the games, the change is seen after refreshing them (like the fixes do)
+    assert synthetic_maccabistats.fingerprint
+    changed_maccabistats = copy.deepcopy(synthetic_maccabistats)
+    changed_maccabistats.games[0].home_team.score += 3
+    assert changed_maccabistats.fingerprint == synthetic_maccabistats.fingerprint
+
+    changed_maccabistats.games[0].refresh_fingerprint()
+    assert changed_maccabistats.fingerprint != synthetic_maccabistats.fingerprint
+    assert len(synthetic_maccabistats.diff(changed_maccabistats).modified_games) == 1
+
+    games_store = SerializedGamesStore(str(tmp_path))
+    games_store.save(synthetic_maccabistats)
+    games_store.save(changed_maccabistats)
+    assert games_store.load()[0].home_team.score == synthetic_maccabistats[0].home_team.score + 3
@@ -0,0 +1,42 @@
+import copy
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+
+def test__diff_same_games__should_have_no_changes(synthetic_maccabistats):
+    assert not synthetic_maccabistats.diff(MaccabiGamesStats.from_json(synthetic_maccabistats.to_json())).has_changes
+
+
+def test__diff_changed_games__should_find_added_and_removed_games(synthetic_maccabistats):
+    old_maccabistats = MaccabiGamesStats(synthetic_maccabistats.games[:-1])
+    new_maccabistats = MaccabiGamesStats(synthetic_maccabistats.games[1:])
+
+    games_diff = new_maccabistats.diff(old_maccabistats)
+
+    assert games_diff.added_games == [synthetic_maccabistats[-1]]
+    assert games_diff.removed_games == [synthetic_maccabistats[0]]
+    assert not games_diff.modified_games
+
+
+def test__diff_modified_game__should_find_the_changed_fields_and_events(synthetic_maccabistats):
+    new_games = copy.deepcopy(synthetic_maccabistats.games)
+    new_games[-1].referee = 'New referee'
+    removed_player = new_games[-1].maccabi_team.players.pop()
+    new_games[-1].refresh_fingerprint()
+
+    games_diff = MaccabiGamesStats(new_games).diff(synthetic_maccabistats)
+
+    assert len(games_diff.modified_games) == 1
+    game_diff = games_diff.modified_games[0]
+    assert game_diff.changed_fields['referee'] == (synthetic_maccabistats[-1].referee, 'New referee')
+    assert [player['name'] for player in game_diff.removed_players] == [removed_player.name]
+    assert len(game_diff.removed_events) == len(removed_player.events)
+
+
+def test__diff_reordered_duplicated_games__should_have_no_changes(synthetic_maccabistats):
+    duplicated_game = copy.deepcopy(synthetic_maccabistats[0])
+    duplicated_game.referee = 'Another referee'
+    duplicated_game.refresh_fingerprint()
+    games = synthetic_maccabistats.games + [duplicated_game]
+
+    assert not MaccabiGamesStats(games).diff(MaccabiGamesStats(list(reversed(games)))).has_changes
@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.mark.parametrize('grouping_key, group_name_of_game', [
+    ('opponent', lambda game: game.not_maccabi_team.current_name),
+    ('coach', lambda game: game.maccabi_team.coach),
+    ('referee', lambda game: game.referee),
+    ('stadium', lambda game: game.stadium),
+])
+def test__games_groups__should_have_the_same_results_as_the_group_games(synthetic_maccabistats, grouping_key,
+                                                                         group_name_of_game):
+    for group_name, group_results in synthetic_maccabistats.groups.groups(grouping_key).items():
+        group_games = synthetic_maccabistats.create_maccabi_stats_from_games(
+            [game for game in synthetic_maccabistats if group_name_of_game(game) == group_name])
+
+        assert group_results.games_count == len(group_games)
+        assert group_results.wins_percentage == group_games.results.wins_percentage
+        assert group_results.clean_sheets_count == group_games.results.clean_sheets_count
+        assert group_results.goals_ratio == group_games.results.goals_ratio
+        assert group_results.total_goals_diff_for_maccabi == group_games.results.total_goals_diff_for_maccabi
+
+
+def test__sorted_groups__should_filter_by_minimum_games_and_take_the_top_groups(synthetic_maccabistats):
+    teams = synthetic_maccabistats.groups.sorted_groups('opponent', lambda t: t.wins_count, top_n=5, minimum_games=30)
+    opponents = synthetic_maccabistats.groups.groups('opponent')
+
+    assert len(teams) == 5
+    assert [wins_count for _, wins_count in teams] == sorted((wins_count for _, wins_count in teams), reverse=True)
+    assert all(opponents[team_name].games_count >= 30 for team_name, _ in teams)
+    assert teams == synthetic_maccabistats.teams.teams_ordered_by_maccabi_wins(5, 30)
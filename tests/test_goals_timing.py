@@ -0,0 +1,46 @@
+import pytest
+
+from maccabistats.models.player_game_events import GoalTypes
+
+
+def _maccabi_goals_minutes(game):
+    goals_times = [goal['time_occur'].split(':') for goal in game.maccabi_goals()]
+    return sorted(int(hours) * 60 + int(minutes) for hours, minutes, _ in goals_times)
+
+
+@pytest.mark.parametrize('goals_number', [2, 3, 4])
+def test__fastest_x_goals__should_be_the_minimum_time_frame_of_the_games_goals(synthetic_maccabistats, goals_number):
+    fastest_goals = synthetic_maccabistats.goals_timing.fastest_x_goals(goals_number, top_games_number=None)
+
+    assert fastest_goals
+    assert [time_frame for _, time_frame in fastest_goals] == sorted(time_frame for _, time_frame in fastest_goals)
+    for game, time_frame in fastest_goals:
+        goals_minutes = _maccabi_goals_minutes(game)
+        assert game.maccabi_score >= goals_number
+        assert time_frame == min(goals_minutes[i + goals_number - 1] - goals_minutes[i]
+                                 for i in range(len(goals_minutes) - goals_number + 1))
+
+
+def test__fastest_goals__should_be_the_fastest_x_goals_of_every_goals_number(synthetic_maccabistats):
+    goals_timing = synthetic_maccabistats.goals_timing
+    fastest_goals = goals_timing.fastest_goals(top_games_number=3)
+
+    assert fastest_goals[2] == goals_timing.fastest_two_goals(top_games_number=3)
+    assert fastest_goals[3] == goals_timing.fastest_three_goals(top_games_number=3)
+    assert all(1 <= len(top_games) <= 3 for top_games in fastest_goals.values())
+
+
+def test__fastest_goals_conceded__should_count_the_opponents_goals(synthetic_maccabistats):
+    fastest_goals_conceded = synthetic_maccabistats.goals_timing.fastest_goals_conceded(top_games_number=None)
+
+    for goals_number, top_games in fastest_goals_conceded.items():
+        assert all(game.not_maccabi_team.score >= goals_number for game, _ in top_games)
+
+
+def test__maccabi_goals__should_count_own_goals_for_the_other_team(synthetic_maccabistats):
+    games_with_own_goals = [game for game in synthetic_maccabistats
+                            if any(goal['goal_type'] == GoalTypes.OWN_GOAL.value for goal in game.goals())]
+
+    assert games_with_own_goals
+    for game in games_with_own_goals:
+        assert len(game.maccabi_goals()) == game.goals()[-1]['maccabi_score']
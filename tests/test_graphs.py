@@ -0,0 +1,54 @@
+import copy
+
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.graphs import PlayerChartType, rendered_charts_cache
+
+
+def _top_scorers_names(maccabi_games_stats, players_count):
+    return [player_name for player_name, _ in maccabi_games_stats.players.best_scorers[:players_count]]
+
+
+def test__render_player_chart__should_return_the_image_bytes(synthetic_maccabistats):
+    player_name = _top_scorers_names(synthetic_maccabistats, 1)[0]
+
+    png_image = synthetic_maccabistats.graphs.render_histogram_for_player_goals(player_name)
+    svg_image = synthetic_maccabistats.graphs.render_bar_chart_for_player_goals_by_thirds(player_name,
+                                                                                          image_format='svg')
+
+    assert png_image.startswith(b'\x89PNG')
+    assert b'<svg' in svg_image
+
+
+def test__render_player_chart__should_use_the_cache_of_the_same_games(synthetic_maccabistats):
+    player_name = _top_scorers_names(synthetic_maccabistats, 1)[0]
+    rendered_image = synthetic_maccabistats.graphs.render_player_chart(player_name, PlayerChartType.GOALS_BY_THIRDS)
+
+    # Another games stats object of the same games has the same fingerprint
+    same_games = synthetic_maccabistats.create_maccabi_stats_from_games(synthetic_maccabistats.games)
+    assert same_games.graphs.render_player_chart(player_name, PlayerChartType.GOALS_BY_THIRDS) is rendered_image
+
+
+def test__render_players_charts__should_render_each_player_chart(synthetic_maccabistats):
+    rendered_charts_cache.clear()
+    players_names = _top_scorers_names(synthetic_maccabistats, 8)
+
+    players_images = synthetic_maccabistats.graphs.render_players_charts(players_names, processes_count=2)
+
+    assert list(players_images) == players_names
+    for player_name in players_names:
+        assert players_images[player_name] == synthetic_maccabistats.graphs.render_player_chart(player_name)
+
+
+def test__goals_distribution__should_follow_refreshed_games(synthetic_maccabistats):
+    games = copy.deepcopy(synthetic_maccabistats).games
+    player_name = _top_scorers_names(synthetic_maccabistats, 1)[0]
+    changed_games = synthetic_maccabistats.create_maccabi_stats_from_games(games)
+    goals_count = sum(changed_games.graphs.goals_distribution_for_player(player_name).values())
+
+    player_game = next(game for game in games for player in game.maccabi_team.players
+                       if player.name == player_name and player.get_events_by_type(GameEventTypes.GOAL_SCORE))
+    player = next(player for player in player_game.maccabi_team.players if player.name == player_name)
+    player.events.remove(player.get_events_by_type(GameEventTypes.GOAL_SCORE)[0])
+    player_game.refresh_fingerprint()
+
+    assert sum(changed_games.graphs.goals_distribution_for_player(player_name).values()) == goals_count - 1
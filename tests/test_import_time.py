@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+# Generous budget (it takes ~10ms), just to catch heavy imports that sneak back to "import maccabistats"
+_IMPORT_TIME_BUDGET_IN_MICROSECONDS = 100_000
+_HEAVY_MODULES = ['matplotlib', 'requests', 'bs4', 'lxml', 'maccabistats.parse', 'maccabistats.stats']
+
+
+def _import_times(statement: str):
+    """
+    :return: Imported module name -> cumulative import time in microseconds (by python -X importtime)
+    """
+    import_time_output = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                        capture_output=True, text=True, check=True).stderr
+
+    # Each line looks like: "import time:       485 |      10580 | maccabistats"
+    import_times = dict()
+    for line in import_time_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_time, module_name = line.split('|')
+        import_times[module_name.strip()] = int(cumulative_time)
+
+    return import_times
+
+
+def test__import_maccabistats__should_be_in_the_time_budget():
+    assert _import_times('import maccabistats')['maccabistats'] < _IMPORT_TIME_BUDGET_IN_MICROSECONDS
+
+
+def test__import_maccabistats__should_not_import_heavy_modules():
+    imported_modules = _import_times('import maccabistats')
+
+    assert not [module for module in imported_modules for heavy_module in _HEAVY_MODULES if
+                module == heavy_module or module.startswith(f"{heavy_module}.")]
@@ -0,0 +1,47 @@
+from collections import Counter
+
+import pytest
+
+from maccabistats.models.player_game_events import GoalTypes
+
+
+def _important_goals_scorers(maccabi_games_stats, minimum_diff, maximum_diff, from_minute=0):
+    return Counter(goal['name'] for game in maccabi_games_stats for goal in game.goals()
+                   if goal['team'] == game.maccabi_team.name and goal['goal_type'] != GoalTypes.OWN_GOAL.value and
+                   minimum_diff <= goal['maccabi_score'] - goal['not_maccabi_score'] <= maximum_diff and
+                   goal['time_occur'] > f'{from_minute // 60}:{from_minute % 60:02}:00')
+
+
+@pytest.mark.parametrize('minimum_diff, maximum_diff', [(0, 1), (1, 1), (-2, 1)])
+def test__get_top_scorers__should_count_the_goals_by_the_score_after_them(synthetic_maccabistats,
+                                                                          minimum_diff, maximum_diff):
+    top_scorers = synthetic_maccabistats.important_goals.get_top_scorers(minimum_diff, maximum_diff)
+
+    assert dict(top_scorers) == _important_goals_scorers(synthetic_maccabistats, minimum_diff, maximum_diff)
+    assert [goals for _, goals in top_scorers] == sorted((goals for _, goals in top_scorers), reverse=True)
+
+
+def test__get_top_scorers_in_last_minutes__should_count_only_the_goals_after_the_minute(synthetic_maccabistats):
+    top_scorers = synthetic_maccabistats.important_goals.get_top_scorers_in_last_minutes(0, 1, from_minute=75)
+
+    assert dict(top_scorers) == _important_goals_scorers(synthetic_maccabistats, 0, 1, from_minute=75)
+
+
+def test__goals_table__should_have_all_the_maccabi_goals_without_own_goals(synthetic_maccabistats):
+    goals_table = synthetic_maccabistats.important_goals.goals_table
+
+    assert len(goals_table.scorer_ids) == sum(goals for _, goals in synthetic_maccabistats.players.best_scorers)
+    assert (goals_table.score_diff_after - goals_table.score_diff_before == 1).all()
+
+
+def test__get_top_players_for_goals_per_game__should_divide_by_the_played_games(synthetic_maccabistats):
+    important_goals = dict(synthetic_maccabistats.important_goals.get_top_scorers(0, 1))
+    players_played_games = dict(synthetic_maccabistats.players.most_played)
+
+    top_players = synthetic_maccabistats.important_goals.get_top_players_for_goals_per_game(0, 1, minimum_games=20)
+
+    assert top_players
+    for player_description, goals_per_game in top_players:
+        player_name = player_description.rsplit(' - ', 1)[0]
+        assert players_played_games[player_name] >= 20
+        assert goals_per_game == round(important_goals.get(player_name, 0) / players_played_games[player_name], 5)
@@ -0,0 +1,53 @@
+import json
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+from maccabistats.stats.instrumentation import StatsInstrumentation
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+
+def test__instrumentation__should_count_stats_calls_and_their_callers(synthetic_maccabistats):
+    with StatsInstrumentation() as instrumentation:
+        synthetic_maccabistats.home_games.players.best_scorers
+        synthetic_maccabistats.players.best_scorers
+        synthetic_maccabistats.seasons.sort_by_wins_percentage()
+
+    assert instrumentation.calls_stats['MaccabiGamesPlayersStats.best_scorers'].calls == 2
+    assert instrumentation.calls_stats['MaccabiGamesStats.home_games'].calls == 1
+    assert instrumentation.calls_stats['MaccabiGamesSeasonsStats.sort_by_wins_percentage'].calls == 1
+    # The seasons are sorted from their metrics table, without creating MaccabiGamesStats per season
+    assert 'MaccabiGamesResultsStats.wins_percentage' not in instrumentation.calls_stats
+
+
+def test__disabled_instrumentation__should_restore_the_stats_classes(synthetic_maccabistats):
+    original_home_games = vars(MaccabiGamesStats)['home_games']
+
+    with StatsInstrumentation(trace_allocations=False) as instrumentation:
+        assert vars(MaccabiGamesStats)['home_games'] is not original_home_games
+
+    synthetic_maccabistats.home_games
+    assert vars(MaccabiGamesStats)['home_games'] is original_home_games
+    assert not instrumentation.calls_stats
+
+
+def test__instrumentation_reports__should_be_readable_as_json_and_pstats(synthetic_maccabistats, tmp_path):
+    with StatsInstrumentation() as instrumentation:
+        synthetic_maccabistats.players.most_played
+
+    instrumentation.save(str(tmp_path / 'report.json'))
+    instrumentation.save(str(tmp_path / 'report.prof'))
+
+    with open(tmp_path / 'report.json', encoding='utf-8') as json_report:
+        assert json.load(json_report)['calls'][0]['name'] == 'MaccabiGamesPlayersStats.most_played'
+    assert pstats.Stats(str(tmp_path / 'report.prof')).total_calls == 1
+
+
+def test__instrumentation_in_threads__should_keep_each_thread_calls_stack(synthetic_maccabistats):
+    with StatsInstrumentation(trace_allocations=False) as instrumentation:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: synthetic_maccabistats.home_games.players.best_scorers, range(20)))
+
+    best_scorers_stats = instrumentation.calls_stats['MaccabiGamesPlayersStats.best_scorers']
+    assert best_scorers_stats.calls == 20
+    assert best_scorers_stats.callers == {}
+    assert instrumentation.calls_stats['MaccabiGamesStats.home_games'].calls == 20
@@ -0,0 +1,17 @@
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+
+def test__json_round_trip__should_keep_players_and_events(synthetic_maccabistats):
+    loaded_maccabistats = MaccabiGamesStats.from_json(synthetic_maccabistats.to_json())
+
+    assert len(loaded_maccabistats) == len(synthetic_maccabistats)
+    assert loaded_maccabistats.to_json() == synthetic_maccabistats.to_json()
+    for loaded_game, game in zip(loaded_maccabistats, synthetic_maccabistats):
+        assert loaded_game.events == game.events
+
+
+def test__json_file_round_trip__should_load_the_same_games(tmp_path, synthetic_maccabistats):
+    json_path = synthetic_maccabistats.serialize_to_json(str(tmp_path / 'games.json'))
+
+    loaded_maccabistats = MaccabiGamesStats.from_json_file(json_path)
+    assert loaded_maccabistats.get_summary() == synthetic_maccabistats.get_summary()
@@ -0,0 +1,38 @@
+import pytest
+
+from maccabistats.stats_utilities.points_calculator import calculate_points_for_games, \
+    calculate_possible_points_for_games
+
+
+@pytest.fixture(scope="module")
+def league_games(synthetic_maccabistats):
+    return synthetic_maccabistats.league_games
+
+
+def test__points_between__should_be_the_points_of_the_games_range(league_games):
+    games_range = league_games.create_maccabi_stats_from_games(league_games.games[100:250])
+
+    assert league_games.league_points.points_between(100, 250) == calculate_points_for_games(games_range)
+    assert league_games.league_points.success_rate_between(100, 250) == round(
+        calculate_points_for_games(games_range) / calculate_possible_points_for_games(games_range), 3)
+    assert league_games.points == calculate_points_for_games(league_games)
+
+
+def test__rolling_points__should_sum_each_window_of_games(league_games):
+    rolling_points = league_games.league_points.rolling_points(games_count=5)
+
+    assert len(rolling_points) == len(league_games) - 4
+    assert rolling_points[10] == calculate_points_for_games(league_games.games[10:15])
+
+
+def test__seasons_points_progression__should_end_with_the_season_points(league_games):
+    season = league_games.available_seasons[-1]
+    season_progression = league_games.league_points.seasons_points_progression()[season]
+
+    assert season_progression[-1][1] == league_games.get_games_by_season(season).points
+    assert [points for _, points in season_progression] == sorted(points for _, points in season_progression)
+
+
+def test__points__should_be_supported_only_for_league_games(synthetic_maccabistats):
+    with pytest.raises(TypeError):
+        synthetic_maccabistats.points
@@ -0,0 +1,76 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from maccabistats.maccabilogging import RateLimitedFilter, initialize_logging, faster_logging, remove_live_logging, \
+    stop_logging_listener, worker_logging_initializer
+
+
+def _log_record(line_number: int) -> logging.LogRecord:
+    return logging.LogRecord('maccabistats', logging.INFO, 'hot_loop.py', line_number, 'Parsing game', None, None)
+
+
+def test__rate_limited_filter__should_suppress_repeated_call_site_and_report_it():
+    rate_limited_filter = RateLimitedFilter(max_records_per_interval=2, interval_seconds=60)
+
+    passed = [rate_limited_filter.filter(_log_record(line_number=10)) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert rate_limited_filter.filter(_log_record(line_number=11))
+
+    rate_limited_filter.interval_seconds = 0
+    next_record = _log_record(line_number=10)
+    assert rate_limited_filter.filter(next_record)
+    assert next_record.getMessage() == 'Parsing game (suppressed 3 similar messages)'
+
+
+def test__faster_logging__should_remove_debug_and_stdout_handlers_by_name(isolated_maccabistats_logger):
+    initialize_logging()
+    faster_logging()
+
+    assert sorted(handler.get_name() for handler in isolated_maccabistats_logger.handlers) == \
+           ['exception', 'info', 'warning']
+
+
+def test__queue_logging__should_write_records_from_listener_thread(isolated_maccabistats_logger, tmp_path):
+    initialize_logging(use_queue=True)
+    faster_logging()
+    isolated_maccabistats_logger.warning('Written by the listener')
+    stop_logging_listener()
+
+    with open(tmp_path / 'maccabistats-warning.log', encoding='utf-8') as warning_log:
+        assert 'Written by the listener' in warning_log.read()
+    assert 'Written by the listener' not in (tmp_path / 'maccabistats-all.log').read_text(encoding='utf-8')
+
+
+def test__hot_loop_messages__should_be_rate_limited_only_on_the_info_log(isolated_maccabistats_logger, tmp_path):
+    initialize_logging()
+    remove_live_logging()
+    for game_number in range(100):
+        logging.getLogger('maccabistats.hot_loop').info(f'Parsing game {game_number}')
+
+    info_log = (tmp_path / 'maccabistats-info.log').read_text(encoding='utf-8')
+    assert 0 < info_log.count('Parsing game') < 100
+    assert (tmp_path / 'maccabistats-all.log').read_text(encoding='utf-8').count('Parsing game') == 100
+
+    stop_logging_listener()
+    info_log = (tmp_path / 'maccabistats-info.log').read_text(encoding='utf-8')
+    assert 'Parsing game 99 (suppressed' in info_log
+
+
+def _log_worker_warning(message: str) -> None:
+    logging.getLogger('maccabistats.worker').warning(message)
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test__queue_logging__should_write_the_process_pool_workers_records(isolated_maccabistats_logger, tmp_path,
+                                                                       start_method):
+    initialize_logging(use_queue=True)
+    remove_live_logging()
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context(start_method),
+                             **worker_logging_initializer()) as executor:
+        executor.submit(_log_worker_warning, 'Written by the worker').result()
+    stop_logging_listener()
+
+    assert 'Written by the worker' in (tmp_path / 'maccabistats-warning.log').read_text(encoding='utf-8')
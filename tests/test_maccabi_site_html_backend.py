@@ -0,0 +1,107 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabi_tlv_site import game_pages_provider
+from maccabistats.parse.maccabi_tlv_site.game_squads_parser import MaccabiSiteGameSquadsParser
+from maccabistats.parse.maccabi_tlv_site.html_backend import HtmlTag, parse_html
+from maccabistats.parse.maccabi_tlv_site.main_parser import get_parsed_maccabi_games_from_maccabi_site
+from maccabistats.parse.maccabi_tlv_site.pages_fetcher import MaccabiSitePagesFetcher
+
+_SEASON_PAGE = """<html><body><main><div class="dropdown"><a>כל העונות(2000/01)</a></div>
+<article>
+    <a href="https://www.maccabi-tlv.co.il/match/2000-08-20/">לעמוד המשחק</a>
+    <div class="league-title">ליגת העל</div><div class="round">מחזור 1</div>
+    <div class="location"><span>20 אוג 2000</span><div>20:00 בלומפילד</div></div>
+    <div class="matchresult Home">
+        <div class="holder maccabi"><span class="ss maccabi h">2</span></div>
+        <div class="holder notmaccabi nn">הפועל חיפה</div><span class="ss h">1</span>
+    </div>
+</article></main></body></html>""".encode('utf-8')
+
+_SQUADS_PAGE = """<html><body><article>
+<div class="info"><div class="referee">שופט: אלון יפת</div><div class="viewers">צופים: 12000</div></div>
+<div class="teams">
+    <div class="p50 yellow"><ul><li>הרכב</li>
+        <li><b>1</b> שוער מכבי <div class="goals" id="goals"></div><div id="red-1"></div>
+            <div id="exchange-1"></div></li>
+        <li><b>9</b> חלוץ מכבי (ק)<div class="goals" id="goals">12' 80'</div>
+            <div id="red-2">30' <img src="/yellow.png"></div><div id="exchange-2">70'</div></li></ul></div>
+    <div class="p50 yellow"><ul>
+        <li><b>14</b> מחליף מכבי<div class="goals" id="goals"></div><div id="red-3"></div>
+            <div id="exchange-3">70'</div></li>
+    </ul></div>
+    <div class="p50 yellow"><ul><li> מאמן מכבי </li></ul></div>
+    <div class="p50"><ul><li>הרכב</li>
+        <li><b>5</b> בלם יריב<div class="goals" id="goals">60'</div><div id="red-4"></div>
+            <div id="exchange-4"></div></li>
+    </ul></div>
+    <div class="p50"><ul></ul></div>
+    <div class="p50"><ul><li>מאמן יריב</li></ul></div>
+</div></article></body></html>""".encode('utf-8')
+
+_EVENTS_PAGE = """<html><body><article><div class="play-by-play-homepage"><ul class="play-by-play">
+    <li class="goal"><div class="min">12</div><p>שער של חלוץ מכבי</p></li>
+    <li class="assist"><div class="min">12</div><p>בישול על ידי שוער מכבי</p></li>
+    <li class="red"><div class="min">88</div><p>כרטיס אדום ל בלם יריב</p></li>
+    <li class="whistle"><div class="min">90</div><p>שריקת הסיום</p></li>
+</ul></div></article></body></html>""".encode('utf-8')
+
+
+@pytest.fixture
+def beautifulsoup_backend(monkeypatch):
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, 'use_lxml_html_backend', False)
+
+
+def _parse_game():
+    season_page = parse_html(_SEASON_PAGE)
+    return MaccabiSiteGameSquadsParser.parse_game(season_page.find_all("article")[0], "2000/01",
+                                                  squads_page_content=_SQUADS_PAGE, events_page_content=_EVENTS_PAGE)
+
+
+def test__lxml_backend__should_parse_the_same_game_as_beautifulsoup(beautifulsoup_backend, monkeypatch):
+    beautifulsoup_game = _parse_game()
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, 'use_lxml_html_backend', True)
+    lxml_game = _parse_game()
+
+    assert isinstance(parse_html(_SQUADS_PAGE), HtmlTag)
+    assert lxml_game.fingerprint == beautifulsoup_game.fingerprint
+    assert lxml_game.referee == "אלון יפת"
+    assert [player.name for player in lxml_game.maccabi_team.players] == ["שוער מכבי", "חלוץ מכבי", "מחליף מכבי"]
+
+
+@pytest.mark.parametrize('css_selector', ['article div.teams div.p50.yellow', 'li', 'div', 'div.goals', 'img', 'b'])
+def test__lxml_backend__should_select_like_beautifulsoup(css_selector):
+    lxml_tags = parse_html(_SQUADS_PAGE).select(css_selector)
+    beautifulsoup_tags = BeautifulSoup(_SQUADS_PAGE, 'lxml').select(css_selector)
+
+    assert [tag.get_text() for tag in lxml_tags] == [tag.get_text() for tag in beautifulsoup_tags]
+    assert [len(tag) for tag in lxml_tags] == [len(tag) for tag in beautifulsoup_tags]
+    assert [tag.attrs for tag in lxml_tags] == [tag.attrs for tag in beautifulsoup_tags]
+    assert [tag.find(text=True, recursive=False) for tag in lxml_tags] == \
+           [tag.find(text=True, recursive=False) for tag in beautifulsoup_tags]
+
+
+def test__lxml_backend__should_fall_back_to_beautifulsoup_for_non_utf8_pages():
+    assert isinstance(parse_html("<html><body>שלום</body></html>".encode('cp1255')), BeautifulSoup)
+
+
+def test__async_crawling__should_parse_a_season_from_the_saved_pages(tmp_path, monkeypatch):
+    game_link = "https://www.maccabi-tlv.co.il/match/2000-08-20/"
+    saved_pages = {"saved-season-0": _SEASON_PAGE, game_link + "teams": _SQUADS_PAGE, game_link: _EVENTS_PAGE}
+    monkeypatch.setattr(MaccabiSitePagesFetcher, '_get', lambda self, url: saved_pages[url])
+    monkeypatch.setattr(game_pages_provider, 'folder_to_save_games_events_html_files_pattern',
+                        str(tmp_path / "game+{game_date}+events"))
+    monkeypatch.setattr(game_pages_provider, 'folder_to_save_games_squads_html_files_pattern',
+                        str(tmp_path / "game+{game_date}+squads"))
+    monkeypatch.delenv('START_SEASON_TO_CRAWL', raising=False)
+    for config_name, config_value in dict(season_page_pattern="saved-season-{season_number}", max_seasons_to_crawl=1,
+                                          use_async_crawling=True, use_disk_as_cache_when_crawling=False,
+                                          parsing_process_number=2).items():
+        monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, config_name, config_value)
+
+    crawled_games = get_parsed_maccabi_games_from_maccabi_site()
+
+    assert [game.fingerprint for game in crawled_games] == [_parse_game().fingerprint]
+    assert (tmp_path / "game+2000-08-20+squads").read_bytes() == _SQUADS_PAGE
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["game+2000-08-20+events", "game+2000-08-20+squads"]
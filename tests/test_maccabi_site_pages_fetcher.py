@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from maccabistats.parse.maccabi_tlv_site.pages_fetcher import MaccabiSitePagesFetcher
+
+
+class _SavedPagesHandler(BaseHTTPRequestHandler):
+    """
+    Serves /page-{n} as "page {n}", /overloaded fails once with 503 before it is served.
+    """
+    lock = threading.Lock()
+    requests_paths = []
+    active_requests = 0
+    max_active_requests = 0
+
+    def do_GET(self):
+        with self.lock:
+            is_first_overloaded_request = self.path == '/overloaded' and self.path not in self.requests_paths
+            self.requests_paths.append(self.path)
+            type(self).active_requests += 1
+            type(self).max_active_requests = max(self.max_active_requests, self.active_requests)
+
+        time.sleep(0.02)
+        with self.lock:
+            type(self).active_requests -= 1
+
+        self.send_response(503 if is_first_overloaded_request else 200)
+        self.end_headers()
+        self.wfile.write(self.path.strip('/').replace('-', ' ').encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def saved_pages_server_address():
+    _SavedPagesHandler.requests_paths = []
+    _SavedPagesHandler.max_active_requests = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SavedPagesHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test__fetch_all__should_return_the_pages_in_order_with_bounded_concurrency(saved_pages_server_address):
+    with MaccabiSitePagesFetcher(max_concurrent_requests=3, retry_delay_seconds=0) as fetcher:
+        pages = fetcher.fetch_all([f'{saved_pages_server_address}/page-{page_number}' for page_number in range(12)])
+
+    assert pages == [f'page {page_number}'.encode('utf-8') for page_number in range(12)]
+    assert 1 < _SavedPagesHandler.max_active_requests <= 3
+
+
+def test__fetch_all__should_retry_overloaded_pages(saved_pages_server_address):
+    with MaccabiSitePagesFetcher(retry_delay_seconds=0) as fetcher:
+        assert fetcher.fetch_all([f'{saved_pages_server_address}/overloaded']) == [b'overloaded']
+
+    assert _SavedPagesHandler.requests_paths == ['/overloaded', '/overloaded']
+
+
+def test__fetch__should_read_cached_pages_from_the_disk(saved_pages_server_address, tmp_path):
+    async def fetch_twice(fetcher):
+        first_page = await fetcher.fetch(f'{saved_pages_server_address}/page-1', str(tmp_path / 'page-1'))
+        return first_page, await fetcher.fetch(f'{saved_pages_server_address}/page-1', str(tmp_path / 'page-1'))
+
+    with MaccabiSitePagesFetcher() as fetcher:
+        assert asyncio.run(fetch_twice(fetcher)) == (b'page 1', b'page 1')
+
+    assert _SavedPagesHandler.requests_paths == ['/page-1']
+    assert (tmp_path / 'page-1').read_bytes() == b'page 1'
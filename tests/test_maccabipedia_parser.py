@@ -0,0 +1,102 @@
+from collections import defaultdict
+
+from maccabistats.maccabilogging import initialize_logging, remove_live_logging, stop_logging_listener
+from maccabistats.parse.maccabipedia import maccabipedia_cargo_chunks_crawler
+from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import MaccabiPediaCargoChunksCrawler
+from maccabistats.parse.maccabipedia.maccabipedia_parser import MaccabiPediaParser, MaccabiPediaStreamingParser
+
+
+def _game_metadata(game_index: int) -> dict:
+    year = 1990 + game_index // 20
+    return dict(_pageName=f"משחק {game_index}", Date=f"{year}-0{1 + game_index % 9}-1{game_index % 10}",
+                Hour="20:00", Season=f"{year}/{year + 1 - 1900}", Competition="ליגת העל", Leg=str(game_index % 30),
+                Opponent=f"יריבה {game_index % 7}", HomeAway="בית" if game_index % 2 else "חוץ",
+                Stadium="בלומפילד", ResultMaccabi=game_index % 3, ResultOpponent=1, CoachMaccabi="מאמן",
+                CoachOpponent="מאמן יריבה", Refs="שופט", Crowd="", Technical=-1)
+
+
+def _game_events(game_index: int) -> list:
+    page_name = f"משחק {game_index}"
+    return [dict(_pageName=page_name, PlayerName="שוער", PlayerNumber=1, Minute=0, EventType=1, SubType=111, Team=1),
+            dict(_pageName=page_name, PlayerName="חלוץ", PlayerNumber=9, Minute=0, EventType=1, SubType="", Team=1),
+            dict(_pageName=page_name, PlayerName="חלוץ", PlayerNumber=9, Minute=game_index % 90, EventType=3,
+                 SubType=32, Team=1),
+            dict(_pageName=page_name, PlayerName="יריב", PlayerNumber=5, Minute=0, EventType=1, SubType="", Team=0)]
+
+
+def _offline_parser(games_count: int) -> MaccabiPediaParser:
+    # Skip __init__, it crawls maccabipedia
+    parser = MaccabiPediaParser.__new__(MaccabiPediaParser)
+    parser._game_metadata_by_game = defaultdict(list)
+    parser._games_events_by_game = defaultdict(list)
+    for game_index in range(games_count):
+        parser._game_metadata_by_game[f"משחק {game_index}"].append(_game_metadata(game_index))
+        parser._games_events_by_game[f"משחק {game_index}"].extend(_game_events(game_index))
+
+    return parser
+
+
+def test__parse_with_processes__should_build_the_same_games_in_the_same_order():
+    parser = _offline_parser(games_count=50)
+
+    single_process_games = parser.parse(processes_count=1)
+    multi_processes_games = parser.parse(processes_count=2, chunk_size=7)
+
+    assert len(multi_processes_games) == 50
+    assert [game.fingerprint for game in multi_processes_games] == \
+           [game.fingerprint for game in single_process_games]
+    assert multi_processes_games[3].maccabi_team.players[1].name == "חלוץ"
+
+
+
+def test__parse_with_processes__should_log_the_workers_warnings(isolated_maccabistats_logger, tmp_path):
+    parser = _offline_parser(games_count=10)
+    parser._games_events_by_game["משחק 3"][1]['PlayerNumber'] = 10
+    initialize_logging(use_queue=True)
+    remove_live_logging()
+
+    parser.parse(processes_count=2, chunk_size=3)
+    stop_logging_listener()
+
+    warning_log = (tmp_path / 'maccabistats-warning.log').read_text(encoding='utf-8')
+    assert "Found more than 1 player_number for player: חלוץ" in warning_log
+    assert "game: משחק 3" in warning_log
+
+def test__streaming_parser__should_build_the_same_games(monkeypatch):
+    games_events = sorted((game_event for game_index in range(20) for game_event in _game_events(game_index)),
+                          key=lambda game_event: game_event['_pageName'])
+    monkeypatch.setattr(MaccabiPediaCargoChunksCrawler, 'create_games_crawler',
+                        classmethod(lambda cls: iter([_game_metadata(game_index) for game_index in range(21)])))
+    monkeypatch.setattr(MaccabiPediaCargoChunksCrawler, 'create_games_events_crawler',
+                        classmethod(lambda cls, order_by: iter(games_events)))
+
+    streamed_games = MaccabiPediaStreamingParser().parse()
+
+    offline_parser = _offline_parser(games_count=21)
+    offline_parser._games_events_by_game.pop("משחק 20")
+    assert sorted(game.fingerprint for game in streamed_games) == \
+           sorted(game.fingerprint for game in offline_parser.parse(processes_count=1))
+    # The game without events is built last
+    assert streamed_games[-1].maccabi_team.players == []
+
+
+class _FakeResponse(object):
+    status_code = 200
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def json(self):
+        return self.rows
+
+
+def test__chunks_crawler__should_return_the_rows_at_the_server_order(monkeypatch):
+    rows = [dict(_pageName=f"משחק {row_index // 3}", Minute=row_index) for row_index in range(7)]
+    monkeypatch.setattr(maccabipedia_cargo_chunks_crawler, '_MAX_LIMIT_PER_REQUEST', 3)
+    monkeypatch.setattr(maccabipedia_cargo_chunks_crawler.requests, 'get',
+                        lambda address: _FakeResponse(rows[int(address.split('&offset=')[1].split('&')[0]):][:3]))
+
+    crawler = MaccabiPediaCargoChunksCrawler.create_games_events_crawler(order_by="_pageName")
+
+    assert "&order_by=_pageName&" in crawler.full_crawl_address
+    assert list(crawler) == rows
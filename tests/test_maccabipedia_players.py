@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.maccabipedia.players import MaccabiPediaPlayers, MaccabiPediaPlayerData
+
+_PLAYERS_DATA = {'Home player': MaccabiPediaPlayerData('Home player', datetime(1990, 1, 2), True),
+                 'Unknown player': MaccabiPediaPlayerData('Unknown player',
+                                                          MaccabiPediaPlayers.missing_birth_date_value, False)}
+
+
+def test__fresh_players_data_cache__should_be_loaded_without_crawling(tmp_path, monkeypatch):
+    monkeypatch.setattr(MaccabiPediaPlayers, '_instance', None)
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabipedia, 'players_data_cache_path',
+                        str(tmp_path / 'players.json'))
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: _PLAYERS_DATA))
+    MaccabiPediaPlayers.refresh_players_data()
+
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: {}))
+    assert MaccabiPediaPlayers().home_players == {'Home player'}
+
+
+def test__expired_players_data_cache__should_be_crawled_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(MaccabiPediaPlayers, '_instance', None)
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabipedia, 'players_data_cache_path',
+                        str(tmp_path / 'players.json'))
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabipedia, 'players_data_cache_max_age', timedelta(0))
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: _PLAYERS_DATA))
+    MaccabiPediaPlayers.refresh_players_data()
+
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: {}))
+    assert MaccabiPediaPlayers().home_players == set()
+
+
+def test__corrupt_players_data_cache__should_be_crawled_again(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'players.json'
+    cache_path.write_text('{"crawled_at": "2020-01-01T00:00:00", "players": [{"na', encoding='utf-8')
+    monkeypatch.setattr(MaccabiPediaPlayers, '_instance', None)
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabipedia, 'players_data_cache_path', str(cache_path))
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: _PLAYERS_DATA))
+    assert MaccabiPediaPlayers().home_players == {'Home player'}
+
+    # The crawled data replaced the corrupt cache
+    monkeypatch.setattr(MaccabiPediaPlayers, '_crawl_players_data', staticmethod(lambda: {}))
+    assert MaccabiPediaPlayers().home_players == {'Home player'}
+    assert not (tmp_path / 'players.json.tmp').exists()
@@ -0,0 +1,41 @@
+from collections import Counter
+
+import pytest
+
+from maccabistats.maccabipedia.players import MaccabiPediaPlayers
+
+_TEAM_EVENTS_COUNTERS = dict(
+    goals=lambda team: team.scored_players_with_amount,
+    assists=lambda team: team.assist_players_with_amount,
+    goals_involved=lambda team: team.goal_involved_players_with_amount,
+)
+
+
+def _home_players_division(games, events_name):
+    players_events = sum((_TEAM_EVENTS_COUNTERS[events_name](game.maccabi_team) for game in games), Counter())
+    home_players_names = MaccabiPediaPlayers.get_players_data().home_players
+    home_players_events = sum(events for player_name, events in players_events.items()
+                              if player_name in home_players_names)
+
+    return home_players_events, sum(players_events.values()) - home_players_events
+
+
+@pytest.mark.parametrize('events_name', ['goals', 'assists', 'goals_involved'])
+def test__home_players_division_by_season__should_divide_each_season_players_events(synthetic_maccabistats,
+                                                                                   events_name):
+    seasons_divisions = synthetic_maccabistats.players_categories.home_players_division_by_season(events_name)
+
+    assert list(seasons_divisions) == synthetic_maccabistats.available_seasons
+    for season in synthetic_maccabistats.available_seasons[::10]:
+        season_games = [game for game in synthetic_maccabistats if game.season == season]
+        assert seasons_divisions[season] == _home_players_division(season_games, events_name)
+
+
+def test__home_players_goals__should_be_the_home_players_part_of_all_the_goals(synthetic_maccabistats):
+    home_players_goals, non_home_players_goals = _home_players_division(synthetic_maccabistats, 'goals')
+    players_categories = synthetic_maccabistats.players_categories
+
+    assert home_players_goals > 0
+    assert players_categories.home_players_goals_count() == home_players_goals
+    assert players_categories.home_players_goals_ratio() == \
+           round(home_players_goals / (home_players_goals + non_home_players_goals), 3)
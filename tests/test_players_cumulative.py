@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.mark.parametrize('date', ['1965-01-01', '1990-05-03', '2030-01-01'])
+def test__player_stats_as_of_date__should_be_the_same_as_the_played_before_games_stats(synthetic_maccabistats, date):
+    player_name = synthetic_maccabistats.players.best_scorers[0][0]
+    games_before_date = synthetic_maccabistats.played_before(date)
+
+    player_stats = synthetic_maccabistats.players_cumulative.player_stats_as_of_date(player_name, date)
+
+    assert player_stats.goals == dict(games_before_date.players.best_scorers).get(player_name, 0)
+    assert player_stats.appearances == dict(games_before_date.players.most_played).get(player_name, 0)
+    assert player_stats.wins == dict(games_before_date.players.most_winners).get(player_name, 0)
+
+
+def test__players_milestones__should_be_the_games_the_players_reached_the_milestone_at(synthetic_maccabistats):
+    players_cumulative = synthetic_maccabistats.players_cumulative
+    players_milestones = players_cumulative.players_milestones(milestone=20, stat_name='goals')
+
+    assert players_milestones
+    assert {player_name for player_name, _ in players_milestones} == \
+           {player_name for player_name, goals in synthetic_maccabistats.players.best_scorers if goals >= 20}
+    for player_name, milestone_game in players_milestones:
+        assert players_cumulative.player_milestone_game(player_name, milestone=20) is milestone_game
+        assert players_cumulative.player_stats_before_game(player_name, milestone_game).goals < 20
+        assert players_cumulative.player_stats_before_game(player_name, milestone_game,
+                                                           including_this_game=True).goals >= 20
@@ -0,0 +1,49 @@
+import pytest
+
+from maccabistats.stats.players_occurrences import PlayerOccurrence
+
+
+@pytest.mark.parametrize('occurrence_number', [1, 2, -1])
+def test__player_occurrence_game__should_be_the_kth_game_the_player_scored_at(synthetic_maccabistats,
+                                                                            occurrence_number):
+    player_name = synthetic_maccabistats.players.best_scorers[0][0]
+    player_scored_games = [game for game in synthetic_maccabistats
+                           if game.maccabi_team.scored_players_with_amount.get(player_name, 0) > 0]
+
+    occurrence_game = synthetic_maccabistats.players_occurrences.player_occurrence_game(
+        player_name, PlayerOccurrence.GOAL, occurrence_number)
+
+    assert occurrence_game is player_scored_games[occurrence_number - 1 if occurrence_number > 0 else -1]
+
+
+def test__player_occurrence_game__should_be_none_for_missing_occurrences(synthetic_maccabistats):
+    players_occurrences = synthetic_maccabistats.players_occurrences
+    player_name = players_occurrences.players_names[0]
+    appearances = len(players_occurrences.player_played_games(player_name))
+
+    assert players_occurrences.player_occurrence_game(player_name, PlayerOccurrence.APPEARANCE, appearances + 1) is None
+    assert players_occurrences.player_occurrence_game('Unknown player', PlayerOccurrence.APPEARANCE) is None
+
+
+def test__youngest_players_by_first_time_to_score__should_be_ordered_by_age(synthetic_maccabistats):
+    youngest_scorers = synthetic_maccabistats.players_special_games.youngest_players_by_first_time_to_score(
+        players_count=10)
+    all_scorers = synthetic_maccabistats.players_special_games.youngest_players_by_first_time_to_score(
+        players_count=100000)
+
+    assert len(youngest_scorers) == 10
+    assert [player.time_in_days for player in youngest_scorers] == \
+           sorted(player.time_in_days for player in all_scorers)[:10]
+    for player in youngest_scorers:
+        assert player.first_game is synthetic_maccabistats.players_occurrences.player_occurrence_game(
+            player.player_name, PlayerOccurrence.GOAL)
+
+
+def test__oldest_players_by_occurrence__should_be_the_reversed_youngest_players(synthetic_maccabistats):
+    players_special_games = synthetic_maccabistats.players_special_games
+    youngest_captains = players_special_games.youngest_players_by_occurrence(PlayerOccurrence.CAPTAIN, -1,
+                                                                             players_count=100000)
+    oldest_captains = players_special_games.oldest_players_by_last_time_to_be_captain(players_count=100000)
+
+    assert [player.player_name for player in oldest_captains] == \
+           [player.player_name for player in reversed(youngest_captains)]
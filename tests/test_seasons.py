@@ -0,0 +1,44 @@
+import pytest
+
+from maccabistats.stats.seasons import MaccabiGamesSeasonsStats
+
+
+@pytest.mark.parametrize('metric_name, season_stats_metric', [
+    ('wins_percentage', lambda s: s.results.wins_percentage),
+    ('average_goals_diff', lambda s: s.averages.maccabi_diff),
+    ('goals_ratio', lambda s: s.results.goals_ratio),
+    ('home_players_goals_involved_ratio', lambda s: s.players_categories.home_players_goals_involved_ratio()),
+    ('scored_players_count', lambda s: len(s.players.best_scorers)),
+    ('goal_involved_players_count', lambda s: len(s.players.most_goals_involved)),
+    ('penalties_scorers_count', lambda s: len(s.players.best_scorers_by_penalty)),
+    ('comebacks_to_win_count', lambda s: len(s.comebacks.won_from_any_goal_diff())),
+    ('potential_comebacks_not_won_count',
+     lambda s: len(s.comebacks.games_with_potential_comebacks_that_maccabi_didnt_win())),
+])
+def test__seasons_metrics_table__should_be_the_same_as_the_season_stats(synthetic_maccabistats, metric_name,
+                                                                         season_stats_metric):
+    metric_column = synthetic_maccabistats.seasons.metric_column(metric_name)
+
+    assert metric_column == {season: season_stats_metric(synthetic_maccabistats.get_games_by_season(season))
+                             for season in synthetic_maccabistats.available_seasons}
+
+
+def test__seasons__should_be_sorted_by_the_metric_and_indexed_lazily(synthetic_maccabistats):
+    seasons = synthetic_maccabistats.seasons
+    seasons.sort_by_wins_count()
+
+    wins_counts = [seasons.metric_column('wins_count')[season] for season in seasons.sorted_seasons]
+    assert wins_counts == sorted(wins_counts, reverse=True)
+    assert seasons[0].results.wins_count == wins_counts[0]
+    assert seasons[0] is seasons[seasons.sorted_seasons[0]]
+    assert f"{seasons.sorted_seasons[0]: <7} ({wins_counts[0]})" in repr(seasons)
+
+
+def test__unsorted_seasons_repr__should_show_the_seasons_stats(synthetic_maccabistats):
+    seasons = MaccabiGamesSeasonsStats(synthetic_maccabistats)  # Not sorted by the other tests
+    first_season = synthetic_maccabistats.available_seasons[0]
+
+    first_season_games_count = len(synthetic_maccabistats.get_games_by_season(first_season))
+    assert repr(seasons).startswith("order by season number")
+    assert f"'{first_season: <7} (Synthetic history (scale=0.2, seed=0) + Season {first_season} | " \
+           f"{first_season_games_count} games | '" in repr(seasons)
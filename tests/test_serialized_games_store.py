@@ -0,0 +1,42 @@
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games_store import SerializedGamesStore
+
+
+def test__store_with_deltas__should_load_the_last_saved_games(tmp_path, synthetic_maccabistats):
+    games_store = SerializedGamesStore(str(tmp_path), max_deltas_before_compaction=3)
+    games_store.save(MaccabiGamesStats(synthetic_maccabistats.games[:-10]))
+    games_store.save(synthetic_maccabistats)
+    games_store.save(MaccabiGamesStats(synthetic_maccabistats.games[5:]))
+
+    assert [game.game_id for game in games_store.load()] == [game.game_id for game in
+                                                              synthetic_maccabistats.games[5:]]
+
+
+def test__save_without_changes__should_not_add_delta(tmp_path, synthetic_maccabistats):
+    games_store = SerializedGamesStore(str(tmp_path))
+    games_store.save(synthetic_maccabistats)
+    games_store.save(synthetic_maccabistats)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['base-000001.games', 'manifest.json']
+
+
+def test__save_delta__should_not_leave_temporary_files(tmp_path, synthetic_maccabistats):
+    games_store = SerializedGamesStore(str(tmp_path))
+    games_store.save(MaccabiGamesStats(synthetic_maccabistats.games[:-1]))
+    games_store.save(synthetic_maccabistats)
+
+    assert games_store.deltas_count == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['base-000001.games', 'delta-000002.games',
+                                                                 'manifest.json']
+
+
+def test__save_games_of_another_version__should_write_a_new_base(tmp_path, synthetic_maccabistats):
+    games_store = SerializedGamesStore(str(tmp_path))
+    old_maccabistats = MaccabiGamesStats(synthetic_maccabistats.games[:-1])
+    old_maccabistats.version = '0.1'
+    games_store.save(old_maccabistats)
+    games_store.save(synthetic_maccabistats)
+
+    assert games_store.maccabistats_version == synthetic_maccabistats.version
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['base-000002.games', 'manifest.json']
+    assert len(games_store.load()) == len(synthetic_maccabistats)
@@ -0,0 +1,84 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from maccabistats.parse import maccabistats_source, source_pipeline
+from maccabistats.parse.maccabistats_source import MaccabiStatsSource
+from maccabistats.parse.source_pipeline import SourcePipeline
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games_store import SerializedGamesStore
+from maccabistats.synthetic_history import generate_synthetic_games
+
+
+class _SyntheticSource(MaccabiStatsSource):
+    def __init__(self, store_folder_path: str):
+        super().__init__(name='Synthetic')
+        self.store_folder_path = store_folder_path
+        self.parsed_count = 0
+        self.specific_fixes_count = 0
+
+    @property
+    def games_store(self) -> SerializedGamesStore:
+        return SerializedGamesStore(self.store_folder_path)
+
+    def _rerun_source(self):
+        self.parsed_count += 1
+        return generate_synthetic_games(scale=0.02)
+
+    def run_specific_fixes(self):
+        self.specific_fixes_count += 1
+
+
+@pytest.fixture
+def synthetic_source(tmp_path, monkeypatch) -> _SyntheticSource:
+    monkeypatch.setattr(source_pipeline, 'source_pipeline_folder_path_pattern', str(tmp_path / '{source_name}'))
+    return _SyntheticSource(str(tmp_path / 'store'))
+
+
+def _stages_cached(pipeline: SourcePipeline) -> dict:
+    run_report_path = max(pipeline.folder_path.glob('run-report-*.json'))
+    return {stage['name']: stage['cached'] for stage in json.loads(run_report_path.read_text(encoding='utf-8'))['stages']}
+
+
+def test__source_pipeline_rerun__should_skip_the_fixes_when_the_parsed_games_were_not_changed(synthetic_source):
+    first_run_games = SourcePipeline(synthetic_source, measure_memory=False).run()
+    assert synthetic_source.games_store.exists
+
+    second_run_source = _SyntheticSource(synthetic_source.store_folder_path)
+    second_pipeline = SourcePipeline(second_run_source, measure_memory=False)
+    second_run_games = second_pipeline.run()
+
+    assert second_run_source.parsed_count == 1
+    assert second_run_source.specific_fixes_count == 0
+    assert _stages_cached(second_pipeline) == dict(parse=False, general_fixes=True, specific_fixes=True, serialize=False)
+    assert second_run_games.fingerprint == first_run_games.fingerprint
+
+
+def test__source_pipeline_resume__should_not_parse_the_source_again(synthetic_source):
+    SourcePipeline(synthetic_source).run()
+
+    resumed_source = _SyntheticSource(synthetic_source.store_folder_path)
+    resumed_pipeline = SourcePipeline(resumed_source, resume=True)
+    resumed_pipeline.run()
+
+    assert resumed_source.parsed_count == 0
+    assert _stages_cached(resumed_pipeline)['parse']
+
+
+def test__load_serialized_games__should_prefer_a_games_file_newer_than_the_store(synthetic_source, tmp_path,
+                                                                                 monkeypatch):
+    monkeypatch.setattr(maccabistats_source, 'serialized_sources_path_pattern',
+                        str(tmp_path / '{source_name}-{version}-{date}.games'))
+    synthetic_source.parse_maccabi_games()
+    synthetic_source.serialize_games()
+
+    games_file_path = tmp_path / 'Synthetic-0.1-2020.games'
+    with open(games_file_path, 'wb') as games_file:
+        pickle.dump(MaccabiGamesStats(synthetic_source.maccabi_games_stats.games[:-1]), games_file)
+    store_saved_time = synthetic_source.games_store.last_saved_time
+    os.utime(synthetic_source.games_store._manifest_path, (store_saved_time - 10, store_saved_time - 10))
+
+    synthetic_source.load_serialized_games()
+    assert len(synthetic_source.maccabi_games_stats) == len(synthetic_source.games_store.load()) - 1
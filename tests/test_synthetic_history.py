@@ -0,0 +1,26 @@
+from maccabistats.error_finder.error_finder import ErrorsFinder
+from maccabistats.synthetic_history import generate_synthetic_maccabi_games_stats
+
+
+def test__synthetic_history__should_be_deterministic(synthetic_maccabistats):
+    assert generate_synthetic_maccabi_games_stats(scale=0.2).fingerprint == synthetic_maccabistats.fingerprint
+    assert generate_synthetic_maccabi_games_stats(scale=0.2, seed=1).fingerprint != synthetic_maccabistats.fingerprint
+
+
+def test__synthetic_history_scale__should_multiply_the_games_count_of_each_season():
+    small_history = generate_synthetic_maccabi_games_stats(scale=0.1)
+    bigger_history = generate_synthetic_maccabi_games_stats(scale=0.2)
+
+    assert small_history.available_seasons == bigger_history.available_seasons
+    # Each season games count is rounded
+    assert abs(len(bigger_history) - 2 * len(small_history)) <= len(small_history.available_seasons)
+
+
+def test__synthetic_history__should_have_consistent_games(synthetic_maccabistats):
+    errors_finder = ErrorsFinder(synthetic_maccabistats)
+
+    assert not errors_finder.get_games_with_missing_goals_events()
+    assert not errors_finder.get_games_with_wrong_goals_team_belonging()
+    assert not errors_finder.get_games_without_11_maccabi_players_on_lineup()
+    assert not errors_finder.get_lineup_players_with_substitution_in()
+    assert synthetic_maccabistats.players.best_scorers
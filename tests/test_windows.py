@@ -0,0 +1,39 @@
+import datetime
+
+
+def test__most_wins_in_days__should_be_the_window_with_most_wins(synthetic_maccabistats):
+    window_games = synthetic_maccabistats.windows.most_wins_in_days(days=365)
+    games = synthetic_maccabistats.games
+
+    # Every window (by its last game), with all the games that were played less than 365 days before its last game
+    all_windows = [[game for game in games[:end + 1] if games[end].date - game.date < datetime.timedelta(days=365)]
+                   for end in range(len(games))]
+    windows_wins = [sum(game.is_maccabi_win for game in window) for window in all_windows]
+    first_best_window = all_windows[windows_wins.index(max(windows_wins))]
+
+    assert window_games.results.wins_count == max(windows_wins)
+    assert window_games.games == first_best_window
+
+
+def test__players_best_years_window__should_count_the_player_stat_in_the_window(synthetic_maccabistats):
+    best_windows = synthetic_maccabistats.windows.players_best_years_window(years=2, stat_name='goals',
+                                                                            top_players_count=3)
+
+    assert len(best_windows) == 3
+    for player_window in best_windows:
+        window_games = synthetic_maccabistats.played_after(player_window.window_start).played_before(
+            player_window.window_end)
+        assert dict(window_games.players.best_scorers)[player_window.player_name] == player_window.value
+
+
+def test__players_best_seasons_window__should_sum_consecutive_seasons(synthetic_maccabistats):
+    best_window = synthetic_maccabistats.windows.players_best_seasons_window(seasons_count=2,
+                                                                             stat_name='appearances')[0]
+    window_seasons = synthetic_maccabistats.available_seasons[
+        synthetic_maccabistats.available_seasons.index(best_window.window_start):
+        synthetic_maccabistats.available_seasons.index(best_window.window_end) + 1]
+    window_games = synthetic_maccabistats.create_maccabi_stats_from_games(
+        [game for game in synthetic_maccabistats if game.season in window_seasons])
+
+    assert len(window_seasons) == 2
+    assert dict(window_games.players.most_played)[best_window.player_name] == best_window.value